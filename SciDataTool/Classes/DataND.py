@@ -60,6 +60,11 @@ try:
 except ImportError as error:
     _rebuild_symmetries = error
 
+try:
+    from ..Methods.DataND._set_axes import _set_axes
+except ImportError as error:
+    _set_axes = error
+
 try:
     from ..Methods.DataND._set_values import _set_values
 except ImportError as error:
@@ -80,6 +85,16 @@ try:
 except ImportError as error:
     compare_phase_along = error
 
+try:
+    from ..Methods.DataND.disable_cache import disable_cache
+except ImportError as error:
+    disable_cache = error
+
+try:
+    from ..Methods.DataND.enable_cache import enable_cache
+except ImportError as error:
+    enable_cache = error
+
 try:
     from ..Methods.DataND.export_along import export_along
 except ImportError as error:
@@ -95,6 +110,11 @@ try:
 except ImportError as error:
     get_along = error
 
+try:
+    from ..Methods.DataND.get_along_many import get_along_many
+except ImportError as error:
+    get_along_many = error
+
 try:
     from ..Methods.DataND.get_axes import get_axes
 except ImportError as error:
@@ -120,11 +140,21 @@ try:
 except ImportError as error:
     get_phase_along = error
 
+try:
+    from ..Methods.DataND.get_polar_along import get_polar_along
+except ImportError as error:
+    get_polar_along = error
+
 try:
     from ..Methods.DataND.has_period import has_period
 except ImportError as error:
     has_period = error
 
+try:
+    from ..Methods.DataND.iter_along import iter_along
+except ImportError as error:
+    iter_along = error
+
 try:
     from ..Methods.DataND.orthogonal_mp import orthogonal_mp
 except ImportError as error:
@@ -150,6 +180,11 @@ try:
 except ImportError as error:
     plot_3D_Data = error
 
+try:
+    from ..Methods.DataND.set_precision import set_precision
+except ImportError as error:
+    set_precision = error
+
 
 from numpy import array, array_equal
 from numpy import isnan
@@ -257,6 +292,15 @@ class DataND(Data):
         )
     else:
         _rebuild_symmetries = _rebuild_symmetries
+    # cf Methods.DataND._set_axes
+    if isinstance(_set_axes, ImportError):
+        _set_axes = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use DataND method _set_axes: " + str(_set_axes))
+            )
+        )
+    else:
+        _set_axes = _set_axes
     # cf Methods.DataND._set_values
     if isinstance(_set_values, ImportError):
         _set_values = property(
@@ -301,6 +345,28 @@ class DataND(Data):
         )
     else:
         compare_phase_along = compare_phase_along
+    # cf Methods.DataND.disable_cache
+    if isinstance(disable_cache, ImportError):
+        disable_cache = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method disable_cache: " + str(disable_cache)
+                )
+            )
+        )
+    else:
+        disable_cache = disable_cache
+    # cf Methods.DataND.enable_cache
+    if isinstance(enable_cache, ImportError):
+        enable_cache = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method enable_cache: " + str(enable_cache)
+                )
+            )
+        )
+    else:
+        enable_cache = enable_cache
     # cf Methods.DataND.export_along
     if isinstance(export_along, ImportError):
         export_along = property(
@@ -333,6 +399,17 @@ class DataND(Data):
         )
     else:
         get_along = get_along
+    # cf Methods.DataND.get_along_many
+    if isinstance(get_along_many, ImportError):
+        get_along_many = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method get_along_many: " + str(get_along_many)
+                )
+            )
+        )
+    else:
+        get_along_many = get_along_many
     # cf Methods.DataND.get_axes
     if isinstance(get_axes, ImportError):
         get_axes = property(
@@ -387,6 +464,17 @@ class DataND(Data):
         )
     else:
         get_phase_along = get_phase_along
+    # cf Methods.DataND.get_polar_along
+    if isinstance(get_polar_along, ImportError):
+        get_polar_along = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method get_polar_along: " + str(get_polar_along)
+                )
+            )
+        )
+    else:
+        get_polar_along = get_polar_along
     # cf Methods.DataND.has_period
     if isinstance(has_period, ImportError):
         has_period = property(
@@ -396,6 +484,15 @@ class DataND(Data):
         )
     else:
         has_period = has_period
+    # cf Methods.DataND.iter_along
+    if isinstance(iter_along, ImportError):
+        iter_along = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use DataND method iter_along: " + str(iter_along))
+            )
+        )
+    else:
+        iter_along = iter_along
     # cf Methods.DataND.orthogonal_mp
     if isinstance(orthogonal_mp, ImportError):
         orthogonal_mp = property(
@@ -450,6 +547,17 @@ class DataND(Data):
         )
     else:
         plot_3D_Data = plot_3D_Data
+    # cf Methods.DataND.set_precision
+    if isinstance(set_precision, ImportError):
+        set_precision = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method set_precision: " + str(set_precision)
+                )
+            )
+        )
+    else:
+        set_precision = set_precision
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -672,31 +780,6 @@ class DataND(Data):
                     obj.parent = self
         return self._axes
 
-    def _set_axes(self, value):
-        """setter of axes"""
-        if type(value) is list:
-            for ii, obj in enumerate(value):
-                if isinstance(obj, str):  # Load from file
-                    try:
-                        obj = load_init_dict(obj)[1]
-                    except Exception as e:
-                        self.get_logger().error(
-                            "Error while loading " + obj + ", setting None instead"
-                        )
-                        obj = None
-                        value[ii] = None
-                if type(obj) is dict:
-                    class_obj = import_class(
-                        "SciDataTool.Classes", obj.get("__class__"), "axes"
-                    )
-                    value[ii] = class_obj(init_dict=obj)
-                if value[ii] is not None:
-                    value[ii].parent = self
-        if value == -1:
-            value = list()
-        check_var("axes", value, "[Data]")
-        self._axes = value
-
     axes = property(
         fget=_get_axes,
         fset=_set_axes,
@@ -25,6 +25,16 @@ try:
 except ImportError as error:
     to_datadual = error
 
+try:
+    from ..Methods.DataTime.stft import stft
+except ImportError as error:
+    stft = error
+
+try:
+    from ..Methods.DataTime.welch import welch
+except ImportError as error:
+    welch = error
+
 
 from numpy import array, array_equal
 from numpy import isnan
@@ -60,6 +70,24 @@ class DataTime(DataND):
         )
     else:
         to_datadual = to_datadual
+    # cf Methods.DataTime.stft
+    if isinstance(stft, ImportError):
+        stft = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use DataTime method stft: " + str(stft))
+            )
+        )
+    else:
+        stft = stft
+    # cf Methods.DataTime.welch
+    if isinstance(welch, ImportError):
+        welch = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use DataTime method welch: " + str(welch))
+            )
+        )
+    else:
+        welch = welch
     # save and copy methods are available in all object
     save = save
     copy = copy
@@ -50,6 +50,11 @@ try:
 except ImportError as error:
     get_mag_xyz_along = error
 
+try:
+    from ..Methods.VectorField.get_polar_along import get_polar_along
+except ImportError as error:
+    get_polar_along = error
+
 try:
     from ..Methods.VectorField.get_rphiz_along import get_rphiz_along
 except ImportError as error:
@@ -191,6 +196,18 @@ class VectorField(FrozenClass):
         )
     else:
         get_mag_xyz_along = get_mag_xyz_along
+    # cf Methods.VectorField.get_polar_along
+    if isinstance(get_polar_along, ImportError):
+        get_polar_along = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use VectorField method get_polar_along: "
+                    + str(get_polar_along)
+                )
+            )
+        )
+    else:
+        get_polar_along = get_polar_along
     # cf Methods.VectorField.get_rphiz_along
     if isinstance(get_rphiz_along, ImportError):
         get_rphiz_along = property(
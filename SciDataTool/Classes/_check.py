@@ -360,7 +360,10 @@ def check_dimensions(values, axes):
         if values_shape != tuple(axes_shape):
             for i, s in enumerate(axes_shape):
                 if s == 1:
-                    values = expand_dims(values, axis=i)
+                    if hasattr(values, "expand_dims"):  # LazyValues
+                        values = values.expand_dims(i)
+                    else:
+                        values = expand_dims(values, axis=i)
             if values.shape != tuple(axes_shape):
                 raise CheckDimError(
                     "Dimensions of field ("
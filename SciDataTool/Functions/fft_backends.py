@@ -0,0 +1,141 @@
+from contextlib import contextmanager
+from os import cpu_count
+
+import numpy.fft as numpy_fft
+import scipy.fft as scipy_fft
+from numpy import __version__ as numpy_version
+from numpy.lib import NumpyVersion
+
+try:
+    from pyfftw.interfaces import numpy_fft as pyfftw_fft
+except ImportError:
+    pyfftw_fft = None
+
+
+class FFTBackend(object):
+    """FFT library used by comp_fftn/comp_ifftn (same normalization for all backends:
+    forward transforms are not scaled, inverse transforms are scaled by 1/n)"""
+
+    def __init__(self, name, workers=None):
+        self.name = name
+        self.workers = workers
+
+    def get_kwargs(self):
+        """Returns the keyword arguments setting the number of threads"""
+        if self.workers is None:
+            return dict()
+        elif self.name == "scipy":
+            return {"workers": self.workers}
+        elif self.name == "pyfftw":
+            return {"threads": cpu_count() if self.workers == -1 else self.workers}
+        return dict()
+
+    def get_module(self):
+        """Returns the module of the FFT functions"""
+        return FFT_MODULES[self.name]
+
+    def rfftn(self, values, axes):
+        return self.get_module().rfftn(values, axes=axes, **self.get_kwargs())
+
+    def irfftn(self, values, axes):
+        return self.get_module().irfftn(values, axes=axes, **self.get_kwargs())
+
+    def fftn(self, values, axes):
+        return self.get_module().fftn(values, axes=axes, **self.get_kwargs())
+
+    def ifftn(self, values, axes):
+        return self.get_module().ifftn(values, axes=axes, **self.get_kwargs())
+
+
+# Available FFT libraries
+FFT_MODULES = {"numpy": numpy_fft, "scipy": scipy_fft}
+if pyfftw_fft is not None:
+    FFT_MODULES["pyfftw"] = pyfftw_fft
+
+# Backend used by default
+fft_backend = FFTBackend("numpy")
+
+# Backends keeping single precision (numpy.fft computes in double precision before
+# numpy 2.0)
+SINGLE_BACKENDS = ["scipy", "pyfftw"]
+if NumpyVersion(numpy_version) >= "2.0.0":
+    SINGLE_BACKENDS.append("numpy")
+
+
+def get_fft_backend(backend=None, workers=None):
+    """Returns the FFT backend to use
+    Parameters
+    ----------
+    backend: str or FFTBackend
+        name of the backend ("numpy", "scipy" or "pyfftw"), global backend if None
+    workers: int
+        number of threads (scipy and pyfftw only, -1 for all cores)
+    Returns
+    -------
+    an FFTBackend object
+    """
+    if backend is None:
+        return fft_backend
+    elif isinstance(backend, FFTBackend):
+        return backend
+    elif backend not in FFT_MODULES:
+        if backend == "pyfftw":
+            raise ImportError("pyfftw must be installed to use the pyfftw backend")
+        raise ValueError(
+            "Unknown FFT backend "
+            + str(backend)
+            + ", available backends are "
+            + ", ".join(FFT_MODULES)
+        )
+    return FFTBackend(backend, workers=workers)
+
+
+def get_precision_backend(precision, backend=None):
+    """Returns the FFT backend to use in a precision: the FFTs of a backend which
+    does not keep single precision are computed with scipy.fft (same workers)
+    Parameters
+    ----------
+    precision: str
+        precision of the FFTs ("single" or "double")
+    backend: str or FFTBackend
+        FFT backend, global backend if None
+    Returns
+    -------
+    an FFTBackend object
+    """
+    fft = get_fft_backend(backend)
+    if precision == "single" and fft.name not in SINGLE_BACKENDS:
+        return FFTBackend("scipy", workers=fft.workers)
+    return fft
+
+
+def set_fft_backend(backend="scipy", workers=None):
+    """Sets the FFT backend used by comp_fftn and comp_ifftn
+    Parameters
+    ----------
+    backend: str
+        name of the backend ("numpy", "scipy" or "pyfftw")
+    workers: int
+        number of threads (scipy and pyfftw only, -1 for all cores)
+    """
+    global fft_backend
+    fft_backend = get_fft_backend(backend, workers=workers)
+
+
+@contextmanager
+def use_fft_backend(backend="scipy", workers=None):
+    """Context manager setting the FFT backend for the requests made inside
+    Parameters
+    ----------
+    backend: str
+        name of the backend ("numpy", "scipy" or "pyfftw")
+    workers: int
+        number of threads (scipy and pyfftw only, -1 for all cores)
+    """
+    global fft_backend
+    previous = fft_backend
+    fft_backend = get_fft_backend(backend, workers=workers)
+    try:
+        yield fft_backend
+    finally:
+        fft_backend = previous
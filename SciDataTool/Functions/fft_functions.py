@@ -1,5 +1,9 @@
+from collections import OrderedDict
+from threading import Lock
+
 from numpy import (
     array,
+    asarray,
     pi,
     exp,
     ceil,
@@ -13,18 +17,57 @@ from numpy import (
     where,
     isclose,
     around,
+    arange,
+    zeros,
+    concatenate,
+    result_type,
+    complex64,
+    full,
 )
-from numpy.fft import (
-    fftshift,
-    ifftshift,
-    rfftn,
-    irfftn,
-    fftn,
-    ifftn,
+from numpy.fft import ifftshift
+
+
+from SciDataTool.Functions.nudft_functions import (
+    is_uniform,
+    nudftn,
+    inudftn,
+    dft_tensordot,
+    czt_tensordot,
 )
+from SciDataTool.Functions.fft_backends import get_fft_backend
+
+
+# Maximum number of frequency/time vectors kept in memory
+AXIS_CACHE_SIZE = 64
 
+axis_cache = OrderedDict()
+axis_cache_lock = Lock()
 
-from SciDataTool.Functions.nudft_functions import is_uniform, nudftn, inudftn
+
+def get_cached_axis(key, comp_axis):
+    """Returns a copy of the axis vector stored for key, computed with comp_axis if
+    not available
+    Parameters
+    ----------
+    key: tuple
+        parameters defining the vector
+    comp_axis: function
+        function computing the vector (without argument)
+    Returns
+    -------
+    ndarray
+    """
+    with axis_cache_lock:
+        values = axis_cache.get(key)
+        if values is not None:
+            axis_cache.move_to_end(key)
+            return values.copy()
+    values = comp_axis()
+    with axis_cache_lock:
+        axis_cache[key] = values
+        while len(axis_cache) > AXIS_CACHE_SIZE:
+            axis_cache.popitem(last=False)
+    return values.copy()
 
 
 def comp_fft_freqs(time, is_time, is_real):
@@ -39,23 +82,28 @@ def comp_fft_freqs(time, is_time, is_real):
     -------
     Frequency/wavenumber vector
     """
-    N_tot = time.size  # Number of samples
+    N_tot = len(time)  # Number of samples
     if N_tot == 1:
-        freqs = [0]
-    else:
+        return array([0])
+    timestep = float(time[1] - time[0])  # Sample step
+
+    def comp_freqs():
         # zero-padding
         # N_tot = int(2**(log(N_tot)//log(2)+1))
-        timestep = float(time[1] - time[0])  # Sample step
         fsampt = 1.0 / timestep  # Sample frequency
         freqscale = N_tot / fsampt
-        freqs = [i - int(N_tot / 2) for i in range(int(N_tot))]
         if is_real and is_time:
             # freqs = rfftfreq(N_tot, 1/(N_tot*fsampt))
-            freqs = [i for i in range(int(N_tot / 2) + 1)]
-            # freqs.append(-freqs[0])
+            freqs = arange(int(N_tot / 2) + 1)
+        else:
+            freqs = arange(int(N_tot)) - int(N_tot / 2)
         if is_time:
-            freqs = [i / freqscale for i in freqs]
-    return freqs
+            freqs = freqs / freqscale
+        return freqs
+
+    # Only positive frequencies for real signals in time
+    key = ("freqs", N_tot, timestep, is_real and is_time, is_time)
+    return get_cached_axis(key, comp_freqs)
 
 
 def comp_fft_time(freqs, is_angle, is_real):
@@ -70,15 +118,18 @@ def comp_fft_time(freqs, is_angle, is_real):
     -------
     Time/space vector
     """
+    freqs = asarray(freqs)
     if freqs.size == 1:
-        time = array([0])
-    else:
+        return array([0])
+    freq_max = float(freqs[-1])
+
+    def comp_time():
         if is_real and not is_angle:
             N_tot = 2 * (len(freqs) - 1)  # Number of samples
-            fs = freqs[-1] / (N_tot)
+            fs = freq_max / (N_tot)
         else:
             N_tot = len(freqs)  # Number of samples
-            fs = freqs[-1] / (N_tot - 2)
+            fs = freq_max / (N_tot - 2)
         tf = 1 / (fs * 2)
         time = linspace(0, tf, N_tot, endpoint=False)
         # fsampt = freqs[-1] * 2.0
@@ -87,7 +138,10 @@ def comp_fft_time(freqs, is_angle, is_real):
             time *= 2.0 * pi
             # timestep *= 2.0 * pi
         # time = [0 + i * timestep for i in range(N_tot)]
-    return time.tolist()
+        return time
+
+    key = ("time", len(freqs), freq_max, is_real and not is_angle, is_angle)
+    return get_cached_axis(key, comp_time)
 
 
 def comp_nthoctave_axis(noct, freqmin, freqmax):
@@ -197,23 +251,270 @@ def comp_nthoctave_axis(noct, freqmin, freqmax):
 #     return values_FT
 
 
-def comp_fftn(values, axes_list, is_real=True):
+def scale_slice(values, axis, factor):
+    """Multiplies in place the first slice of values along axis (f=0 component)
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the FT
+    axis: int
+        index of the axis
+    factor: float
+        scaling factor
+    """
+    index = [slice(None)] * values.ndim
+    index[axis] = 0
+    values[tuple(index)] *= factor
+
+
+def shift_scale(values, axes, factor):
+    """Shifts the zero-frequency component to the center along axes and multiplies by
+    factor, in place: the first half of each axis is copied, the second half is
+    moved to the front by blocks (each block assignment copies its source) and the
+    copy is written at the back (same result as fftshift)
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the FT (modified)
+    axes: list
+        indices of the axes to shift
+    factor: float
+        scaling factor
+    Returns
+    -------
+    ndarray of the shifted and scaled FT
+    """
+    for axis in axes:
+        n = values.shape[axis]
+        if n < 2:
+            continue
+        # fftshift: [x[(n+1)//2:], x[:(n+1)//2]]
+        index = [slice(None)] * values.ndim
+        index[axis] = slice(0, (n + 1) // 2)
+        first = values[tuple(index)].copy()
+        index_src = list(index)
+        step = max(1, n // 32)
+        for start in range(0, n // 2, step):
+            stop = min(start + step, n // 2)
+            index[axis] = slice(start, stop)
+            index_src[axis] = slice((n + 1) // 2 + start, (n + 1) // 2 + stop)
+            values[tuple(index)] = values[tuple(index_src)]
+        index[axis] = slice(n // 2, n)
+        values[tuple(index)] = first
+        del first
+    values *= factor
+    return values
+
+
+def comp_fft_antiperiod(values, axis, fft, is_onereal=False):
+    """Computes the FFT along an anti-periodic axis from the half period stored:
+    only odd harmonics of the period are non zero, they are the n-point FFT of the
+    half period multiplied by exp(-i*pi*k/n) (same result as the FFT of the period)
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the field on the half period
+    axis: int
+        index of the anti-periodic axis
+    fft: FFTBackend
+        FFT backend
+    is_onereal: bool
+        True to return the positive harmonics only (as rfftn on the period)
+    Returns
+    -------
+    ndarray of the FT along axis
+    """
+    n = values.shape[axis]
+    shape = [1] * values.ndim
+    shape[axis] = n
+    twist = exp(-1j * pi * arange(n) / n).reshape(shape)
+    values_odd = fft.fftn(
+        values * twist.astype(result_type(values.dtype, complex64), copy=False),
+        [axis],
+    )
+    values_odd *= 2
+    # Scatter odd harmonics on the harmonic grid of the period
+    shape = list(values.shape)
+    shape[axis] = n + 1 if is_onereal else 2 * n
+    values_FT = zeros(shape, dtype=values_odd.dtype)
+    index_FT = [slice(None)] * values.ndim
+    index_FT[axis] = slice(1, shape[axis], 2)
+    index_odd = [slice(None)] * values.ndim
+    index_odd[axis] = slice(0, len(range(1, shape[axis], 2)))
+    values_FT[tuple(index_FT)] = values_odd[tuple(index_odd)]
+    return values_FT
+
+
+def comp_fft_axes(values, axes, fft, is_onereal=False, antiper_axes=[]):
+    """Computes the FFT along axes (rfftn if is_onereal, fftn otherwise), the
+    anti-periodic axes being transformed from the half period stored
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the field
+    axes: list
+        indices of the axes to transform
+    fft: FFTBackend
+        FFT backend
+    is_onereal: bool
+        True to keep the positive harmonics only along the last axis
+    antiper_axes: list
+        indices of the axes stored on the half period
+    Returns
+    -------
+    ndarray of the FT
+    """
+    axes_antiper = [axis for axis in axes if axis in antiper_axes]
+    if len(axes_antiper) == 0:
+        if is_onereal:
+            return fft.rfftn(values, axes)
+        return fft.fftn(values, axes)
+    axes = list(axes)
+    if is_onereal:
+        # Real FFT along the last axis first (as rfftn)
+        axis = axes.pop()
+        if axis in axes_antiper:
+            values = comp_fft_antiperiod(values, axis, fft, is_onereal=True)
+            axes_antiper.remove(axis)
+        else:
+            values = fft.rfftn(values, [axis])
+    for axis in axes_antiper:
+        values = comp_fft_antiperiod(values, axis, fft)
+        axes.remove(axis)
+    if axes != []:
+        values = fft.fftn(values, axes)
+    return values
+
+
+def comp_fft_bins(values, axis, factor, is_onereal=False, is_dc_half=False):
+    """Computes the FT on the requested harmonics of a uniform axis only (DFT of the
+    bins instead of the whole FFT, same normalization as comp_fftn)
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the field
+    axis: RequestedAxis
+        fft axis with the indices of the requested bins
+    factor: float
+        scaling factor of the harmonics
+    is_onereal: bool
+        True if indices are positive harmonics (rfftn), harmonics centered otherwise
+    is_dc_half: bool
+        True to halve the constant component (f=0)
+    Returns
+    -------
+    ndarray of the FT on the requested bins
+    """
+    n = values.shape[axis.index]
+    harmonics = array(axis.indices)
+    if not is_onereal:
+        harmonics = harmonics - n // 2
+    values_FT = dft_tensordot(values, axis.index, harmonics, arange(n) / n, -1)
+    factors = full(len(harmonics), factor)
+    if is_dc_half:
+        factors[harmonics == 0] *= 0.5
+    shape = [1] * values_FT.ndim
+    shape[axis.index] = len(harmonics)
+    values_FT *= factors.reshape(shape)
+    return values_FT
+
+
+def comp_fft_values(values, axis, is_czt=False):
+    """Computes the FT on the requested values of a uniform axis which are off the
+    FFT grid (same normalization as nudftn)
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of the field
+    axis: RequestedAxis
+        fft axis with the requested values in input_data
+    is_czt: bool
+        True to compute the chirp-z transform (uniform values), DFT otherwise
+    Returns
+    -------
+    ndarray of the FT on the requested values
+    """
+    times = asarray(axis.corr_values, dtype=float)
+    freqs = asarray(axis.input_data, dtype=float)
+    if axis.name != "freqs":
+        freqs = freqs / (2 * pi)
+    if is_czt:
+        values_FT = czt_tensordot(values, axis.index, freqs, times, -1)
+    else:
+        values_FT = dft_tensordot(values, axis.index, freqs, times, -1)
+    values_FT /= len(times)
+    # Positive frequencies only (rfft equivalent)
+    if (freqs >= 0).all():
+        shape = [1] * values_FT.ndim
+        shape[axis.index] = len(freqs)
+        values_FT *= where(freqs != 0, 2, 1).reshape(shape)
+    # Keep only interpolation data
+    axis.values = axis.input_data
+    axis.input_data = None
+    return values_FT
+
+
+def comp_fftn(
+    values,
+    axes_list,
+    is_real=True,
+    backend=None,
+    antiper_axes=None,
+    partial_axes=None,
+):
     """Computes the Fourier Transform
     Parameters
     ----------
     values: ndarray
         ndarray of the field
+    backend: str or FFTBackend
+        FFT backend ("numpy", "scipy", "pyfftw"), global backend if None
+    antiper_axes: list
+        indices of the anti-periodic axes whose values are given on the half period
+        (the FFT is computed without rebuilding the period)
+    partial_axes: dict
+        uniform fft axis computed on the requested values only {index: "dft" or
+        "czt"} (see QueryPlan.partial_fft)
     Returns
     -------
     Complex Fourier Transform
     """
 
+    fft = get_fft_backend(backend)
+    antiper_axes = [] if antiper_axes is None else list(antiper_axes)
+    axis_names = [axis.name for axis in axes_list]
+
+    # Requested harmonics only
+    for axis in axes_list:
+        if partial_axes and axis.index in partial_axes:
+            if axis.input_data is not None:
+                return comp_fft_values(
+                    values, axis, is_czt=partial_axes[axis.index] == "czt"
+                )
+            n = values.shape[axis.index]
+            if is_real and axis.name == "freqs":
+                if axis.corr_values is not None:
+                    freqs = axis.corr_values
+                else:
+                    freqs = axis.values
+                return comp_fft_bins(
+                    values, axis, 2.0 / n, is_onereal=True, is_dc_half=freqs[0] == 0
+                )
+            elif (
+                is_real
+                and axis.name == "wavenumber"
+                and "freqs" not in axis_names
+                and min(axis.values) >= 0
+            ):
+                return comp_fft_bins(values, axis, 2.0 / n, is_dc_half=True)
+            else:
+                return comp_fft_bins(values, axis, 1.0 / n)
+
     axes = []
     axes_dict_non_uniform = dict()
     shape = []
     is_onereal = False
     is_twice = False
-    axis_names = [axis.name for axis in axes_list]
 
     # Check if one or several axes is non-uniform
     is_non_uniform = False
@@ -251,15 +552,23 @@ def comp_fftn(values, axes_list, is_real=True):
 
     # Apply DFT on non-uniform axes
     if is_non_uniform:
+        # Rebuild the period of anti-periodic axes
+        for index in axes_dict_non_uniform:
+            if index in antiper_axes:
+                values = concatenate((values, -values), axis=index)
+                antiper_axes.remove(index)
         values = nudftn(values, axes_dict=axes_dict_non_uniform)
 
     # Find other fft axes
     for axis in axes_list:
         if axis.index not in axes_dict_non_uniform:
             if axis.transform == "fft":
+                n = values.shape[axis.index]
+                if axis.index in antiper_axes:
+                    n *= 2
                 if is_real and axis.name == "freqs":
                     axes.append(axis.index)
-                    shape.append(values.shape[axis.index])
+                    shape.append(n)
                     is_onereal = True
                 elif (
                     is_real
@@ -268,40 +577,34 @@ def comp_fftn(values, axes_list, is_real=True):
                     and min(axis.values) >= 0
                 ):
                     axes.append(axis.index)
-                    shape.append(values.shape[axis.index])
+                    shape.append(n)
                     is_twice = True
                 else:
                     axes = [axis.index] + axes
-                    shape = [values.shape[axis.index]] + shape
+                    shape = [n] + shape
     if axes != []:
-        size = array(shape).prod()
+        size = int(array(shape).prod())
         if is_onereal:
-            values_FT = rfftn(values, axes=axes)
+            values_FT = comp_fft_axes(
+                values, axes, fft, is_onereal=True, antiper_axes=antiper_axes
+            )
             # Do not multiply constant component by 2 (f=0)
             if axes_list[axes[-1]].corr_values is not None:
                 freqs = axes_list[axes[-1]].corr_values
             else:
                 freqs = axes_list[axes[-1]].values
             if freqs[0] == 0:
-                slice_0 = take(values_FT, 0, axis=axes[-1])
-                slice_0 *= 0.5
-                if is_twice:
-                    slice_0 *= 0.5
-                other_values = delete(values_FT, 0, axis=axes[-1])
-                values_FT = insert(other_values, 0, slice_0, axis=axes[-1])
-            values_FT2 = 2.0 * fftshift(values_FT, axes=axes[:-1]) / size
-            if is_twice:
-                values_FT2 *= 2.0
+                scale_slice(values_FT, axes[-1], 0.25 if is_twice else 0.5)
+            values_FT2 = shift_scale(
+                values_FT, axes[:-1], (4.0 if is_twice else 2.0) / size
+            )
         elif is_twice:
-            values_FT = fftn(values, axes=axes)
-            slice_0 = take(values_FT, 0, axis=axes[-1])
-            slice_0 *= 0.5
-            other_values = delete(values_FT, 0, axis=axes[-1])
-            values_FT = insert(other_values, 0, slice_0, axis=axes[-1])
-            values_FT2 = 2.0 * fftshift(values_FT, axes=axes) / size
+            values_FT = comp_fft_axes(values, axes, fft, antiper_axes=antiper_axes)
+            scale_slice(values_FT, axes[-1], 0.5)
+            values_FT2 = shift_scale(values_FT, axes, 2.0 / size)
         else:
-            values_FT = fftn(values, axes=axes)
-            values_FT2 = fftshift(values_FT, axes=axes) / size
+            values_FT = comp_fft_axes(values, axes, fft, antiper_axes=antiper_axes)
+            values_FT2 = shift_scale(values_FT, axes, 1.0 / size)
     else:
         values_FT2 = values
     return values_FT2
@@ -329,17 +632,21 @@ def comp_fftn(values, axes_list, is_real=True):
 #     return values_IFT
 
 
-def comp_ifftn(values, axes_list, is_real=True):
+def comp_ifftn(values, axes_list, is_real=True, backend=None):
     """Computes the Inverse Fourier Transform
     Parameters
     ----------
     values: ndarray
         ndarray of the FT
+    backend: str or FFTBackend
+        FFT backend ("numpy", "scipy", "pyfftw"), global backend if None
     Returns
     -------
     IFT
     """
 
+    fft = get_fft_backend(backend)
+
     axes = []
     shape = []
     is_onereal = False
@@ -417,7 +724,7 @@ def comp_ifftn(values, axes_list, is_real=True):
                 axes = [axis.index] + axes
                 shape = [values.shape[axis.index]] + shape
     if axes:  # Check if ifftn has to be called
-        size = array(shape).prod()
+        size = int(array(shape).prod())
         if is_onereal:
             values = values * size / 2
             if is_half:
@@ -429,7 +736,7 @@ def comp_ifftn(values, axes_list, is_real=True):
                 slice_0 *= 2
             other_values = delete(values_shift, 0, axis=axes[-1])
             values = insert(other_values, 0, slice_0, axis=axes[-1])
-            values_IFT = irfftn(values, axes=axes)
+            values_IFT = fft.irfftn(values, axes)
         elif is_half:
             values = values * size / 2
             values_shift = ifftshift(values, axes=axes[:-1])
@@ -437,10 +744,10 @@ def comp_ifftn(values, axes_list, is_real=True):
             slice_0 *= 2
             other_values = delete(values_shift, 0, axis=axes[-1])
             values = insert(other_values, 0, slice_0, axis=axes[-1])
-            values_IFT = ifftn(values, axes=axes)
+            values_IFT = fft.ifftn(values, axes)
         else:
             values_shift = ifftshift(values, axes=axes) * size
-            values_IFT = ifftn(values_shift, axes=axes)
+            values_IFT = fft.ifftn(values_shift, axes)
     else:
         values_IFT = values
     if is_real:
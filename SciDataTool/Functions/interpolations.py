@@ -1,5 +1,17 @@
+from collections import OrderedDict
+from itertools import product
+from threading import Lock
+
 from numpy import (
+    arange,
+    argmax,
     array,
+    bincount,
+    cumsum,
+    repeat,
+    asarray,
+    moveaxis,
+    ones,
     stack,
     linspace,
     argmin,
@@ -11,52 +23,285 @@ from numpy import (
     where,
     zeros,
     unique,
+    argsort,
+    searchsorted,
+    clip,
+    minimum,
+    allclose,
+    concatenate,
+    iscomplexobj,
+    rint,
+    real,
 )
-from scipy.interpolate import interp1d
+from numpy.fft import fftfreq
+
+from SciDataTool.Functions.fft_backends import get_fft_backend
+from SciDataTool.Functions.nudft_functions import dft_tensordot
+from SciDataTool.Functions.query_plan import fingerprint
+
+# Maximum number of interpolation operators kept in memory
+INTERP_CACHE_SIZE = 128
+# Maximum size of the blocks of comparisons of the step interpolation on unsorted axes
+STEP_BLOCK_MAX_SIZE = 1e7
+
+interp_cache = OrderedDict()
+interp_cache_lock = Lock()
+
+
+class InterpOperator(object):
+    """Interpolation operator along one axis, independent of the field values:
+    unchanged field ("identity"), selection of indices ("take"), NaN values out of
+    the axis ("nan") or sum of the values at indices weighted by weights ("linear")
+    """
+
+    def __init__(self, kind, indices=None, weights=None):
+        self.kind = kind
+        self.indices = indices
+        self.weights = weights
+
+    def apply(self, values, index):
+        """Returns the interpolated field
+        Parameters
+        ----------
+        self: InterpOperator
+            an InterpOperator object
+        values: ndarray
+            array of a field
+        index: int
+            index of the axis
+        Returns
+        -------
+        ndarray of the interpolated field
+        """
+        if self.kind == "identity":
+            return values
+        elif self.kind == "take":
+            return take(values, self.indices, axis=index)
+        elif self.kind == "nan":
+            new_shape = list(values.shape)
+            new_shape[index] = 1
+            new_values = zeros(tuple(new_shape), dtype=values.dtype)
+            new_values[(slice(None),) * index] = None
+            return new_values
+        else:
+            # Gather both neighbours in one take, then weighted sum
+            shape = values.shape
+            n = self.indices.shape[0]
+            values = take(values, self.indices.ravel(), axis=index)
+            values = values.reshape(shape[:index] + (n, 2) + shape[index + 1 :])
+            weights = self.weights.reshape((n, 2) + (1,) * (len(shape) - index - 1))
+            return (values * weights).sum(axis=index + 1)
+
+    def get_neighbours(self, n):
+        """Returns the indices and the weights of the values combined for each new
+        value (None if the operator is not a weighted sum)
+        Parameters
+        ----------
+        self: InterpOperator
+            an InterpOperator object
+        n: int
+            length of the original axis
+        Returns
+        -------
+        ndarray of indices (number of new values x number of neighbours), ndarray of
+        weights
+        """
+        if self.kind == "identity":
+            return arange(n)[:, None], ones((n, 1))
+        elif self.kind == "take":
+            indices = asarray(self.indices, dtype=int)[:, None]
+            return indices, ones(indices.shape)
+        elif self.kind == "linear":
+            return self.indices, self.weights
+        else:
+            return None
+
+
+def get_multilinear_interpolation(values, indices, neighbours, is_scattered=False):
+    """Returns the field interpolated along several axes in one pass: the values at
+    the corners of the cells containing the new points are gathered and summed
+    with the products of the weights along each axis (multilinear interpolation),
+    without intermediate field interpolated along a single axis
+    Parameters
+    ----------
+    values: ndarray
+        array of a field
+    indices: list
+        indices of the interpolated axes
+    neighbours: list
+        indices and weights of the neighbours along each axis (see
+        InterpOperator.get_neighbours)
+    is_scattered: bool
+        True if the new points are given by their coordinates (same number of
+        values along each axis, results along the first interpolated axis, the
+        other ones are of size 1), False for the grid of all combinations
+    Returns
+    -------
+    ndarray of the interpolated field
+    """
+    k = len(indices)
+    # Interpolated axes first (view)
+    values = moveaxis(values, indices, list(range(k)))
+    values_new = None
+    for corner in product(*[range(idx.shape[1]) for idx, _ in neighbours]):
+        keys = []
+        weights = 1
+        for j, ((idx, w), c) in enumerate(zip(neighbours, corner)):
+            if is_scattered:
+                keys.append(idx[:, c])
+                weights = weights * w[:, c]
+            else:
+                # Open grid of the new points (as numpy.ix_)
+                shape = (1,) * j + (-1,) + (1,) * (k - j - 1)
+                keys.append(idx[:, c].reshape(shape))
+                weights = weights * w[:, c].reshape(shape)
+        weights = asarray(weights)
+        weights = weights.reshape(weights.shape + (1,) * (values.ndim - k))
+        term = values[tuple(keys)] * weights
+        if values_new is None:
+            values_new = term
+        else:
+            values_new += term
+    if is_scattered:
+        values_new = values_new.reshape(
+            values_new.shape[:1] + (1,) * (k - 1) + values_new.shape[1:]
+        )
+    return moveaxis(values_new, list(range(k)), indices)
 
 
-def get_common_base(values1, values2, is_extrap=False, is_downsample=False):
-    """Returns a common base for vectors values1 and values2
+def comp_interpolation_operator(axis_values, new_axis_values):
+    """Computes the operator of the linear interpolation (with extrapolation) from
+    axis_values to new_axis_values
+    Parameters
+    ----------
+    axis_values: ndarray
+        values of the original axis
+    new_axis_values: ndarray
+        values of the new axis
+    Returns
+    -------
+    an InterpOperator object
+    """
+    if len(new_axis_values) == 1:  # Single point -> use argmin or None if out of bounds
+        if new_axis_values[0] < min(axis_values) or new_axis_values[0] > max(
+            axis_values
+        ):
+            return InterpOperator("nan")
+        else:
+            idx = argmin(np_abs(axis_values - new_axis_values[0]))
+            return InterpOperator("take", indices=[idx])
+    elif len(axis_values) == len(new_axis_values) and all(
+        isclose(axis_values, new_axis_values, rtol=1e-03)
+    ):  # Same axes -> no interpolation
+        return InterpOperator("identity")
+    elif isin(new_axis_values, axis_values).all():  # New axis is subset
+        return InterpOperator(
+            "take", indices=where(isin(axis_values, new_axis_values))[0]
+        )
+    elif len(axis_values) < 2:
+        raise ValueError("x and y arrays must have at least 2 entries")
+    else:
+        # Linear interpolation between the neighbours on the sorted axis (as
+        # scipy.interpolate.interp1d)
+        order = argsort(axis_values, kind="stable")
+        axis_sorted = axis_values[order]
+        indices = searchsorted(axis_sorted, new_axis_values)
+        indices = clip(indices, 1, len(axis_values) - 1)
+        lower = axis_sorted[indices - 1]
+        ratio = (new_axis_values - lower) / (axis_sorted[indices] - lower)
+        return InterpOperator(
+            "linear",
+            indices=stack([order[indices - 1], order[indices]], axis=1),
+            weights=stack([1 - ratio, ratio], axis=1),
+        )
+
+
+def get_interpolation_operator(axis_values, new_axis_values):
+    """Returns the operator of the linear interpolation from axis_values to
+    new_axis_values, from cache if the same axes have already been interpolated
+    Parameters
+    ----------
+    axis_values: ndarray
+        values of the original axis
+    new_axis_values: ndarray
+        values of the new axis
+    Returns
+    -------
+    an InterpOperator object
+    """
+    axis_values = asarray(axis_values)
+    new_axis_values = asarray(new_axis_values)
+    key = (fingerprint(axis_values), fingerprint(new_axis_values))
+    with interp_cache_lock:
+        operator = interp_cache.get(key)
+        if operator is not None:
+            interp_cache.move_to_end(key)
+            return operator
+    operator = comp_interpolation_operator(axis_values, new_axis_values)
+    with interp_cache_lock:
+        interp_cache[key] = operator
+        while len(interp_cache) > INTERP_CACHE_SIZE:
+            interp_cache.popitem(last=False)
+    return operator
+
+
+def clear_interpolation_cache():
+    """Removes all the stored interpolation operators"""
+    with interp_cache_lock:
+        interp_cache.clear()
+
+
+def get_common_base(
+    values1, values2, *values_list, is_extrap=False, is_downsample=False
+):
+    """Returns a common base for vectors values1, values2 (and the next ones)
     Parameters
     ----------
     values1: list
         values of the first axis
     values2: list
         values of the second axis
+    *values_list: list
+        values of the other axes to compare
     is_extrap: bool
-        Boolean indicating if we want to keep the widest vector and extrapolate the other one
+        Boolean indicating if we want to keep the widest vector and extrapolate the
+        other ones
     is_downsample: bool
-        Boolean indicating if we want to keep the smallest number of points and downsample the other one
+        Boolean indicating if we want to keep the smallest number of points and
+        downsample the other ones
     Returns
     -------
     list of the common axis values
     """
+    values_list = [
+        asarray(values, dtype=float).ravel()
+        for values in (values1, values2) + values_list
+    ]
+    # Bounds and number of values in the common range of all the axes at once
+    sizes = array([len(values) for values in values_list])
+    ends = cumsum(sizes)
+    values_all = concatenate(values_list)
     if is_extrap:
-        initial = min(values1[0], values2[0])
-        final = max(values1[-1], values2[-1])
+        initial = values_all[ends - sizes].min()
+        final = values_all[ends - 1].max()
     else:
-        initial = max(values1[0], values2[0])
-        final = min(values1[-1], values2[-1])
+        initial = values_all[ends - sizes].max()
+        final = values_all[ends - 1].min()
+    is_inside = (values_all >= initial) & (values_all <= final)
+    lengths = bincount(
+        repeat(arange(len(sizes)), sizes), weights=is_inside, minlength=len(sizes)
+    )
     if is_downsample:
-        number = min(
-            len([i for i in values1 if i >= initial and i <= final]),
-            len([i for i in values2 if i >= initial and i <= final]),
-        )
+        number = lengths.min()
     else:
-        length1 = len([i for i in values1 if i >= initial and i <= final])
-        length2 = len([i for i in values2 if i >= initial and i <= final])
-        if length1 > length2:
-            number = length1
-            if initial not in values1:
-                initial = values1[argmin(np_abs([i - initial for i in values1])) + 1]
-            if final not in values1:
-                final = values1[argmin(np_abs([i - final for i in values1])) - 1]
-        else:
-            number = length2
-            if initial not in values2:
-                initial = values2[argmin(np_abs([i - initial for i in values2])) + 1]
-            if final not in values2:
-                final = values2[argmin(np_abs([i - final for i in values2])) - 1]
+        # Densest axis (the last one if equal), bounds moved inside this axis
+        i_max = len(lengths) - 1 - argmax(lengths[::-1])
+        number = lengths[i_max]
+        values = values_list[i_max]
+        if not (values == initial).any():
+            initial = values[argmin(np_abs(values - initial)) + 1]
+        if not (values == final).any():
+            final = values[argmin(np_abs(values - final)) - 1]
     return linspace(initial, final, int(number), endpoint=True)
 
 
@@ -78,38 +323,9 @@ def get_interpolation(values, axis_values, new_axis_values, index):
     """
     if str(axis_values) == "whole":  # Whole axis -> no interpolation
         return values
-    elif (
-        len(new_axis_values) == 1
-    ):  # Single point -> use argmin or None if out of bounds
-        if new_axis_values[0] < min(axis_values) or new_axis_values[0] > max(
-            axis_values
-        ):
-            new_shape = list(values.shape)
-            new_shape[index] = 1
-            new_values = zeros(tuple(new_shape), dtype=values.dtype)
-            new_values[(slice(None),) * index] = None
-            return new_values
-        else:
-            idx = argmin(np_abs(axis_values - new_axis_values[0]))
-            return take(values, [idx], axis=index)
-    elif len(axis_values) == len(new_axis_values) and all(
-        isclose(axis_values, new_axis_values, rtol=1e-03)
-    ):  # Same axes -> no interpolation
-        return values
-    elif isin(
-        new_axis_values, axis_values
-    ).all():  # New axis is subset -> no interpolation
-        indice_take = where(isin(axis_values, new_axis_values))[0]
-
-        return take(
-            values,
-            indice_take,
-            axis=index,
-        )
-
     else:
-        f = interp1d(axis_values, values, axis=index, fill_value="extrapolate")
-        return f(new_axis_values)
+        operator = get_interpolation_operator(axis_values, new_axis_values)
+        return operator.apply(values, index)
 
 
 def get_interpolation_step(values, axis_values, new_axis_values, index):
@@ -155,51 +371,240 @@ def get_interpolation_step(values, axis_values, new_axis_values, index):
             return take(values, [], axis=index)
 
     else:
-        new_shape = list(values.shape)
-        new_shape[index] = len(new_axis_values)
-        new_values = zeros(tuple(new_shape), dtype=values.dtype)
+        axis_values = array(axis_values, dtype=float)
+        new_axis_values = array(new_axis_values, dtype=float)
         if len(axis_values) == 1 or all(axis_values == axis_values[0]):
-            for i in range(len(new_axis_values)):
-                new_values[(slice(None),) * index + (i,)] = take(values, 0, axis=index)
-            return new_values
+            return take(values, zeros(len(new_axis_values), dtype=int), axis=index)
+        # Steps are defined on a sorted axis (duplicated values at discontinuities),
+        # first matching interval of unsorted axes
+        if (axis_values[1:] < axis_values[:-1]).any():
+            indices, is_mid, is_zero = get_step_indices_unsorted(
+                axis_values, new_axis_values
+            )
         else:
-            for i in range(len(new_axis_values)):
-                for j in range(len(axis_values) - 1):
-                    if isclose(
-                        new_axis_values[i], axis_values[j], rtol=1e-03
-                    ) and isclose(new_axis_values[i], axis_values[j + 1], rtol=1e-03):
-                        new_values[(slice(None),) * index + (i,)] = (
-                            take(values, j, axis=index)
-                            + take(values, j + 1, axis=index)
-                        ) / 2
-                        break
-                    elif (
-                        new_axis_values[i] >= axis_values[j]
-                        and new_axis_values[i] < axis_values[j + 1]
-                        and not isclose(
-                            new_axis_values[i], axis_values[j + 1], rtol=1e-03
-                        )
-                    ):
-                        new_values[(slice(None),) * index + (i,)] = take(
-                            values, j, axis=index
-                        )
-                        break
-                    elif (
-                        j == len(axis_values) - 2
-                        and new_axis_values[i] == axis_values[j + 1]
-                    ):
-                        new_values[(slice(None),) * index + (i,)] = take(
-                            values, j + 1, axis=index
-                        )
-                        break
-                    else:
-                        # Extrapolate for outer bounds
-                        if new_axis_values[i] <= axis_values[0]:
-                            new_values[(slice(None),) * index + (i,)] = take(
-                                values, 0, axis=index
-                            )
-                        elif new_axis_values[i] >= axis_values[-1]:
-                            new_values[(slice(None),) * index + (i,)] = take(
-                                values, -1, axis=index
-                            )
-            return array(new_values)
+            indices, is_mid, is_zero = get_step_indices(axis_values, new_axis_values)
+        new_values = array(take(values, indices, axis=index))
+        # Midpoint of the discontinuities
+        if is_mid.any():
+            mid = where(is_mid)[0]
+            new_values[(slice(None),) * index + (mid,)] = (
+                take(values, indices[mid], axis=index)
+                + take(values, indices[mid] + 1, axis=index)
+            ) / 2
+        if is_zero.any():
+            new_values[(slice(None),) * index + (where(is_zero)[0],)] = 0
+        return new_values
+
+
+def get_step_indices(axis_values, new_axis_values, rtol=1e-03, atol=1e-08):
+    """Returns the indices of the step interpolation of new_axis_values on the sorted
+    axis_values, computed with searchsorted: each new value takes the value of the
+    step it belongs to, the mean of both sides if it is on a discontinuity
+    (duplicated axis value), the bound values if it is outside the axis
+    Parameters
+    ----------
+    axis_values: ndarray
+        sorted values of the original axis
+    new_axis_values: ndarray
+        values of the new axis
+    rtol: float
+        relative tolerance to detect the axis values (as in numpy.isclose)
+    atol: float
+        absolute tolerance to detect the axis values (as in numpy.isclose)
+    Returns
+    -------
+    ndarray of indices in axis_values, ndarray of booleans (mean of the values at
+    indices and indices + 1), ndarray of booleans (no value: 0)
+    """
+    N = len(axis_values)
+    x = new_axis_values
+
+    def is_close(indices):
+        is_in = (indices >= 0) & (indices < N)
+        close = isclose(x, axis_values[clip(indices, 0, N - 1)], rtol=rtol, atol=atol)
+        return is_in & close
+
+    # Axis values close to x (|x - a| <= atol + rtol * |a|) are an interval of the
+    # sorted axis [start, stop[, bounds are corrected for rounding errors
+    lower = where(x >= atol, (x - atol) / (1 + rtol), (x - atol) / (1 - rtol))
+    upper = where(x >= -atol, (x + atol) / (1 - rtol), (x + atol) / (1 + rtol))
+    # (duplicated axis values are skipped together)
+    def get_first(indices):
+        return searchsorted(axis_values, axis_values[clip(indices, 0, N - 1)])
+
+    def get_stop(indices):
+        values = axis_values[clip(indices, 0, N - 1)]
+        return searchsorted(axis_values, values, side="right")
+
+    start = searchsorted(axis_values, lower, side="left")
+    start = where(is_close(start - 1), get_first(start - 1), start)
+    start = where(~is_close(start) & is_close(get_stop(start)), get_stop(start), start)
+    stop = searchsorted(axis_values, upper, side="right")
+    stop = where(is_close(stop), get_stop(stop), stop)
+    stop = where(
+        ~is_close(stop - 1) & is_close(get_first(stop - 1) - 1),
+        get_first(stop - 1),
+        stop,
+    )
+    stop = where(is_close(start), stop, start)
+
+    # First interval j of the axis matching x:
+    # - x close to axis_values[j] and axis_values[j+1]: mean of both values
+    j_mid = where(stop - start >= 2, start, N)
+    # - axis_values[j] <= x < axis_values[j+1] and x not close to axis_values[j+1]
+    j_step = searchsorted(axis_values, x, side="right") - 1
+    j_step = where((j_step >= 0) & (j_step <= N - 2) & ~is_close(j_step + 1), j_step, N)
+    # - x equal to the last axis value
+    j_last = where(x == axis_values[-1], N - 2, N)
+    j = minimum(minimum(j_mid, j_step), j_last)
+
+    is_mid = (j < N) & (j == j_mid)
+    indices = where((j < N) & (j == j_step), j, N - 1)
+    indices = where(is_mid, j, indices)
+    # Extrapolation for outer bounds
+    is_extrap = j == N
+    indices = where(is_extrap & (x <= axis_values[0]), 0, indices)
+    is_zero = is_extrap & (x > axis_values[0]) & (x < axis_values[-1])
+    return indices.astype(int), is_mid, is_zero
+
+
+def get_step_indices_unsorted(axis_values, new_axis_values, rtol=1e-03, atol=1e-08):
+    """Returns the indices of the step interpolation of new_axis_values on unsorted
+    axis_values: each new value takes the first interval [j, j+1] of the axis it
+    matches (computed by blocks of new values)
+    Parameters
+    ----------
+    axis_values: ndarray
+        values of the original axis
+    new_axis_values: ndarray
+        values of the new axis
+    rtol: float
+        relative tolerance to detect the axis values (as in numpy.isclose)
+    atol: float
+        absolute tolerance to detect the axis values (as in numpy.isclose)
+    Returns
+    -------
+    ndarray of indices in axis_values, ndarray of booleans (mean of the values at
+    indices and indices + 1), ndarray of booleans (no value: 0)
+    """
+    N = len(axis_values)
+    M = len(new_axis_values)
+    indices = zeros(M, dtype=int)
+    is_mid = zeros(M, dtype=bool)
+    is_zero = zeros(M, dtype=bool)
+    n_block = max(1, int(STEP_BLOCK_MAX_SIZE // N))
+    for start in range(0, M, n_block):
+        x = new_axis_values[start : start + n_block, None]
+        close = isclose(x, axis_values[None, :], rtol=rtol, atol=atol)
+        # Matching intervals: x close to both bounds (mean of both values), in the
+        # step and not close to the next value, or equal to the last value
+        match_mid = close[:, :-1] & close[:, 1:]
+        match_step = (x >= axis_values[:-1]) & (x < axis_values[1:]) & ~close[:, 1:]
+        match_last = zeros(match_mid.shape, dtype=bool)
+        match_last[:, -1] = x[:, 0] == axis_values[-1]
+        match = match_mid | match_step | match_last
+        j = argmax(match, axis=1)
+        rows = arange(len(j))
+        is_found = match[rows, j]
+        block = slice(start, start + len(j))
+        is_mid[block] = is_found & match_mid[rows, j]
+        is_step = is_found & match_step[rows, j]
+        indices[block] = where(is_mid[block] | is_step, j, N - 1)
+        # Extrapolation for outer bounds
+        x = x[:, 0]
+        indices[block] = where(~is_found & (x <= axis_values[0]), 0, indices[block])
+        is_zero[block] = ~is_found & (x > axis_values[0]) & (x < axis_values[-1])
+    return indices, is_mid, is_zero
+
+
+def get_fourier_interpolation(
+    values, axis_values, new_axis_values, index, is_antiper=False
+):
+    """Returns the field interpolated along one periodic axis with its Fourier series
+    (band-limited interpolation): FFT zero-padding for a uniform upsampling of the
+    period, evaluation of the series with a cached DFT otherwise
+    Parameters
+    ----------
+    values: ndarray
+        array of a field, sampled uniformly on one period of the axis (half period
+        if is_antiper)
+    axis_values: ndarray
+        values of the original axis (uniform)
+    new_axis_values: ndarray
+        values of the new axis
+    index : int
+        index of the axis
+    is_antiper: bool
+        True if the field is anti-periodic (opposite on the next half period)
+    Returns
+    -------
+    ndarray of the interpolated field
+    """
+    axis_values = asarray(axis_values, dtype=float)
+    new_axis_values = asarray(new_axis_values, dtype=float)
+    values = asarray(values)
+    if is_antiper:
+        values = concatenate((values, -values), axis=index)
+    n = values.shape[index]
+    step = axis_values[1] - axis_values[0]
+    period = n * step
+    x = new_axis_values - axis_values[0]
+    is_real = not iscomplexobj(values)
+    fft = get_fft_backend()
+    if is_real:
+        spectrum = fft.rfftn(values, [index])
+    else:
+        spectrum = fft.fftn(values, [index])
+
+    def select(i):
+        return (slice(None),) * index + (i,)
+
+    # Uniform sampling of the whole period (possibly shifted): zero-padding
+    M = len(x)
+    if M >= n and M > 1 and allclose(x[1:] - x[:-1], period / M):
+        shift = rint(x[0] / (period / M))
+        if allclose(x[0], shift * period / M):
+            indices = (int(shift) + arange(M)) % M
+            if M == n:
+                return take(values, indices, axis=index)
+            shape = list(values.shape)
+            shape[index] = M // 2 + 1 if is_real else M
+            padded = zeros(shape, dtype=spectrum.dtype)
+            h = n // 2 + 1 if is_real else (n + 1) // 2
+            padded[select(slice(0, h))] = spectrum[select(slice(0, h))]
+            if not is_real:
+                padded[select(slice(M - n + h, M))] = spectrum[select(slice(h, n))]
+            if n % 2 == 0:
+                # Nyquist harmonic split on both sides of the spectrum (cosine)
+                padded[select(n // 2)] = spectrum[select(n // 2)] / 2
+                if not is_real:
+                    padded[select(M - n // 2)] = spectrum[select(n // 2)] / 2
+            module = fft.get_module()
+            if is_real:
+                values_new = module.irfftn(
+                    padded, s=[M], axes=[index], **fft.get_kwargs()
+                )
+            else:
+                values_new = module.ifftn(padded, axes=[index], **fft.get_kwargs())
+            return take(values_new, indices, axis=index) * (M / n)
+
+    # Arbitrary values: Fourier series with the scaling of comp_fftn
+    if is_real:
+        spectrum *= 2 / n
+        spectrum[select(0)] *= 0.5
+        freqs = arange(n // 2 + 1) / period
+    else:
+        spectrum *= 1 / n
+        freqs = fftfreq(n, step)
+    if n % 2 == 0:
+        # Nyquist harmonic split on both sides of the spectrum (cosine)
+        spectrum[select(n // 2)] *= 0.5
+        if not is_real:
+            spectrum = concatenate(
+                (spectrum, spectrum[select(slice(n // 2, n // 2 + 1))]), axis=index
+            )
+            freqs = concatenate((freqs, [-freqs[n // 2]]))
+    values_new = dft_tensordot(spectrum, index, x, freqs, 1)
+    if is_real:
+        return real(values_new)
+    return values_new
@@ -0,0 +1,209 @@
+from numpy import (
+    arange,
+    array,
+    asarray,
+    dtype as np_dtype,
+    generic,
+    memmap,
+    ndarray,
+    take,
+)
+
+
+class LazyValues(object):
+    """Field values stored out of core (numpy memmap, h5py Dataset or any array-like
+    with shape, dtype and slicing): slices are selected lazily and only the
+    bounding hyperslab of the selection is read"""
+
+    def __init__(self, source, selection=None, axes=None):
+        self.source = source
+        # Indices selected along each axis of the source (None: all indices)
+        if selection is None:
+            selection = [None] * len(source.shape)
+        self.selection = selection
+        # Axis of the source for each axis of the values (None: new axis of size 1)
+        if axes is None:
+            axes = list(range(len(source.shape)))
+        self.axes = axes
+
+    def __repr__(self):
+        return (
+            "LazyValues(shape="
+            + str(self.shape)
+            + ", dtype="
+            + str(self.dtype)
+            + ", source="
+            + type(self.source).__name__
+            + ")"
+        )
+
+    @property
+    def shape(self):
+        shape = []
+        for axis in self.axes:
+            if axis is None:
+                shape.append(1)
+            elif self.selection[axis] is None:
+                shape.append(self.source.shape[axis])
+            else:
+                shape.append(len(self.selection[axis]))
+        return tuple(shape)
+
+    @property
+    def ndim(self):
+        return len(self.axes)
+
+    @property
+    def size(self):
+        return int(array(self.shape).prod())
+
+    @property
+    def dtype(self):
+        return np_dtype(self.source.dtype)
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.read()
+        if dtype is None:
+            return values
+        return values.astype(dtype)
+
+    def __getitem__(self, key):
+        return self.read()[key]
+
+    def take(self, indices, axis=None, out=None, mode="raise"):
+        """Returns the values selected along one axis (lazy if possible)
+        Parameters
+        ----------
+        self: LazyValues
+            a LazyValues object
+        indices: list
+            indices to select
+        axis: int
+            index of the axis
+        Returns
+        -------
+        LazyValues or ndarray
+        """
+        indices = asarray(indices)
+        if (
+            axis is None
+            or out is not None
+            or mode != "raise"
+            or indices.ndim != 1
+            or self.axes[axis] is None
+        ):
+            return take(self.read(), indices, axis=axis, out=out, mode=mode)
+        n = self.shape[axis]
+        if indices.size > 0 and (indices.max() >= n or indices.min() < -n):
+            raise IndexError(
+                "index out of bounds for axis " + str(axis) + " with size " + str(n)
+            )
+        indices = indices % n if indices.size > 0 else indices.astype(int)
+        source_axis = self.axes[axis]
+        selection = list(self.selection)
+        if selection[source_axis] is None:
+            selection[source_axis] = indices
+        else:
+            selection[source_axis] = selection[source_axis][indices]
+        return LazyValues(self.source, selection, list(self.axes))
+
+    def squeeze(self, axis=None):
+        """Returns the values without the axes of size 1 (lazy)"""
+        shape = self.shape
+        if axis is None:
+            axis = [i for i, n in enumerate(shape) if n == 1]
+        elif isinstance(axis, int):
+            axis = [axis]
+        selection = list(self.selection)
+        axes = []
+        for i, source_axis in enumerate(self.axes):
+            if i in axis:
+                if shape[i] != 1:
+                    raise ValueError("cannot squeeze an axis of size different from 1")
+                if source_axis is not None and selection[source_axis] is None:
+                    selection[source_axis] = array([0])
+            else:
+                axes.append(source_axis)
+        return LazyValues(self.source, selection, axes)
+
+    def expand_dims(self, axis):
+        """Returns the values with a new axis of size 1 at index axis (lazy)"""
+        axes = list(self.axes)
+        axes.insert(axis, None)
+        return LazyValues(self.source, list(self.selection), axes)
+
+    def read(self):
+        """Reads the selected values from the source
+        Parameters
+        ----------
+        self: LazyValues
+            a LazyValues object
+        Returns
+        -------
+        ndarray
+        """
+        # Read the bounding hyperslab of the selection
+        keys = []
+        for indices in self.selection:
+            if indices is None:
+                keys.append(slice(None))
+            elif indices.size == 0:
+                keys.append(slice(0, 0))
+            else:
+                keys.append(slice(int(indices.min()), int(indices.max()) + 1))
+        values = asarray(self.source[tuple(keys)])
+        is_copy = False
+        # Select the indices inside the hyperslab
+        for i, indices in enumerate(self.selection):
+            if indices is not None and indices.size > 0:
+                indices_slab = indices - indices.min()
+                if indices_slab.size != values.shape[i] or (
+                    indices_slab != arange(indices_slab.size)
+                ).any():
+                    values = take(values, indices_slab, axis=i)
+                    is_copy = True
+        if not is_copy and not values.flags.owndata:
+            # Do not return a view of the source (memmap)
+            values = array(values)
+        # Remove squeezed axes of the source and add new axes of size 1
+        return values.reshape(self.shape)
+
+    def copy(self):
+        """Returns the selected values (ndarray)"""
+        return self.read()
+
+    def tolist(self):
+        return self.read().tolist()
+
+    def astype(self, dtype, copy=True):
+        return self.read().astype(dtype, copy=False)
+
+
+def is_lazy_source(value):
+    """Returns True if value must be read lazily (memmap or array-like object which is
+    not an ndarray, such as h5py Dataset)"""
+    if isinstance(value, memmap):
+        return True
+    elif value is None or isinstance(
+        value, (ndarray, generic, list, tuple, str, LazyValues)
+    ):
+        return False
+    return (
+        hasattr(value, "shape")
+        and hasattr(value, "dtype")
+        and hasattr(value, "__getitem__")
+    )
+
+
+def read_values(values):
+    """Returns the values read from disk if values is a LazyValues object"""
+    if isinstance(values, LazyValues):
+        return values.read()
+    return values
@@ -1,4 +1,8 @@
+from collections import OrderedDict
+from hashlib import blake2b
 from logging import getLogger
+from math import log2
+from threading import Lock
 from typing import Dict, List
 
 import numpy as np
@@ -8,6 +12,242 @@ from numpy import nanmax as np_max
 from numpy import mean
 from numpy import nanmin as np_min
 from numpy import moveaxis, ndarray, outer, pi, tensordot, where
+from numpy import arange, asarray, ascontiguousarray, complex64, empty, result_type
+from numpy import zeros
+
+from SciDataTool.Functions.fft_backends import get_fft_backend
+from SciDataTool.Functions.nufft_functions import get_nufft_params, nufft3
+from scipy.fft import next_fast_len
+
+# Maximum size of a block of DFT matrix [bytes] (matrices are built by blocks of rows)
+DFT_BLOCK_MAX_BYTES = 64e6
+# Memory budget of the cache of DFT matrix blocks [bytes]
+DFT_CACHE_MAX_BYTES = 256e6
+
+
+class DFTMatrixCache(object):
+    """LRU cache of the blocks of DFT matrices with a memory budget (key is the
+    digest of the sampling of the rows and columns, the sign of the exponent, the
+    dtype and the block)"""
+
+    def __init__(self, max_bytes=DFT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.matrices = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        """Returns the cached block or None"""
+        with self.lock:
+            matrix = self.matrices.get(key)
+            if matrix is not None:
+                self.matrices.move_to_end(key)
+            return matrix
+
+    def put(self, key, matrix):
+        """Stores a block, removing the least recently used ones if needed"""
+        if matrix.nbytes > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.matrices:
+                self.nbytes -= self.matrices.pop(key).nbytes
+            self.matrices[key] = matrix
+            self.nbytes += matrix.nbytes
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self.matrices.popitem(last=False)[1].nbytes
+
+    def clear(self):
+        """Removes all the stored blocks"""
+        with self.lock:
+            self.matrices.clear()
+            self.nbytes = 0
+
+
+dft_cache = DFTMatrixCache()
+
+
+def set_nudft_memory(block_max_bytes=None, cache_max_bytes=None):
+    """Sets the memory budgets of the non uniform DFT
+    Parameters
+    ----------
+    block_max_bytes: float
+        maximum size of a block of DFT matrix [bytes] (unchanged if None)
+    cache_max_bytes: float
+        memory budget of the cache of DFT matrix blocks [bytes] (unchanged if None,
+        0 to disable the cache)
+    """
+    global DFT_BLOCK_MAX_BYTES
+    if block_max_bytes is not None:
+        DFT_BLOCK_MAX_BYTES = block_max_bytes
+    if cache_max_bytes is not None:
+        with dft_cache.lock:
+            dft_cache.max_bytes = cache_max_bytes
+        if dft_cache.nbytes > cache_max_bytes:
+            dft_cache.clear()
+
+
+def get_dft_key(rows, cols, sign, dtype):
+    """Returns the key of a DFT matrix in the cache (digest of the samplings, computed
+    once per matrix), None if the matrix is larger than the cache budget (its blocks
+    would be removed before being used again)
+    Parameters
+    ----------
+    rows: ndarray
+        sampling of the rows
+    cols: ndarray
+        sampling of the columns
+    sign: int
+        sign of the exponent
+    dtype: dtype
+        complex dtype of the matrix
+    Returns
+    -------
+    hashable key or None
+    """
+    if len(rows) * len(cols) * dtype.itemsize > dft_cache.max_bytes:
+        return None
+    digest = blake2b(digest_size=16)
+    digest.update(ascontiguousarray(rows).view("uint8"))
+    digest.update(ascontiguousarray(cols).view("uint8"))
+    return (len(rows), len(cols), digest.digest(), sign, str(dtype))
+
+
+def get_dft_block(rows, cols, sign, start, stop, dtype, key=None):
+    """Returns the block rows[start:stop] of the DFT matrix exp(sign*2i*pi*rows*cols)
+    (stored in the cache if key is not None)
+    Parameters
+    ----------
+    rows: ndarray
+        sampling of the rows (frequencies for DFT, time for inverse DFT)
+    cols: ndarray
+        sampling of the columns (time for DFT, frequencies for inverse DFT)
+    sign: int
+        sign of the exponent (-1 for DFT, 1 for inverse DFT)
+    start: int
+        index of the first row of the block
+    stop: int
+        index after the last row of the block
+    dtype: dtype
+        complex dtype of the matrix
+    key: tuple
+        key of the matrix in the cache (see get_dft_key), no cache if None
+    Returns
+    -------
+    ndarray of the block of DFT matrix
+    """
+    if key is not None:
+        matrix = dft_cache.get(key + (start, stop))
+        if matrix is not None:
+            return matrix
+    matrix = exp(sign * 2j * pi * outer(rows[start:stop], cols)).astype(
+        dtype, copy=False
+    )
+    if key is not None:
+        dft_cache.put(key + (start, stop), matrix)
+    return matrix
+
+
+def dft_tensordot(a, idx_axe, rows, cols, sign, tolerance=None):
+    """Contracts axis idx_axe of a with the DFT matrix exp(sign*2i*pi*rows*cols),
+    the matrix being built by blocks of rows under DFT_BLOCK_MAX_BYTES (type-3
+    NUFFT for large samplings, see nufft_functions)
+    Parameters
+    ----------
+    a: ndarray
+        input data (not modified)
+    idx_axe: int
+        index of the axis to transform (size len(cols))
+    rows: ndarray
+        sampling of the output axis
+    cols: ndarray
+        sampling of the input axis
+    sign: int
+        sign of the exponent (-1 for DFT, 1 for inverse DFT)
+    tolerance: float
+        relative accuracy of the NUFFT (NUFFT_TOLERANCE if None)
+    Returns
+    -------
+    ndarray with len(rows) values along idx_axe
+    """
+    rows = asarray(rows, dtype=float)
+    cols = asarray(cols, dtype=float)
+    if is_czt_faster(rows, cols):
+        return czt_tensordot(a, idx_axe, rows, cols, sign)
+    params = get_nufft_params(cols, rows, tolerance)
+    if params is not None:
+        return nufft3(a, idx_axe, cols, rows, sign, params=params)
+    dtype = result_type(a.dtype, complex64)
+    n_rows = len(rows)
+    n_block = max(1, int(DFT_BLOCK_MAX_BYTES // (len(cols) * dtype.itemsize)))
+    other_shape = a.shape[:idx_axe] + a.shape[idx_axe + 1 :]
+    res = empty((n_rows,) + other_shape, dtype=dtype)
+    key = get_dft_key(rows, cols, sign, dtype)
+    for start in range(0, n_rows, n_block):
+        stop = min(start + n_block, n_rows)
+        matrix = get_dft_block(rows, cols, sign, start, stop, dtype, key)
+        res[start:stop] = tensordot(matrix, a, ((1,), (idx_axe)))
+    return moveaxis(res, 0, idx_axe)
+
+
+def is_czt_faster(rows, cols):
+    """Returns True if both samplings are uniform and the chirp-z transform is
+    faster than the direct DFT"""
+    n_rows, n_cols = len(rows), len(cols)
+    if n_rows < 2 or n_cols < 2:
+        return False
+    n_fft = next_fast_len(n_rows + n_cols - 1)
+    if 3 * n_fft * log2(n_fft) >= n_rows * n_cols:
+        return False
+    return is_uniform(rows) and is_uniform(cols)
+
+
+def czt_tensordot(a, idx_axe, rows, cols, sign):
+    """Contracts axis idx_axe of a with the DFT matrix exp(sign*2i*pi*rows*cols) for
+    uniform samplings with the chirp-z transform (Bluestein): the DFT is written as a
+    convolution with a chirp computed by FFT (zoom FFT on a narrow frequency band)
+    Parameters
+    ----------
+    a: ndarray
+        input data (not modified)
+    idx_axe: int
+        index of the axis to transform (size len(cols))
+    rows: ndarray
+        uniform sampling of the output axis
+    cols: ndarray
+        uniform sampling of the input axis
+    sign: int
+        sign of the exponent (-1 for DFT, 1 for inverse DFT)
+    Returns
+    -------
+    ndarray with len(rows) values along idx_axe
+    """
+    fft = get_fft_backend()
+    n_rows, n_cols = len(rows), len(cols)
+    r0, c0 = rows[0], cols[0]
+    dr = (rows[-1] - r0) / (n_rows - 1)
+    dc = (cols[-1] - c0) / (n_cols - 1)
+    # rows[m]*cols[n] = r0*c0 + r0*dc*n + c0*dr*m + dr*dc*(m**2 + n**2 - (m-n)**2)/2
+    m = arange(n_rows)
+    n = arange(n_cols)
+    n_fft = next_fast_len(n_rows + n_cols - 1)
+    values = moveaxis(asarray(a), idx_axe, 0)
+    other_shape = values.shape[1:]
+    values = values.reshape(n_cols, -1)
+    # Chirp of the input
+    chirp = zeros((n_fft, values.shape[1]), dtype=complex)
+    phase = pi * (2 * r0 * dc * n + dr * dc * n ** 2)
+    chirp[:n_cols] = values * exp(sign * 1j * phase)[:, None]
+    # Convolution with exp(-sign*i*pi*dr*dc*j**2) for j in [-(n_cols-1), n_rows-1]
+    j = arange(-(n_cols - 1), n_rows)
+    kernel = zeros((n_fft, 1), dtype=complex)
+    kernel[j % n_fft, 0] = exp(-sign * 1j * pi * dr * dc * j ** 2)
+    res = fft.ifftn(fft.fftn(chirp, [0]) * fft.fftn(kernel, [0]), [0])[:n_rows]
+    # Chirp of the output
+    phase = pi * (2 * r0 * c0 + 2 * c0 * dr * m + dr * dc * m ** 2)
+    res *= exp(sign * 1j * phase)[:, None]
+    dtype = result_type(a.dtype, complex64)
+    res = res.astype(dtype, copy=False).reshape((n_rows,) + other_shape)
+    return moveaxis(res, 0, idx_axe)
 
 
 def matrice_D(t: ndarray, f: ndarray) -> ndarray:
@@ -17,7 +257,9 @@ def matrice_D(t: ndarray, f: ndarray) -> ndarray:
     return exp(-1j * outer(f * 2 * pi, t))
 
 
-def nudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
+def nudftn(
+    a: ndarray, axes_dict: Dict[int, List[ndarray]], tolerance: float = None
+) -> ndarray:
     """
     Compute the non uniform discrete Fourier Transform
 
@@ -26,12 +268,12 @@ def nudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
 
     a: Input data
     axes_dict: Axes to perform dft with corresponding space and freqsampling
+    tolerance: Relative accuracy of the NUFFT used for large samplings
 
     Returns
     res: DFT result
     """
-    # Copy data
-    res = a.copy()
+    res = a
 
     axes_fft = []
     # Iterate on each axe to compute 1D DFT
@@ -51,12 +293,9 @@ def nudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
 
             # TODO criteria to have only positive freq or approximatively 50% of negative frequencies
 
-            # Construct DFT matrix
-            D = matrice_D(s, f)
-
-            # Operate the matrix multiplication and move axis to keep the good shaê
-            res = tensordot(D, res, ((1,), (idx_axe)))
-            res = moveaxis(res, 0, idx_axe)
+            # Operate the matrix multiplication by blocks of frequencies (DFT
+            # matrix blocks are cached) and move axis to keep the good shape
+            res = dft_tensordot(res, idx_axe, f, s, -1, tolerance)
 
             # Normalize by the number of frequencies
             res /= len(s)
@@ -78,7 +317,9 @@ def matrice_E(t: ndarray, f: ndarray) -> ndarray:
     return exp(1j * outer(t, f * 2 * pi))
 
 
-def inudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
+def inudftn(
+    a: ndarray, axes_dict: Dict[int, List[ndarray]], tolerance: float = None
+) -> ndarray:
     """
     Compute the non uniform discrete Fourier Transform
 
@@ -87,12 +328,13 @@ def inudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
 
     a: Input data
     axes_dict: Axes to perform dft with corresponding space and freqsampling
+    tolerance: Relative accuracy of the NUFFT used for large samplings
 
     Returns
     res: DFT result
     """
 
-    res = a.copy()
+    res = a
 
     # TODO check axes to perform ifft if space and freq sampling are matching
     # /!\ Normalization is done in inudft and not in fft, look in SciDataTool to find the
@@ -105,12 +347,9 @@ def inudftn(a: ndarray, axes_dict: Dict[int, List[ndarray]]) -> ndarray:
             # Extract space sampling and frequency sampling
             s, f = axes
 
-            # Construct DFT matrix
-            E = matrice_E(s, f)
-
-            # Operate the matrix multiplication and move axis to keep the good shape
-            res = tensordot(E, res, ((1,), (idx_axe)))
-            res = moveaxis(res, 0, idx_axe)
+            # Operate the matrix multiplication by blocks of time steps (DFT
+            # matrix blocks are cached) and move axis to keep the good shape
+            res = dft_tensordot(res, idx_axe, s, f, 1, tolerance)
 
     return res
 
@@ -0,0 +1,184 @@
+from math import ceil, log, log2, pi, sqrt
+
+from numpy import (
+    arange,
+    asarray,
+    complex64,
+    conj,
+    exp,
+    moveaxis,
+    repeat,
+    result_type,
+    rint,
+    zeros,
+)
+from scipy.fft import fft, next_fast_len
+from scipy.sparse import csr_matrix
+
+# Relative accuracy of the type-3 NUFFT (with respect to the sum of the magnitudes)
+NUFFT_TOLERANCE = 1e-9
+# Minimum number of operations of the direct DFT (len(time)*len(freqs)) to use NUFFT
+NUFFT_MIN_SIZE = 1e6
+
+
+def set_nufft(tolerance=None, min_size=None):
+    """Sets the parameters of the NUFFT used by nudftn and inudftn
+    Parameters
+    ----------
+    tolerance: float
+        relative accuracy of the NUFFT (unchanged if None)
+    min_size: float
+        minimum len(time)*len(freqs) to use the NUFFT instead of the direct DFT
+        (unchanged if None, inf to disable the NUFFT)
+    """
+    global NUFFT_TOLERANCE, NUFFT_MIN_SIZE
+    if tolerance is not None:
+        NUFFT_TOLERANCE = tolerance
+    if min_size is not None:
+        NUFFT_MIN_SIZE = min_size
+
+
+class NUFFTParams(object):
+    """Parameters of the type-3 NUFFT of the sampling x (input) to s (output)"""
+
+    def __init__(self, x, s, tolerance):
+        # Center the samplings: x = x0 + tau with |tau| <= T, s = s0 + phi with
+        # |phi| <= B
+        self.x0 = (x.max() + x.min()) / 2
+        self.s0 = (s.max() + s.min()) / 2
+        T = (x.max() - x.min()) / 2
+        B = (s.max() - s.min()) / 2
+        # Gaussian parameter such that aliasing is below tolerance with an
+        # oversampling of 2, and number of neighbours for truncation (errors are
+        # amplified by both deconvolutions, exp(alpha) each)
+        ln_tol = log(1 / tolerance)
+        alpha = ln_tol / 8
+        n_std = sqrt(2 * (2 * alpha + ln_tol))
+        # Spreading of tau on the uniform grid m*dtau, |m| <= M
+        self.dtau = 1 / (4 * B)
+        self.sigma_tau = sqrt(alpha / (2 * pi ** 2)) / B
+        self.K_tau = int(ceil(self.sigma_tau * n_std / self.dtau))
+        self.M = int(ceil(T / self.dtau)) + self.K_tau + 1
+        # FFT on the grid n*dphi and interpolation on phi
+        L = self.M * self.dtau
+        self.n_fft = next_fast_len(4 * self.M)
+        self.dphi = 1 / (self.n_fft * self.dtau)
+        self.sigma_phi = sqrt(alpha / (2 * pi ** 2)) / L
+        self.K_phi = int(ceil(self.sigma_phi * n_std / self.dphi))
+
+    def get_cost(self, n_x, n_s):
+        """Returns the number of operations of the NUFFT"""
+        return (
+            n_x * (2 * self.K_tau + 1)
+            + n_s * (2 * self.K_phi + 1)
+            + self.n_fft * log2(self.n_fft)
+        )
+
+
+def get_nufft_params(x, s, tolerance=None):
+    """Returns the NUFFT parameters if the NUFFT is faster than the direct DFT
+    Parameters
+    ----------
+    x: ndarray
+        input sampling (time for DFT)
+    s: ndarray
+        output sampling (frequencies for DFT)
+    tolerance: float
+        relative accuracy (NUFFT_TOLERANCE if None)
+    Returns
+    -------
+    NUFFTParams or None (direct DFT)
+    """
+    if len(x) * len(s) < NUFFT_MIN_SIZE:
+        return None
+    if tolerance is None:
+        tolerance = NUFFT_TOLERANCE
+    if x.max() == x.min() or s.max() == s.min():
+        return None
+    params = NUFFTParams(x, s, tolerance)
+    if params.get_cost(len(x), len(s)) >= len(x) * len(s):
+        return None
+    return params
+
+
+def nufft3(a, idx_axe, x, s, sign=-1, params=None, tolerance=None):
+    """Computes sum_j a_j*exp(sign*2i*pi*s_k*x_j) along axis idx_axe with the type-3
+    NUFFT: Gaussian spreading of x on a uniform grid, FFT on the oversampled grid,
+    Gaussian interpolation on s and deconvolution
+    Parameters
+    ----------
+    a: ndarray
+        input data
+    idx_axe: int
+        index of the axis to transform (size len(x))
+    x: ndarray
+        input sampling
+    s: ndarray
+        output sampling
+    sign: int
+        sign of the exponent (-1 for DFT, 1 for inverse DFT)
+    params: NUFFTParams
+        parameters of the NUFFT (computed with tolerance if None)
+    tolerance: float
+        relative accuracy (NUFFT_TOLERANCE if None)
+    Returns
+    -------
+    ndarray with len(s) values along idx_axe
+    """
+    if sign == 1:
+        return conj(nufft3(conj(a), idx_axe, x, s, -1, params, tolerance))
+    x = asarray(x, dtype=float)
+    s = asarray(s, dtype=float)
+    if params is None:
+        params = NUFFTParams(x, s, NUFFT_TOLERANCE if tolerance is None else tolerance)
+    dtype = result_type(a.dtype, complex64)
+    values = moveaxis(asarray(a), idx_axe, 0)
+    other_shape = values.shape[1:]
+    values = values.reshape(len(x), -1)
+
+    # Spread the shifted samples on the uniform grid with a Gaussian
+    tau = x - params.x0
+    values = values * exp(-2j * pi * params.s0 * tau)[:, None]
+    neighbours = arange(-params.K_tau, params.K_tau + 1)
+    m = rint(tau / params.dtau).astype(int)[:, None] + neighbours[None, :]
+    weights = exp(
+        -((m * params.dtau - tau[:, None]) ** 2) / (2 * params.sigma_tau ** 2)
+    )
+    rows = m.ravel() + params.M
+    cols = repeat(arange(len(x)), len(neighbours))
+    spread = csr_matrix(
+        (weights.ravel(), (rows, cols)), shape=(2 * params.M + 1, len(x))
+    )
+    grid = spread @ values
+
+    # Deconvolve the interpolation Gaussian and compute the FFT on the grid
+    tau_grid = arange(-params.M, params.M + 1) * params.dtau
+    grid *= (
+        params.dtau
+        / (params.sigma_phi * sqrt(2 * pi))
+        * exp(2 * pi ** 2 * params.sigma_phi ** 2 * tau_grid ** 2)
+    )[:, None]
+    grid_fft = zeros((params.n_fft, grid.shape[1]), dtype=complex)
+    grid_fft[arange(-params.M, params.M + 1) % params.n_fft] = grid
+    grid_fft = fft(grid_fft, axis=0)
+
+    # Interpolate on the shifted output sampling with a Gaussian
+    phi = s - params.s0
+    neighbours = arange(-params.K_phi, params.K_phi + 1)
+    n = rint(phi / params.dphi).astype(int)[:, None] + neighbours[None, :]
+    weights = params.dphi * exp(
+        -((n * params.dphi - phi[:, None]) ** 2) / (2 * params.sigma_phi ** 2)
+    )
+    rows = repeat(arange(len(s)), len(neighbours))
+    cols = n.ravel() % params.n_fft
+    interp = csr_matrix((weights.ravel(), (rows, cols)), shape=(len(s), params.n_fft))
+    res = interp @ grid_fft
+
+    # Deconvolve the spreading Gaussian and shift back
+    res *= (
+        exp(2 * pi ** 2 * params.sigma_tau ** 2 * phi ** 2)
+        / (params.sigma_tau * sqrt(2 * pi))
+        * exp(-2j * pi * s * params.x0)
+    )[:, None]
+    res = res.astype(dtype, copy=False).reshape((len(s),) + other_shape)
+    return moveaxis(res, 0, idx_axe)
@@ -0,0 +1,107 @@
+from weakref import finalize
+
+from numpy import complex64, complex128, float32, float64, iscomplexobj, ndarray
+
+from SciDataTool.Functions.symmetries import SymmetricView
+
+# Real and complex dtypes of the available precisions
+PRECISIONS = {
+    "single": (float32, complex64),
+    "double": (float64, complex128),
+}
+
+# Precision policies of the Data objects (key is id of the object)
+precision_dict = dict()
+
+
+def check_precision(precision):
+    """Raises a ValueError if precision is not available"""
+    if precision is not None and precision not in PRECISIONS:
+        raise ValueError(
+            "Unknown precision "
+            + str(precision)
+            + ", available precisions are "
+            + ", ".join(PRECISIONS)
+        )
+
+
+def set_data_precision(data, precision):
+    """Sets the precision policy of a Data object
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    precision: str
+        "single" (float32/complex64), "double" (float64/complex128) or None (dtype
+        of the computations)
+    """
+    check_precision(precision)
+    key = id(data)
+    if precision is None:
+        precision_dict.pop(key, None)
+    else:
+        if key not in precision_dict:
+            finalize(data, precision_dict.pop, key, None)
+        precision_dict[key] = precision
+
+
+def get_data_precision(data, precision=None):
+    """Returns the precision of a request: precision if specified, otherwise the
+    policy of the Data object
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    precision: str
+        precision requested for the call
+    Returns
+    -------
+    str or None
+    """
+    check_precision(precision)
+    if precision is None:
+        return precision_dict.get(id(data))
+    return precision
+
+
+def get_fft_precision(precision):
+    """Returns the precision of the FFTs of a request: single precision is kept only
+    if requested, float32/complex64 fields are transformed in double precision
+    otherwise (as numpy.fft does, whatever the backend)
+    Parameters
+    ----------
+    precision: str
+        precision of the request ("single", "double" or None)
+    Returns
+    -------
+    str
+    """
+    if precision is None:
+        return "double"
+    return precision
+
+
+def cast_precision(values, precision):
+    """Returns values in the precision requested (no copy if already the case)
+    Parameters
+    ----------
+    values: ndarray or SymmetricView
+        array of the field
+    precision: str
+        "single", "double" or None (values are returned unchanged)
+    Returns
+    -------
+    ndarray or SymmetricView
+    """
+    if precision is None:
+        return values
+    elif isinstance(values, SymmetricView):
+        return SymmetricView(
+            cast_precision(values.values, precision),
+            values.axis_index,
+            values.get_symmetries(),
+        )
+    elif isinstance(values, ndarray) and values.dtype.kind in "fc":
+        dtype = PRECISIONS[precision][1 if iscomplexobj(values) else 0]
+        return values.astype(dtype, copy=False)
+    return values
@@ -0,0 +1,376 @@
+from collections import OrderedDict
+from copy import copy as shallow_copy
+from hashlib import blake2b
+from math import log2
+from threading import Lock
+
+from numpy import ndarray, around, array, ascontiguousarray, pi
+
+from SciDataTool.Classes._frozen import FrozenClass
+from SciDataTool.Functions.parser import read_input_strings
+from SciDataTool.Functions.fix_axes_order import fix_axes_order
+from SciDataTool.Functions.nudft_functions import is_czt_faster, is_uniform
+
+# Maximum number of compiled plans kept in memory
+PLAN_CACHE_SIZE = 256
+
+plan_cache = OrderedDict()
+plan_cache_lock = Lock()
+
+
+class QueryPlan(object):
+    """Compiled get_along request: parsed and resolved RequestedAxis templates
+    (indices, operations, transforms) ready for the numeric stages"""
+
+    def __init__(self, args, axes_list, transforms, pushdown=None, partial_fft=None):
+        self.args = args
+        self.axes_list = axes_list
+        self.transforms = transforms
+        # Axes sliced before the transforms {index: name}
+        if pushdown is None:
+            pushdown = dict()
+        self.pushdown = pushdown
+        # fft axes computed on the requested values only {index: "dft" or "czt"}
+        if partial_fft is None:
+            partial_fft = dict()
+        self.partial_fft = partial_fft
+        self.transform_key = None
+
+    def get_axes_list(self):
+        """Returns fresh copies of the RequestedAxis templates, since the
+        numeric stages of get_along modify them
+        Parameters
+        ----------
+        self: QueryPlan
+            a QueryPlan object
+        Returns
+        -------
+        list of RequestedAxis objects
+        """
+        return [copy_requested_axis(axis) for axis in self.axes_list]
+
+    def get_transform_key(self):
+        """Returns the signature of the field stages (slices before the transforms,
+        field, ifft, slices, fft): requests with the same signature share the
+        transformed field
+        Parameters
+        ----------
+        self: QueryPlan
+            a QueryPlan object
+        Returns
+        -------
+        hashable signature
+        """
+        if self.transform_key is None:
+            axes_key = []
+            for axis in self.axes_list:
+                axes_key.append(
+                    (
+                        axis.name,
+                        axis.corr_name,
+                        axis.index,
+                        axis.transform,
+                        axis.is_pattern,
+                        axis.extension if axis.is_pattern else None,
+                        fingerprint(axis.rebuild_indices),
+                        fingerprint(axis.values),
+                        fingerprint(axis.input_data),
+                        fingerprint(axis.corr_values),
+                        # fft axes are sliced after the transforms
+                        None
+                        if axis.transform == "fft"
+                        and axis.index not in self.partial_fft
+                        else fingerprint(axis.indices),
+                    )
+                )
+            self.transform_key = (
+                tuple(sorted(set(self.transforms))),
+                tuple(sorted(self.pushdown)),
+                tuple(axes_key),
+            )
+        return self.transform_key
+
+    def explain(self):
+        """Returns a readable description of the plan
+        Parameters
+        ----------
+        self: QueryPlan
+            a QueryPlan object
+        Returns
+        -------
+        list of str
+        """
+        lines = ["args: " + ", ".join(self.args)]
+        for axis in self.axes_list:
+            lines.append(
+                axis.name
+                + " -> "
+                + str(axis.corr_name)
+                + " (index="
+                + str(axis.index)
+                + ", extension="
+                + str(axis.extension)
+                + ", transform="
+                + str(axis.transform)
+                + ", operation="
+                + str(axis.operation)
+                + ")"
+            )
+        lines.append("stages: " + " -> ".join(self.get_stages()))
+        return lines
+
+    def get_stages(self):
+        """Returns the ordered stages of the numeric pipeline
+        Parameters
+        ----------
+        self: QueryPlan
+            a QueryPlan object
+        Returns
+        -------
+        list of str
+        """
+        stages = []
+        if self.pushdown:
+            stages.append("slices[" + ", ".join(self.pushdown.values()) + "]")
+        stages.append("field")
+        if "ifft" in self.transforms:
+            stages.append("ifft")
+        names = [
+            axis.name
+            for axis in self.axes_list
+            if axis.index not in self.pushdown and axis.transform != "fft"
+        ]
+        if names:
+            stages.append("slices[" + ", ".join(names) + "]")
+        if "fft" in self.transforms:
+            if self.partial_fft:
+                for axis in self.axes_list:
+                    if axis.index in self.partial_fft:
+                        stages.append(
+                            self.partial_fft[axis.index] + "[" + axis.name + "]"
+                        )
+            else:
+                stages.append("fft")
+                stages.append("slices_fft")
+        stages += ["symmetries", "interpolation", "operations", "conversion"]
+        return stages
+
+
+def copy_requested_axis(axis):
+    """Returns a copy of a RequestedAxis object, duplicating the mutable attributes
+    Parameters
+    ----------
+    axis: RequestedAxis
+        a RequestedAxis object
+    Returns
+    -------
+    a RequestedAxis object
+    """
+    axis_new = shallow_copy(axis)
+    for attr in ["values", "indices", "input_data", "corr_values"]:
+        value = getattr(axis, attr)
+        if value is not None:
+            setattr(axis_new, attr, value.copy())
+    return axis_new
+
+
+def fingerprint(obj):
+    """Returns a hashable fingerprint of obj (arrays are hashed by content)
+    Parameters
+    ----------
+    obj: object
+        dict, list, ndarray, scalar...
+    Returns
+    -------
+    hashable fingerprint
+    """
+    if isinstance(obj, ndarray):
+        if obj.dtype.hasobject:
+            return ("object", obj.shape, fingerprint(obj.tolist()))
+        digest = blake2b(ascontiguousarray(obj).view("uint8"), digest_size=16)
+        return (str(obj.dtype), obj.shape, digest.digest())
+    elif isinstance(obj, FrozenClass):
+        # SciDataTool object: fingerprint of its properties (except parent)
+        return (type(obj).__name__,) + tuple(
+            (key, fingerprint(value))
+            for key, value in sorted(vars(obj).items())
+            if key not in ["parent", "_FrozenClass__isfrozen"]
+        )
+    elif isinstance(obj, dict):
+        return tuple((key, fingerprint(obj[key])) for key in sorted(obj, key=str))
+    elif isinstance(obj, (list, tuple)):
+        return tuple(fingerprint(value) for value in obj)
+    else:
+        try:
+            hash(obj)
+            return obj
+        except TypeError:
+            return ("id", id(obj))
+
+
+def get_data_signature(data):
+    """Returns the signature of a Data object used to identify compiled plans
+    (shape of the field, axes and their symmetries/normalizations)
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    Returns
+    -------
+    hashable signature
+    """
+    shape = None if data.values is None else data.values.shape
+    return (type(data).__name__, data.is_real, shape, fingerprint(data.axes))
+
+
+def get_pushdown(data, axes_list):
+    """Returns the axes which can be sliced before the field is transformed: axes
+    not requested or requested without transform (DataPattern axes excluded)
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    axes_list: list
+        a list of RequestedAxis objects
+    Returns
+    -------
+    dict {index: name}
+    """
+    pushdown = dict()
+    for index, axis in enumerate(data.axes):
+        if all(
+            axis_requested.transform is None and not axis_requested.is_pattern
+            for axis_requested in axes_list
+            if axis_requested.corr_name == axis.name
+        ):
+            pushdown[index] = axis.name
+    return pushdown
+
+
+def get_partial_fft(data, axes_list, transforms):
+    """Returns the fft axes on which only the requested values are computed instead
+    of the whole FFT: single uniform fft axis requested on less than log2(n)
+    harmonics of the FFT grid (DFT of the bins, values requested on the grid are
+    replaced by their indices) or on values off the FFT grid (chirp-z transform if
+    they are uniform and it is faster than the DFT, DFT otherwise). Dense bands of
+    the FFT grid are sliced from the whole FFT, which is faster than the chirp-z
+    transform of the band.
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    axes_list: list
+        a list of RequestedAxis objects
+    transforms: list
+        transforms of the request
+    Returns
+    -------
+    dict {index: "dft" or "czt"}
+    """
+    axes_fft = [axis for axis in axes_list if axis.transform == "fft"]
+    if "ifft" in transforms or len(axes_fft) != 1:
+        return dict()
+    axis = axes_fft[0]
+    if (
+        axis.is_pattern
+        or axis.corr_values is None
+        or "antiperiod" in data.axes[axis.index].symmetries
+    ):
+        return dict()
+    n = len(axis.corr_values)
+    if n < 2 or not is_uniform(array(axis.corr_values)):
+        return dict()
+    if axis.input_data is not None:
+        if axis.indices is not None:
+            return dict()
+        # Requested values on the FFT grid (same check as comp_fftn)
+        values = array(axis.values, dtype=float)
+        input_data = array(axis.input_data, dtype=float)
+        grid = {value: i for i, value in enumerate(around(values, decimals=5))}
+        indices = [grid.get(value) for value in around(input_data, decimals=5)]
+        if None in indices:
+            # Values off the grid (zoom on a band if uniform)
+            freqs = input_data if axis.name == "freqs" else input_data / (2 * pi)
+            if is_czt_faster(freqs, array(axis.corr_values, dtype=float)):
+                return {axis.index: "czt"}
+            return {axis.index: "dft"}
+        if len(indices) >= log2(n):
+            return dict()
+        axis.indices = indices
+        axis.values = values[indices]
+        axis.input_data = None
+    if axis.indices is None or len(axis.indices) >= log2(n):
+        return dict()
+    return {axis.index: "dft"}
+
+
+def compile_query_plan(data, args, axis_data):
+    """Parses the requested axes and resolves them on the axes of data
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    args: list
+        list of strings describing the requested axes
+    axis_data: dict
+        user-input values for the axes
+    Returns
+    -------
+    a QueryPlan object
+    """
+    # Fix axes order
+    args = fix_axes_order([axis.name for axis in data.get_axes()], args)
+    axes_list = read_input_strings(args, axis_data)
+    # Extract the requested axes (symmetries + unit)
+    axes_list, transforms = data._comp_axes(axes_list)
+    return QueryPlan(
+        args,
+        axes_list,
+        transforms,
+        get_pushdown(data, axes_list),
+        get_partial_fft(data, axes_list, transforms),
+    )
+
+
+def get_query_plan(data, args, axis_data, unit="SI", is_norm=False):
+    """Returns the compiled plan of a get_along request, from cache if available
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    args: list
+        list of strings describing the requested axes
+    axis_data: dict
+        user-input values for the axes
+    unit: str
+        Unit requested by the user
+    is_norm: bool
+        Boolean indicating if the field must be normalized
+    Returns
+    -------
+    a QueryPlan object
+    """
+    key = (
+        get_data_signature(data),
+        tuple(args),
+        fingerprint(axis_data),
+        unit,
+        is_norm,
+    )
+    with plan_cache_lock:
+        plan = plan_cache.get(key)
+        if plan is not None:
+            plan_cache.move_to_end(key)
+            return plan
+    plan = compile_query_plan(data, args, axis_data)
+    with plan_cache_lock:
+        plan_cache[key] = plan
+        while len(plan_cache) > PLAN_CACHE_SIZE:
+            plan_cache.popitem(last=False)
+    return plan
+
+
+def clear_plan_cache():
+    """Removes all the compiled plans"""
+    with plan_cache_lock:
+        plan_cache.clear()
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from threading import Lock
+from weakref import finalize
+
+from numpy import ndarray, may_share_memory
+
+from SciDataTool.Functions.query_plan import (
+    copy_requested_axis,
+    fingerprint,
+    get_data_signature,
+)
+
+# Default memory budget of a result cache [bytes]
+CACHE_MAX_BYTES = 100e6
+
+# Result caches of the Data objects (key is id of the object)
+cache_dict = dict()
+
+
+class ResultCache(object):
+    """LRU cache of get_along results with a memory budget"""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.version = 0
+        self.nbytes = 0
+        self.results = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        """Returns a copy of the cached result or None"""
+        with self.lock:
+            item = self.results.get(key)
+            if item is None:
+                return None
+            self.results.move_to_end(key)
+        return copy_result(item[0])
+
+    def put(self, key, result):
+        """Stores a result, removing the least recently used ones if needed"""
+        nbytes = get_result_nbytes(result)
+        if nbytes > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.results:
+                self.nbytes -= self.results.pop(key)[1]
+            self.results[key] = (result, nbytes)
+            self.nbytes += nbytes
+            self.evict()
+
+    def evict(self):
+        """Removes the least recently used results until the budget is met"""
+        while self.nbytes > self.max_bytes:
+            self.nbytes -= self.results.popitem(last=False)[1][1]
+
+    def clear(self):
+        """Removes all the stored results"""
+        with self.lock:
+            self.results.clear()
+            self.nbytes = 0
+
+
+def get_result_nbytes(result):
+    """Returns the memory size of the arrays of a get_along result"""
+    return sum(value.nbytes for value in result.values() if isinstance(value, ndarray))
+
+
+def copy_result(result):
+    """Returns a new result dict sharing the (read-only) arrays of result"""
+    result_new = dict(result)
+    if "axes_list" in result:
+        result_new["axes_list"] = [
+            copy_requested_axis(axis) for axis in result["axes_list"]
+        ]
+    if "axes_dict_other" in result:
+        result_new["axes_dict_other"] = result["axes_dict_other"].copy()
+    return result_new
+
+
+def enable_result_cache(data, max_bytes=CACHE_MAX_BYTES):
+    """Creates (or resizes) the result cache of a Data object
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    max_bytes: float
+        memory budget of the cache [bytes]
+    """
+    key = id(data)
+    if key in cache_dict:
+        cache = cache_dict[key]
+        with cache.lock:
+            cache.max_bytes = max_bytes
+            cache.evict()
+    else:
+        cache_dict[key] = ResultCache(max_bytes=max_bytes)
+        finalize(data, cache_dict.pop, key, None)
+
+
+def disable_result_cache(data):
+    """Removes the result cache of a Data object"""
+    cache = cache_dict.pop(id(data), None)
+    if cache is not None:
+        cache.clear()
+
+
+def bump_version(data):
+    """Invalidates the cached results of a Data object (values or axes changed)"""
+    cache = cache_dict.get(id(data))
+    if cache is not None:
+        cache.version += 1
+        cache.clear()
+
+
+def get_result_key(data, method, args, axis_data, **kwargs):
+    """Returns the key of a request in the result cache of data, None if disabled
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    method: str
+        name of the method ("get_along", "get_magnitude_along"...)
+    args: list
+        list of strings describing the requested axes
+    axis_data: dict
+        user-input values for the axes
+    Returns
+    -------
+    hashable key or None
+    """
+    cache = cache_dict.get(id(data))
+    if cache is None:
+        return None
+    return (
+        cache.version,
+        get_data_signature(data),
+        method,
+        tuple(args),
+        fingerprint(axis_data),
+        fingerprint(kwargs),
+    )
+
+
+def get_cached_result(data, key):
+    """Returns the cached result of a request or None"""
+    cache = cache_dict.get(id(data))
+    if cache is None or key is None:
+        return None
+    return cache.get(key)
+
+
+def set_cached_result(data, key, result):
+    """Stores the result of a request, the arrays are set read-only"""
+    cache = cache_dict.get(id(data))
+    if cache is None or key is None or key[0] != cache.version:
+        return
+    for name, value in result.items():
+        if isinstance(value, ndarray):
+            if isinstance(data.values, ndarray) and may_share_memory(
+                value, data.values
+            ):
+                value = value.copy()
+                result[name] = value
+            value.flags.writeable = False
+    cache.put(key, copy_result(result))
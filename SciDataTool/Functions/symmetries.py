@@ -1,5 +1,215 @@
 from SciDataTool.Functions import AxisError
-from numpy import tile, concatenate, negative, ones, append
+from numpy import (
+    tile,
+    concatenate,
+    negative,
+    ones,
+    append,
+    array,
+    take,
+    where,
+    empty,
+    expand_dims,
+    abs as np_abs,
+    asarray,
+)
+
+
+class SymmetricView(object):
+    """Lazy view of a field reconstructed along one axis with symmetries: only the
+    smallest period is stored, the reconstructed field is allocated on demand"""
+
+    def __init__(self, values, axis_index, symmetries):
+        self.values = values
+        self.axis_index = axis_index
+        if "period" in symmetries:
+            self.nper = symmetries["period"]
+            self.is_antiper = False
+        elif "antiperiod" in symmetries:
+            self.nper = symmetries["antiperiod"]
+            self.is_antiper = True
+        else:
+            self.nper = 1
+            self.is_antiper = False
+
+    @property
+    def shape(self):
+        shape = list(self.values.shape)
+        shape[self.axis_index] *= self.nper
+        return tuple(shape)
+
+    @property
+    def ndim(self):
+        return self.values.ndim
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    def get_symmetries(self):
+        """Returns the symmetries dict of the view"""
+        if self.is_antiper:
+            return {"antiperiod": self.nper}
+        else:
+            return {"period": self.nper}
+
+    def materialize(self):
+        """Returns the reconstructed field (single allocation)
+        Parameters
+        ----------
+        self: SymmetricView
+            a SymmetricView object
+        Returns
+        -------
+        ndarray of the reconstructed field
+        """
+        shape = self.values.shape
+        index = self.axis_index
+        out = empty(self.shape, dtype=self.values.dtype)
+        # Each period is a slice along a new dimension of the output
+        out_per = out.reshape(shape[:index] + (self.nper,) + shape[index:])
+        values = expand_dims(self.values, index)
+        if self.is_antiper:
+            # Even half periods are stored values, odd ones are opposite
+            slices = [slice(None)] * out_per.ndim
+            slices[index] = slice(0, None, 2)
+            out_per[tuple(slices)] = values
+            slices[index] = slice(1, None, 2)
+            negative(values, out=out_per[tuple(slices)])
+        else:
+            out_per[...] = values
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        """Returns the reconstructed field (numpy array protocol: copy=False raises a
+        ValueError if the field must be reconstructed or cast)"""
+        if self.nper == 1 and not copy:
+            values = asarray(self.values)
+        elif copy is False:
+            raise ValueError(
+                "Unable to avoid copy while reconstructing the field of a SymmetricView"
+            )
+        else:
+            values = self.materialize()
+        if dtype is not None and values.dtype != dtype:
+            if copy is False:
+                raise ValueError(
+                    "Unable to avoid copy while casting the field of a SymmetricView"
+                )
+            values = values.astype(dtype)
+        return values
+
+    def take(self, indices, axis=None, out=None, mode="raise"):
+        """Extracts indices along one axis, without reconstructing the field
+        Parameters
+        ----------
+        self: SymmetricView
+            a SymmetricView object
+        indices: list
+            indices to extract (of the reconstructed field)
+        axis: int
+            index of the axis
+        Returns
+        -------
+        ndarray or SymmetricView
+        """
+        if out is not None:
+            return take(self.materialize(), indices, axis=axis, out=out, mode=mode)
+        elif axis == self.axis_index:
+            return take_symmetries(
+                self.values, indices, self.axis_index, self.get_symmetries()
+            )
+        elif axis is None:
+            return take(self.materialize(), indices, mode=mode)
+        else:
+            return self.wrap(take(self.values, indices, axis=axis, mode=mode), axis)
+
+    def wrap(self, values, axis_index):
+        """Returns a view with the same symmetries on values computed from the stored
+        values along another axis (possibly removed)
+        Parameters
+        ----------
+        self: SymmetricView
+            a SymmetricView object
+        values: ndarray
+            new stored values
+        axis_index: int
+            index of the axis along which values have been computed
+        Returns
+        -------
+        SymmetricView
+        """
+        index = self.axis_index
+        if values.ndim < self.values.ndim and axis_index < index:
+            index -= 1
+        return SymmetricView(values, index, self.get_symmetries())
+
+    def apply_along(self, func, axis_index, *args, is_linear=True):
+        """Applies func along an axis, on the stored values if the result is
+        unchanged by the symmetries (other axis, linear func if antiperiodic)
+        Parameters
+        ----------
+        self: SymmetricView
+            a SymmetricView object
+        func: function
+            function of the values (first argument)
+        axis_index: int
+            index of the axis along which func applies
+        args: list
+            other arguments of func
+        is_linear: bool
+            True if func is linear
+        Returns
+        -------
+        ndarray or SymmetricView
+        """
+        if axis_index == self.axis_index or (self.is_antiper and not is_linear):
+            return func(self.materialize(), *args)
+        else:
+            return self.wrap(func(self.values, *args), axis_index)
+
+    def abs(self):
+        """Returns the view of the absolute values (periodic)"""
+        return SymmetricView(
+            np_abs(self.values), self.axis_index, {"period": self.nper}
+        )
+
+    def rebuild(self, axis_index, symmetries):
+        """Reconstructs the stored values along another axis"""
+        return self.wrap(
+            rebuild_symmetries(self.values, axis_index, symmetries), axis_index
+        )
+
+
+def get_symmetric_view(values, axis_index, symmetries):
+    """Returns a lazy view of the field reconstructed along one axis
+    Parameters
+    ----------
+    values: ndarray or SymmetricView
+        field
+    axis_index: int
+        Index of the axis along which the symmetry is made
+    symmetries: dict
+        Dictionary of the symmetries along one axis
+    Returns
+    -------
+    SymmetricView or ndarray (no symmetry)
+    """
+    if "period" not in symmetries and "antiperiod" not in symmetries:
+        return values
+    elif isinstance(values, SymmetricView):
+        # Only one lazy axis: other ones are reconstructed on the stored values
+        return values.rebuild(axis_index, symmetries)
+    else:
+        return SymmetricView(values, axis_index, symmetries)
+
+
+def materialize(values):
+    """Returns the reconstructed field if values is a SymmetricView"""
+    if isinstance(values, SymmetricView):
+        return values.materialize()
+    else:
+        return values
 
 
 def rebuild_symmetries(values, axis_index, symmetries):
@@ -16,15 +226,59 @@ def rebuild_symmetries(values, axis_index, symmetries):
     -------
     ndarray of the reconstructed field
     """
-    if "period" in symmetries.keys():
-        values = mytile(values, symmetries.get("period"), axis_index)
-    elif "antiperiod" in symmetries.keys():
-        values2 = concatenate((values, negative(values)), axis=axis_index)
-        values3 = mytile(values2, symmetries.get("antiperiod") // 2, axis_index)
-        if symmetries.get("antiperiod") % 2 == 1:
-            values = concatenate((values3, values), axis=axis_index)
-        else:
-            values = values3
+    if "period" in symmetries.keys() or "antiperiod" in symmetries.keys():
+        values = SymmetricView(values, axis_index, symmetries).materialize()
+    return values
+
+
+def get_indices_symmetries(indices, n, symmetries):
+    """Maps indices of the reconstructed axis onto the stored smallest period
+    Parameters
+    ----------
+    indices: list
+        indices requested on the reconstructed axis
+    n: int
+        number of stored samples along the axis
+    symmetries: dict
+        Dictionary of the symmetries along the axis
+    Returns
+    -------
+    ndarray of indices in the stored period, ndarray of signs (None if not antiperiodic)
+    """
+    indices = array(indices)
+    if "antiperiod" in symmetries:
+        # Odd half periods are stored with opposite sign
+        signs = where((indices // n) % 2 == 0, 1, -1)
+        return indices % n, signs
+    else:
+        return indices % n, None
+
+
+def take_symmetries(values, indices, axis_index, symmetries):
+    """Extracts indices of the reconstructed field without rebuilding the symmetries
+    Parameters
+    ----------
+    values: ndarray
+        ndarray of a field (smallest period along axis_index)
+    indices: list
+        indices requested on the reconstructed axis
+    axis_index: int
+        Index of the axis along which the symmetry is made
+    symmetries: dict
+        Dictionary of the symmetries along one axis
+    Returns
+    -------
+    ndarray of the extracted field
+    """
+    indices_sym, signs = get_indices_symmetries(
+        indices, values.shape[axis_index], symmetries
+    )
+    values = take(values, indices_sym, axis=axis_index)
+    if signs is not None and (signs < 0).any():
+        values = asarray(values)  # Read LazyValues
+        shape = ones(values.ndim, dtype=int)
+        shape[axis_index] = signs.size
+        values *= signs.reshape(shape)
     return values
 
 
@@ -0,0 +1,97 @@
+from threading import Lock
+
+from numpy import ndarray
+
+from SciDataTool.Functions.query_plan import copy_requested_axis
+
+# Memos of the transformed fields shared by a batch of requests (key is id of the
+# object), opened by DataND.get_along_many
+memo_dict = dict()
+memo_lock = Lock()
+
+# Attributes of the RequestedAxis objects modified by the transforms
+TRANSFORMED_ATTRIBUTES = ["transform", "values", "input_data"]
+
+
+def open_transform_memo(data):
+    """Starts sharing the transformed fields between the get_along calls of data
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    Returns
+    -------
+    True if the memo has been opened, False if it was already open
+    """
+    with memo_lock:
+        if id(data) in memo_dict:
+            return False
+        memo_dict[id(data)] = dict()
+        return True
+
+
+def clear_transform_memo(data):
+    """Removes the stored transformed fields of data (memo stays open)"""
+    with memo_lock:
+        if id(data) in memo_dict:
+            memo_dict[id(data)] = dict()
+
+
+def close_transform_memo(data):
+    """Stops sharing the transformed fields between the get_along calls of data"""
+    with memo_lock:
+        memo_dict.pop(id(data), None)
+
+
+def get_transformed(data, key, axes_list):
+    """Returns the transformed field stored for key (None if not available) and
+    updates axes_list as the transforms would have done
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    key: tuple
+        transform signature of the request (see QueryPlan.get_transform_key), memo
+        not used if None
+    axes_list: list
+        a list of RequestedAxis objects
+    Returns
+    -------
+    values: ndarray
+        transformed field, None if not in the memo
+    axes_dict_other: dict
+        axes which were not requested, None if not in the memo
+    """
+    memo = memo_dict.get(id(data))
+    if memo is None or key is None or key not in memo:
+        return None, None
+    values, axes_states, axes_dict_other = memo[key]
+    for axis, state in zip(axes_list, axes_states):
+        for attr, value in zip(TRANSFORMED_ATTRIBUTES, state):
+            setattr(axis, attr, value.copy() if isinstance(value, ndarray) else value)
+    return values.copy(), axes_dict_other.copy()
+
+
+def set_transformed(data, key, values, axes_list, axes_dict_other):
+    """Stores the transformed field of a request if the memo of data is open
+    Parameters
+    ----------
+    data: DataND
+        a DataND object
+    key: tuple
+        transform signature of the request (see QueryPlan.get_transform_key)
+    values: ndarray
+        transformed field
+    axes_list: list
+        a list of RequestedAxis objects (after the transforms)
+    axes_dict_other: dict
+        axes which were not requested
+    """
+    memo = memo_dict.get(id(data))
+    if memo is None or key is None:
+        return
+    axes_states = [
+        [getattr(copy_requested_axis(axis), attr) for attr in TRANSFORMED_ATTRIBUTES]
+        for axis in axes_list
+    ]
+    memo[key] = (values.copy(), axes_states, axes_dict_other.copy())
@@ -1,5 +1,5 @@
 from importlib import import_module
-from numpy import array
+from numpy import asarray
 
 from SciDataTool.Functions.conversions import convert
 from SciDataTool.Functions.symmetries import rebuild_symmetries_axis
@@ -91,7 +91,7 @@ def get_values(
     if operation is not None:
         module = import_module("SciDataTool.Functions.conversions")
         func = getattr(module, operation)  # Conversion function
-        values = array(func(values, is_real=is_real))
+        values = asarray(func(values, is_real=is_real))
         if is_full and (self.name == "freqs" or self.name == "wavenumber"):
             if "period" in self.symmetries:
                 if self.name != "time":
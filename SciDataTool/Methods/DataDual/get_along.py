@@ -10,6 +10,9 @@ def get_along(
     is_squeeze=True,
     is_magnitude=False,
     corr_unit=None,
+    precision=None,
+    is_scattered=False,
+    interp="linear",
 ):
     """Returns the ndarray of the field, using conversions and symmetries if needed.
     Parameters
@@ -24,6 +27,14 @@ def get_along(
         Boolean indicating if the field must be normalized (False by default)
     axis_data: list
         list of ndarray corresponding to user-input data
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
+    is_scattered: bool
+        True if the values requested along the interpolated axes are the coordinates
+        of points, False for the grid of all combinations
+    interp: str
+        interpolation of the axes which are not patterns: "linear" or "fourier"
     Returns
     -------
     list of 1Darray of axes values, ndarray of field values
@@ -58,4 +69,7 @@ def get_along(
         is_squeeze=is_squeeze,
         is_magnitude=is_magnitude,
         corr_unit=corr_unit,
+        precision=precision,
+        is_scattered=is_scattered,
+        interp=interp,
     )
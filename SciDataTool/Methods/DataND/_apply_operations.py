@@ -1,4 +1,4 @@
-from numpy import abs as np_abs, nanmax, nanmin
+from numpy import abs as np_abs, nanmax, nanmin, asarray
 
 from SciDataTool.Functions.derivation_integration import (
     derivate,
@@ -13,6 +13,23 @@ from SciDataTool.Functions.sum_mean import (
     root_mean_square,
     root_sum_square,
 )
+from SciDataTool.Functions.symmetries import SymmetricView
+
+# Operations which do not commute with a change of sign
+NONLINEAR_OPERATIONS = ["max", "min", "rss", "rms"]
+
+OPERATIONS = [
+    "max",
+    "min",
+    "sum",
+    "rss",
+    "mean",
+    "rms",
+    "integrate",
+    "integrate_local",
+    "antiderivate",
+    "derivate",
+]
 
 
 def _apply_operations(self, values, axes_list, is_magnitude, unit, corr_unit):
@@ -21,17 +38,20 @@ def _apply_operations(self, values, axes_list, is_magnitude, unit, corr_unit):
     ----------
     self: Data
         a Data object
-    values: ndarray
+    values: ndarray or SymmetricView
         array of the field
     Returns
     -------
-    values: ndarray
+    values: ndarray or SymmetricView
         values of the field
     """
 
     # Take magnitude before summing
     if is_magnitude and "dB" not in unit:
-        values = np_abs(values)
+        if isinstance(values, SymmetricView):
+            values = values.abs()
+        else:
+            values = np_abs(values)
 
     # Apply sums, means, etc
     for axis_requested in axes_list:
@@ -56,6 +76,17 @@ def _apply_operations(self, values, axes_list, is_magnitude, unit, corr_unit):
             is_fft = True
         else:
             is_fft = False
+        # Operations along other axes than the symmetric one are done on the
+        # stored period of a SymmetricView
+        view = None
+        if isinstance(values, SymmetricView) and extension in OPERATIONS:
+            if index == values.axis_index or (
+                values.is_antiper and extension in NONLINEAR_OPERATIONS
+            ):
+                values = values.materialize()
+            else:
+                view = values
+                values = view.values
         # max over max axes
         if extension in "max":
             values = nanmax(values, axis=index)
@@ -108,8 +139,11 @@ def _apply_operations(self, values, axes_list, is_magnitude, unit, corr_unit):
         # derivation over derivation axes
         elif extension == "derivate":
             values = derivate(values, ax_val, index, Nper, is_aper, is_phys, is_freqs)
+        if view is not None:
+            values = view.wrap(values, index)
 
     if is_magnitude and "dB" in unit:  # Correction for negative/small dB/dBA
+        values = asarray(values)
         values[values < 2] = 0
         values = np_abs(values)
 
@@ -1,7 +1,10 @@
 from numpy import take
 
+from SciDataTool.Functions.lazy_values import read_values
+from SciDataTool.Functions.symmetries import take_symmetries
 
-def _extract_slices(self, values, axes_list):
+
+def _extract_slices(self, values, axes_list, axes_indices=None):
     """Returns the values of the field (with symmetries and transformations).
     Parameters
     ----------
@@ -11,6 +14,8 @@ def _extract_slices(self, values, axes_list):
         array of the field
     axes_list: list
         a list of RequestedAxis objects
+    axes_indices: list
+        indices of the axes to slice (all axes if None)
     Returns
     -------
     values: ndarray
@@ -21,6 +26,8 @@ def _extract_slices(self, values, axes_list):
 
     # Extract the slices of the field
     for index, axis in enumerate(self.axes):
+        if axes_indices is not None and index not in axes_indices:
+            continue
         is_match = False
         for axis_requested in axes_list:
             if axis.name == axis_requested.corr_name:
@@ -29,8 +36,19 @@ def _extract_slices(self, values, axes_list):
                     axis_requested.indices is not None
                     and axis_requested.transform != "fft"
                 ):
-                    values = take(values, axis_requested.indices, axis=index)
+                    if max(axis_requested.indices) >= values.shape[index] and getattr(
+                        axis, "symmetries", None
+                    ):
+                        # Requested indices are among other periods: map them
+                        # onto the stored period instead of rebuilding the field
+                        values = take_symmetries(
+                            values, axis_requested.indices, index, axis.symmetries
+                        )
+                    else:
+                        values = take(values, axis_requested.indices, axis=index)
         if not is_match:  # Axis was not specified -> take slice at the first value
             axes_dict_other[axis.name] = [axis.get_values()[0], axis.unit]
             values = take(values, [0], axis=index)
+    # Read the selected hyperslab if values are stored out of core
+    values = read_values(values)
     return values, axes_dict_other
@@ -1,7 +1,7 @@
 from numpy import take
 
 
-def _extract_slices_fft(self, values, axes_list):
+def _extract_slices_fft(self, values, axes_list, partial_axes=[]):
     """Returns the values of the field (with symmetries and transformations).
     Parameters
     ----------
@@ -11,6 +11,8 @@ def _extract_slices_fft(self, values, axes_list):
         array of the field
     axes_list: list
         a list of RequestedAxis objects
+    partial_axes: dict
+        indices of the fft axes already computed on the requested values
     Returns
     -------
     values: ndarray
@@ -26,6 +28,7 @@ def _extract_slices_fft(self, values, axes_list):
                 if (
                     axis_requested.indices is not None
                     and axis_requested.transform == "fft"
+                    and index not in partial_axes
                 ):
                     values = take(values, axis_requested.indices, axis=index)
         if not is_match:  # Axis was not specified -> take slice at the first value
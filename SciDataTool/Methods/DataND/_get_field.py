@@ -1,8 +1,9 @@
 from numpy import take
+from SciDataTool.Functions.lazy_values import read_values
 from SciDataTool.Functions.symmetries import rebuild_symmetries
 
 
-def _get_field(self, axes_list):
+def _get_field(self, axes_list, values=None, antiper_axes=[]):
     """Returns the values of the field (with symmetries and sums).
     Parameters
     ----------
@@ -10,13 +11,19 @@ def _get_field(self, axes_list):
         a Data object
     axes_list: list
         a list of RequestedAxis objects
+    values: ndarray
+        values of the field already sliced (self.values if None)
+    antiper_axes: list
+        indices of the anti-periodic axes kept on the half period (transformed by
+        comp_fftn without rebuilding the period)
     Returns
     -------
     values: ndarray
         values of the field
     """
 
-    values = self.values
+    if values is None:
+        values = read_values(self.values)
     for axis_requested in axes_list:
         # Rebuild symmetries when needed
         axis_symmetries = self.axes[axis_requested.index].symmetries
@@ -39,18 +46,17 @@ def _get_field(self, axes_list):
         ):
             # DataPattern case where all values are requested
             values = take(values, axis_requested.rebuild_indices, axis_requested.index)
-        elif axis_requested.transform == "fft" and "antiperiod" in axis_symmetries:
+        elif (
+            axis_requested.transform == "fft"
+            and "antiperiod" in axis_symmetries
+            and axis_requested.index not in antiper_axes
+        ):
             # FFT case if axis is anti-periodic
             nper = axis_symmetries["antiperiod"]
             axis_symmetries["antiperiod"] = 2
             values = rebuild_symmetries(values, axis_requested.index, axis_symmetries)
             axis_symmetries["antiperiod"] = nper
-        elif (
-            axis_requested.indices is not None
-            and max(axis_requested.indices) > values.shape[axis_requested.index]
-        ):
-            # Slicing case where requested indices are among other periods
-            values = rebuild_symmetries(values, axis_requested.index, axis_symmetries)
-            self.axes[axis_requested.index].symmetries = dict()
+        # Slicing case where requested indices are among other periods is handled
+        # in _extract_slices without rebuilding the field
 
     return values
@@ -1,49 +1,221 @@
+from numpy import asarray, isclose, pi
+
+from SciDataTool.Functions import AxisError
 from SciDataTool.Functions.interpolations import (
+    get_fourier_interpolation,
     get_interpolation,
+    get_interpolation_operator,
     get_interpolation_step,
+    get_multilinear_interpolation,
 )
+from SciDataTool.Functions.nudft_functions import is_uniform
+from SciDataTool.Functions.symmetries import SymmetricView, get_indices_symmetries
+
+# Interpolation methods of the axes which are not patterns
+INTERP_METHODS = ["linear", "fourier"]
 
 
-def _interpolate(self, values, axes_list):
+def _interpolate(self, values, axes_list, is_scattered=False, interp="linear"):
     """Returns the values of the field interpolated over the axes values.
     Parameters
     ----------
     self: Data
         a Data object
-    values: ndarray
+    values: ndarray or SymmetricView
         array of the field
     axes_list: list
         a list of RequestedAxis objects
+    is_scattered: bool
+        True if the values requested along the interpolated axes are the coordinates
+        of points (results along the first interpolated axis), False for the grid
+        of all combinations
+    interp: str
+        "linear" or "fourier" (band-limited interpolation along the uniform periodic
+        axes: "angle" sampled on the whole circumference or axes with symmetries,
+        linear along the other axes and angular sectors)
     Returns
     -------
-    values: ndarray
+    values: ndarray or SymmetricView
         values of the field
     """
 
-    # Interpolate over axis values
+    # Step interpolation (patterns) along each axis
+    for axis_requested in axes_list:
+        if axis_requested.input_data is not None and axis_requested.is_step:
+            values = interpolate_along(values, axis_requested, get_interpolation_step)
+
+    # Linear (or Fourier) interpolation along the other axes
+    axes_interp = [
+        axis
+        for axis in axes_list
+        if axis.input_data is not None
+        and not axis.is_step
+        and str(axis.values) != "whole"
+    ]
+    if interp not in INTERP_METHODS:
+        raise ValueError("interp must be in " + str(INTERP_METHODS))
+    elif interp == "fourier":
+        if is_scattered:
+            raise AxisError("Scattered points require linear interpolation")
+        # Fourier interpolation along the uniform periodic axes
+        axes_sym = [
+            axis.name
+            for axis in self.axes
+            if "period" in axis.symmetries or "antiperiod" in axis.symmetries
+        ]
+        for axis_requested in list(axes_interp):
+            axis_values = asarray(axis_requested.values, dtype=float)
+            if len(axis_values) < 2 or not is_uniform(axis_values):
+                continue
+            # Without symmetries, the angle must be sampled on the whole
+            # circumference (linear interpolation of angular sectors)
+            n = len(axis_values)
+            if axis_requested.name in axes_sym or (
+                axis_requested.name == "angle"
+                and isclose(n * (axis_values[1] - axis_values[0]), 2 * pi)
+            ):
+                values = interpolate_fourier(values, axis_requested)
+                axes_interp.remove(axis_requested)
+    axes_interp.sort(key=lambda axis: axis.index)
+    operators = [
+        get_interpolation_operator(axis.values, axis.input_data)
+        for axis in axes_interp
+    ]
+    if is_scattered and len(set(len(axis.input_data) for axis in axes_interp)) > 1:
+        raise AxisError(
+            "The same number of values must be requested along the interpolated axes"
+        )
+    if len(axes_interp) > 1 and (
+        is_scattered or any(operator.kind == "linear" for operator in operators)
+    ):
+        values = interpolate_multilinear(values, axes_interp, operators, is_scattered)
+    else:
+        for axis_requested in axes_interp:
+            values = interpolate_along(values, axis_requested, get_interpolation)
+
+    # Store new axis data into axis_requested.values
     for axis_requested in axes_list:
         if axis_requested.input_data is not None:
-            if axis_requested.is_step:
-                # values = apply_along_axis(
-                #     get_interpolation_step,
-                #     axis_requested.index,
-                #     values,
-                #     axis_requested.values,
-                #     axis_requested.input_data,
-                # )
-                values = get_interpolation_step(
-                    values,
-                    axis_requested.values,
-                    axis_requested.input_data,
-                    axis_requested.index,
-                )
-            else:
-                values = get_interpolation(
-                    values,
-                    axis_requested.values,
-                    axis_requested.input_data,
-                    axis_requested.index,
-                )
-            # Store new axis data into axis_requested.values
             axis_requested.values = axis_requested.input_data
     return values
+
+
+def interpolate_along(values, axis_requested, interpolation):
+    """Returns the values of the field interpolated along one axis
+    Parameters
+    ----------
+    values: ndarray or SymmetricView
+        array of the field
+    axis_requested: RequestedAxis
+        a RequestedAxis object
+    interpolation: function
+        interpolation function (get_interpolation or get_interpolation_step)
+    Returns
+    -------
+    values: ndarray or SymmetricView
+        values of the field
+    """
+    if isinstance(values, SymmetricView):
+        # Interpolation along other axes is done on the stored period
+        return values.apply_along(
+            interpolation,
+            axis_requested.index,
+            axis_requested.values,
+            axis_requested.input_data,
+            axis_requested.index,
+        )
+    else:
+        return interpolation(
+            values,
+            axis_requested.values,
+            axis_requested.input_data,
+            axis_requested.index,
+        )
+
+
+def interpolate_fourier(values, axis_requested):
+    """Returns the values of the field interpolated along one axis with its Fourier
+    series, on the stored period if the field is a SymmetricView along this axis
+    Parameters
+    ----------
+    values: ndarray or SymmetricView
+        array of the field
+    axis_requested: RequestedAxis
+        a RequestedAxis object
+    Returns
+    -------
+    values: ndarray or SymmetricView
+        values of the field
+    """
+    index = axis_requested.index
+    if isinstance(values, SymmetricView):
+        if values.axis_index != index:
+            return values.apply_along(
+                get_fourier_interpolation,
+                index,
+                axis_requested.values,
+                axis_requested.input_data,
+                index,
+            )
+        # Period (or anti-period) given by the symmetries
+        n = values.values.shape[index]
+        return get_fourier_interpolation(
+            values.values,
+            asarray(axis_requested.values)[:n],
+            axis_requested.input_data,
+            index,
+            is_antiper=values.is_antiper,
+        )
+    else:
+        return get_fourier_interpolation(
+            values, axis_requested.values, axis_requested.input_data, index
+        )
+
+
+def interpolate_multilinear(values, axes_interp, operators, is_scattered):
+    """Returns the values of the field interpolated along several axes in one pass
+    Parameters
+    ----------
+    values: ndarray or SymmetricView
+        array of the field
+    axes_interp: list
+        RequestedAxis objects of the interpolated axes (sorted by index)
+    operators: list
+        InterpOperator objects of the interpolated axes
+    is_scattered: bool
+        True if the values requested are the coordinates of points
+    Returns
+    -------
+    values: ndarray or SymmetricView
+        values of the field
+    """
+    indices = [axis.index for axis in axes_interp]
+    neighbours = [
+        operator.get_neighbours(values.shape[index])
+        for operator, index in zip(operators, indices)
+    ]
+    if any(neighbour is None for neighbour in neighbours):
+        # Single point out of the axis: NaN values
+        for axis_requested in axes_interp:
+            values = interpolate_along(values, axis_requested, get_interpolation)
+        return values
+    if isinstance(values, SymmetricView):
+        view = values
+        if view.axis_index not in indices:
+            return view.wrap(
+                get_multilinear_interpolation(
+                    view.values, indices, neighbours, is_scattered
+                ),
+                indices[0],
+            )
+        # Gather the neighbours in the stored period (opposite if antiperiodic)
+        i = indices.index(view.axis_index)
+        idx, weights = neighbours[i]
+        idx, signs = get_indices_symmetries(
+            idx, view.values.shape[view.axis_index], view.get_symmetries()
+        )
+        if signs is not None:
+            weights = weights * signs
+        neighbours[i] = (idx, weights)
+        values = view.values
+    return get_multilinear_interpolation(values, indices, neighbours, is_scattered)
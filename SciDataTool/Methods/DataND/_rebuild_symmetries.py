@@ -1,6 +1,4 @@
-from SciDataTool.Functions.symmetries import (
-    rebuild_symmetries as rebuild_symmetries_fct,
-)
+from SciDataTool.Functions.symmetries import get_symmetric_view
 
 from numpy import take
 
@@ -21,7 +19,7 @@ def _rebuild_symmetries(
         a list of RequestedAxis objects
     Returns
     -------
-    ndarray of the reconstructed field
+    ndarray or SymmetricView (lazy view) of the reconstructed field
     """
 
     for axis in axes_list:
@@ -46,13 +44,19 @@ def _rebuild_symmetries(
             )
         ):
             values = take(values, axis.rebuild_indices, axis.index)
-        elif axis.transform != "fft" and axis.extension in [
-            "whole",
-            "interval",
-            "oneperiod",
-            "antiperiod",
-            "smallestperiod",
-        ]:
+        elif (
+            axis.transform != "fft"
+            and axis.extension
+            in [
+                "whole",
+                "interval",
+                "oneperiod",
+                "antiperiod",
+                "smallestperiod",
+            ]
+            and axis.indices is None
+        ):
+            # If indices are defined, the slices are already extracted on the whole axis
             if axis.extension == "smallestperiod":
                 is_smallestperiod = True
                 is_oneperiod = False
@@ -81,8 +85,8 @@ def _rebuild_symmetries(
                 if "antiperiod" in axis_symmetries:
                     nper = axis_symmetries["antiperiod"]
                     axis_symmetries["antiperiod"] = 2
-                    values = rebuild_symmetries_fct(values, axis.index, axis_symmetries)
+                    values = get_symmetric_view(values, axis.index, axis_symmetries)
                     axis_symmetries["antiperiod"] = nper
             elif not is_smallestperiod and not is_antiperiod:
-                values = rebuild_symmetries_fct(values, axis.index, axis_symmetries)
+                values = get_symmetric_view(values, axis.index, axis_symmetries)
     return values
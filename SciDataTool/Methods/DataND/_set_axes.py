@@ -0,0 +1,32 @@
+from SciDataTool.Classes._check import check_var
+from SciDataTool.Functions.load import load_init_dict
+from SciDataTool.Functions.Load.import_class import import_class
+from SciDataTool.Functions.result_cache import bump_version
+
+
+def _set_axes(self, value):
+    """setter of axes"""
+    if type(value) is list:
+        for ii, obj in enumerate(value):
+            if isinstance(obj, str):  # Load from file
+                try:
+                    obj = load_init_dict(obj)[1]
+                except Exception as e:
+                    self.get_logger().error(
+                        "Error while loading " + obj + ", setting None instead"
+                    )
+                    obj = None
+                    value[ii] = None
+            if type(obj) is dict:
+                class_obj = import_class(
+                    "SciDataTool.Classes", obj.get("__class__"), "axes"
+                )
+                value[ii] = class_obj(init_dict=obj)
+            if value[ii] is not None:
+                value[ii].parent = self
+    if value == -1:
+        value = list()
+    check_var("axes", value, "[Data]")
+    self._axes = value
+    # Cached results are outdated
+    bump_version(self)
@@ -1,4 +1,6 @@
 from SciDataTool.Classes._check import check_dimensions, check_var
+from SciDataTool.Functions.lazy_values import LazyValues, is_lazy_source
+from SciDataTool.Functions.result_cache import bump_version
 from numpy import squeeze, array
 
 
@@ -11,10 +13,16 @@ def _set_values(self, value):
             value = array(value)
         except:
             pass
-    check_var("values", value, "ndarray")
+    elif is_lazy_source(value):
+        # memmap, h5py Dataset...: slices are read on demand
+        value = LazyValues(value)
+    if not isinstance(value, LazyValues):
+        check_var("values", value, "ndarray")
 
     # Check dimensions
     if value is not None:
         value = squeeze(value)
     value = check_dimensions(value, self.axes)
     self._values = value
+    # Cached results are outdated
+    bump_version(self)
@@ -1,8 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+
+from numpy import empty, result_type, squeeze, stack
+
 from SciDataTool.Functions.interpolations import get_common_base, get_interpolation
+from SciDataTool.Functions.query_plan import fingerprint
 
 
-def compare_along(self, *args, data_list=[], unit="SI", is_norm=False):
-    """Returns the ndarrays of both fields interpolated in the same axes, using conversions and symmetries if needed.
+def compare_along(
+    self, *args, data_list=[], unit="SI", is_norm=False, is_stack=False, workers=None
+):
+    """Returns the ndarrays of the fields interpolated in the same axes, using conversions and symmetries if needed.
     Parameters
     ----------
     self: Data
@@ -15,6 +23,12 @@ def compare_along(self, *args, data_list=[], unit="SI", is_norm=False):
         Unit requested by the user ("SI" by default)
     is_norm: bool
         Boolean indicating if the field must be normalized (False by default)
+    is_stack: bool
+        True to return the values of all the fields in one array under the symbol of
+        self (first axis: self then data_list), False for one array per field
+    workers: int
+        number of threads running the get_along of the fields (-1 for the number of
+        CPUs, sequential if None)
     Returns
     -------
     list of 1Darray of axis values, ndarrays of fields
@@ -22,40 +36,102 @@ def compare_along(self, *args, data_list=[], unit="SI", is_norm=False):
     if data_list == []:
         return self.get_along(args, unit=unit, is_norm=is_norm)
     else:
-        # Extract requested axes + field values
-        results = self.get_along(args, unit=unit, is_norm=is_norm)
-        values = results.pop(self.symbol)
-        axes_list = results.pop("axes_list")
-        axes_dict_other = results.pop("axes_dict_other")
-        axes = results
-        data_axis_values = []
-        data_values = []
-        return_dict = {}
-        for data in data_list:
-            results = data.get_along(args, unit=unit, is_norm=is_norm)
-            data_values.append(results.pop(data.symbol))
-            data_axis_values.append(results)
-        # Get the common bases
-        common_axis_values = {}
-        for axis in axes.keys():
-            common_axis_values[axis] = axes[axis]
-            for i, data in enumerate(data_list):
-                common_axis_values[axis] = get_common_base(
-                    common_axis_values[axis], data_axis_values[i][axis]
-                )
-            # Interpolate over common axis values
-            values = get_interpolation(values, axes[axis], common_axis_values[axis])
-            for i, data in enumerate(data_list):
-                data_values[i] = get_interpolation(
-                    data_values[i],
-                    data_axis_values[i][axis],
-                    common_axis_values[axis],
-                )
-            return_dict[axis] = common_axis_values[axis]
-        # Return axis and values
-        return_dict[self.symbol] = values
-        return_dict["axes_list"] = axes_list
-        return_dict["axes_dict_other"] = axes_dict_other
+        return comp_compare_along(
+            self, "get_along", args, data_list, unit, is_norm, is_stack, workers
+        )
+
+
+def comp_compare_along(
+    self, method, args, data_list, unit, is_norm, is_stack=False, workers=None
+):
+    """Extracts the fields with one of the get_along methods and interpolates them on
+    common axes, the fields with the same axes values being interpolated at once
+    Parameters
+    ----------
+    self: Data
+        a Data object
+    method: str
+        name of the extraction method ("get_along", "get_magnitude_along"...)
+    args: tuple
+        axes requested by the user
+    data_list: list
+        list of Data objects to compare
+    unit: str
+        Unit requested by the user
+    is_norm: bool
+        Boolean indicating if the field must be normalized
+    is_stack: bool
+        True to return the values of all the fields in one array
+    workers: int
+        number of threads running the extractions (sequential if None)
+    Returns
+    -------
+    dict of axis values and fields values
+    """
+
+    # Extract requested axes + field values
+    def extract(data):
+        return getattr(data, method)(args, unit=unit, is_norm=is_norm, is_squeeze=False)
+
+    fields = [self] + list(data_list)
+    if workers is None or workers == 1:
+        results_list = [extract(data) for data in fields]
+    else:
+        if workers == -1:
+            workers = cpu_count()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results_list = list(executor.map(extract, fields))
+    values_list = [
+        results.pop(data.symbol) for data, results in zip(fields, results_list)
+    ]
+    axes_list = results_list[0]["axes_list"]
+    return_dict = {}
+
+    # Get the common bases (operations such as sum or max are kept as strings)
+    axes_interp = []
+    for axis_requested in axes_list:
+        axis = axis_requested.name
+        if isinstance(results_list[0][axis], str):
+            return_dict[axis] = results_list[0][axis]
+        else:
+            return_dict[axis] = get_common_base(
+                *[results[axis] for results in results_list]
+            )
+            axes_interp.append(axis_requested)
+
+    # Interpolate over common axis values: the fields with the same axes values are
+    # stacked and interpolated together
+    groups = {}
+    for i, results in enumerate(results_list):
+        key = tuple(fingerprint(results[axis.name]) for axis in axes_interp)
+        key += (values_list[i].shape,)
+        groups.setdefault(key, []).append(i)
+    values_all = None
+    for indices in groups.values():
+        values = stack([values_list[i] for i in indices])
+        axes = results_list[indices[0]]
+        for axis_requested in axes_interp:
+            axis = axis_requested.name
+            values = get_interpolation(
+                values, axes[axis], return_dict[axis], axis_requested.index + 1
+            )
+        if values_all is None:
+            values_all = empty(
+                (len(fields),) + values.shape[1:],
+                dtype=result_type(*values_list),
+            )
+        values_all[indices] = values
+
+    # Return axis and values
+    shape = values_all.shape[:1] + squeeze(values_all[0]).shape
+    if is_stack:
+        return_dict[self.symbol] = values_all.reshape(shape)
+    else:
+        return_dict[self.symbol] = values_all[0].reshape(shape[1:])
         for i, data in enumerate(data_list):
-            return_dict[data.symbol + "_" + str(i)] = data_values[i]
-        return return_dict
+            return_dict[data.symbol + "_" + str(i)] = values_all[i + 1].reshape(
+                shape[1:]
+            )
+    return_dict["axes_list"] = axes_list
+    return_dict["axes_dict_other"] = results_list[0]["axes_dict_other"]
+    return return_dict
@@ -1,8 +1,10 @@
-from SciDataTool.Functions.interpolations import get_common_base, get_interpolation
+from SciDataTool.Methods.DataND.compare_along import comp_compare_along
 
 
-def compare_phase_along(self, *args, unit="SI", data_list=[], is_norm=False):
-    """Returns the ndarrays of both fields interpolated in the same axes, using conversions and symmetries if needed.
+def compare_phase_along(
+    self, *args, unit="SI", data_list=[], is_norm=False, is_stack=False, workers=None
+):
+    """Returns the ndarrays of the phase of the fields interpolated in the same axes, using conversions and symmetries if needed.
     Parameters
     ----------
     self: Data
@@ -15,6 +17,12 @@ def compare_phase_along(self, *args, unit="SI", data_list=[], is_norm=False):
         Unit requested by the user ("SI" by default)
     is_norm: bool
         Boolean indicating if the field must be normalized (False by default)
+    is_stack: bool
+        True to return the values of all the fields in one array under the symbol of
+        self (first axis: self then data_list), False for one array per field
+    workers: int
+        number of threads running the get_phase_along of the fields (-1 for the
+        number of CPUs, sequential if None)
     Returns
     -------
     list of 1Darray of axis values, ndarrays of fields
@@ -22,40 +30,13 @@ def compare_phase_along(self, *args, unit="SI", data_list=[], is_norm=False):
     if data_list == []:
         return self.get_phase_along(args, unit=unit, is_norm=is_norm)
     else:
-        # Extract requested axes + field values
-        results = self.get_phase_along(args, unit=unit, is_norm=is_norm)
-        values = results.pop(self.symbol)
-        axes_list = results.pop("axes_list")
-        axes_dict_other = results.pop("axes_dict_other")
-        axes = results
-        data_axis_values = []
-        data_values = []
-        return_dict = {}
-        for data in data_list:
-            results = data.get_phase_along(args, unit=unit, is_norm=is_norm)
-            data_values.append(results.pop(data.symbol))
-            data_axis_values.append(results)
-        # Get the common bases
-        common_axis_values = {}
-        for axis in axes.keys():
-            common_axis_values[axis] = axes[axis]
-            for i, data in enumerate(data_list):
-                common_axis_values[axis] = get_common_base(
-                    common_axis_values[axis], data_axis_values[i][axis]
-                )
-            # Interpolate over common axis values
-            values = get_interpolation(values, axes[axis], common_axis_values[axis])
-            for i, data in enumerate(data_list):
-                data_values[i] = get_interpolation(
-                    data_values[i],
-                    data_axis_values[i][axis],
-                    common_axis_values[axis],
-                )
-            return_dict[axis] = common_axis_values[axis]
-        # Return axis and values
-        return_dict[self.symbol] = values
-        return_dict["axes_list"] = axes_list
-        return_dict["axes_dict_other"] = axes_dict_other
-        for i, data in enumerate(data_list):
-            return_dict[data.symbol + "_" + str(i)] = data_values[i]
-        return return_dict
+        return comp_compare_along(
+            self,
+            "get_phase_along",
+            args,
+            data_list,
+            unit,
+            is_norm,
+            is_stack=is_stack,
+            workers=workers,
+        )
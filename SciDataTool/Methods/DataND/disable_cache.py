@@ -0,0 +1,11 @@
+from SciDataTool.Functions.result_cache import disable_result_cache
+
+
+def disable_cache(self):
+    """Disables the cache of the get_along results and frees the stored results
+    Parameters
+    ----------
+    self: DataND
+        a DataND object
+    """
+    disable_result_cache(self)
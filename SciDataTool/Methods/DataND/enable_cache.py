@@ -0,0 +1,14 @@
+from SciDataTool.Functions.result_cache import CACHE_MAX_BYTES, enable_result_cache
+
+
+def enable_cache(self, max_bytes=CACHE_MAX_BYTES):
+    """Enables the cache of the get_along, get_magnitude_along and get_phase_along results.
+    The cache is invalidated when values or axes are set. Cached arrays are read-only.
+    Parameters
+    ----------
+    self: DataND
+        a DataND object
+    max_bytes: float
+        Memory budget of the cache in bytes (least recently used results are removed first)
+    """
+    enable_result_cache(self, max_bytes=max_bytes)
@@ -1,6 +1,18 @@
-from SciDataTool.Functions.parser import read_input_strings
 from SciDataTool.Functions.fft_functions import comp_fftn, comp_ifftn
-from SciDataTool.Functions.fix_axes_order import fix_axes_order
+from SciDataTool.Functions.fft_backends import get_precision_backend
+from SciDataTool.Functions.query_plan import get_query_plan
+from SciDataTool.Functions.symmetries import materialize
+from SciDataTool.Functions.result_cache import (
+    get_result_key,
+    get_cached_result,
+    set_cached_result,
+)
+from SciDataTool.Functions.transform_memo import get_transformed, set_transformed
+from SciDataTool.Functions.precision import (
+    get_data_precision,
+    get_fft_precision,
+    cast_precision,
+)
 
 
 def get_along(
@@ -12,6 +24,9 @@ def get_along(
     is_squeeze=True,
     is_magnitude=False,
     corr_unit=None,
+    precision=None,
+    is_scattered=False,
+    interp="linear",
 ):
     """Returns the ndarray of the field, using conversions and symmetries if needed.
     Parameters
@@ -26,6 +41,16 @@ def get_along(
         Boolean indicating if the field must be normalized (False by default)
     axis_data: list
         list of ndarray corresponding to user-input data
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
+    is_scattered: bool
+        True if the values requested along the interpolated axes are the coordinates
+        of points (e.g. probes, same number of values along each axis), False for
+        the grid of all combinations
+    interp: str
+        interpolation of the axes which are not patterns: "linear" or "fourier"
+        (band-limited interpolation of the periodic axes, see _interpolate)
     Returns
     -------
     list of 1Darray of axes values, ndarray of field values
@@ -33,57 +58,177 @@ def get_along(
     # Read the axes input in args
     if len(args) == 1 and type(args[0]) == tuple:
         args = args[0]  # if called from another script with *args
+    precision = get_data_precision(self, precision)
+
+    # Look for the result in the cache (see enable_cache)
+    cache_key = get_result_key(
+        self,
+        "get_along",
+        args,
+        axis_data,
+        unit=unit,
+        is_norm=is_norm,
+        is_squeeze=is_squeeze,
+        is_magnitude=is_magnitude,
+        corr_unit=corr_unit,
+        precision=precision,
+        is_scattered=is_scattered,
+        interp=interp,
+    )
+    if cache_key is not None:
+        return_dict = get_cached_result(self, cache_key)
+        if return_dict is not None:
+            return return_dict
+
+    # Get the compiled request (axes order, parsing, symmetries + unit)
+    plan = get_query_plan(self, args, axis_data, unit=unit, is_norm=is_norm)
+    return_dict = comp_along(
+        self,
+        plan,
+        plan.get_axes_list(),
+        unit=unit,
+        is_norm=is_norm,
+        is_squeeze=is_squeeze,
+        is_magnitude=is_magnitude,
+        corr_unit=corr_unit,
+        precision=precision,
+        transform_key=(plan.get_transform_key(), precision),
+        is_scattered=is_scattered,
+        interp=interp,
+    )
+    set_cached_result(self, cache_key, return_dict)
+    return return_dict
 
-    # Fix axes order
-    args = fix_axes_order([axis.name for axis in self.get_axes()], args)
 
-    axes_list = read_input_strings(args, axis_data)
-    # Extract the requested axes (symmetries + unit)
-    axes_list, transforms = self._comp_axes(axes_list)
-    # Get the field
-    values = self._get_field(axes_list)
-    # If DataFreq + 1 ifft axis + 1 fft axis: perform ifft on all axes then fft
-    save_transforms = None
-    save_names = None
-    if "ifft" in transforms and "fft" in transforms:
-        save_transforms = [axis.transform for axis in axes_list]
-        save_names = [axis.name for axis in axes_list]
-        for axis in axes_list:
-            if axis.name == "freqs":
-                axis.transform = "ifft"
-                axis.name = "time"
-            elif axis.name == "wavenumber":
-                axis.transform = "ifft"
-                axis.name = "angle"
-    # Inverse fft
-    if "ifft" in transforms:
-        values = comp_ifftn(values, axes_list, is_real=self.is_real)
-    # Prepare fft in ifft/fft case
-    if save_transforms is not None:
-        for i, transform in enumerate(save_transforms):
-            axes_list[i].name = save_names[i]
-            if transform == "fft_axis":
-                axes_list[i].transform = "fft"
-                save_transforms[i] = "fft"
-            else:
-                axes_list[i].transform = transform
-    # Slices along time/space axes
-    values, axes_dict_other = self._extract_slices(values, axes_list)
-    # fft
-    if "fft" in transforms:
-        values = comp_fftn(values, axes_list, is_real=self.is_real)
+def comp_along(
+    data,
+    plan,
+    axes_list,
+    unit="SI",
+    is_norm=False,
+    is_squeeze=True,
+    is_magnitude=False,
+    corr_unit=None,
+    precision=None,
+    transform_key=None,
+    is_scattered=False,
+    interp="linear",
+):
+    """Runs the numeric stages of get_along (slices, transforms, symmetries,
+    interpolation, operations and conversions) on a compiled request
+    Parameters
+    ----------
+    data: Data
+        a Data object
+    plan: QueryPlan
+        compiled request
+    axes_list: list
+        a list of RequestedAxis objects (copies of the plan ones, modified)
+    transform_key: tuple
+        key of the transformed field in the batch memo (memo not used if None)
+    is_scattered: bool
+        True if the values requested along the interpolated axes are the coordinates
+        of points
+    interp: str
+        interpolation of the axes which are not patterns ("linear" or "fourier")
+    Returns
+    -------
+    list of 1Darray of axes values, ndarray of field values
+    """
+    transforms = plan.transforms
+    # Look for the transformed field in the batch memo (see get_along_many)
+    values, axes_dict_other = get_transformed(data, transform_key, axes_list)
+    if values is None:
+        # Slices along axes which are not transformed (before ifft/fft)
+        pushdown = list(plan.pushdown)
+        values, axes_dict_other = data._extract_slices(data.values, axes_list, pushdown)
+        values = cast_precision(values, precision)
+        # Anti-periodic axes are transformed from the half period (no rebuild)
+        antiper_axes = []
+        if "ifft" not in transforms:
+            antiper_axes = [
+                axis.index
+                for axis in axes_list
+                if axis.transform == "fft"
+                and not axis.is_pattern
+                and "antiperiod" in data.axes[axis.index].symmetries
+            ]
+        # Get the field
+        values = data._get_field(axes_list, values, antiper_axes=antiper_axes)
+        # If DataFreq + 1 ifft axis + 1 fft axis: perform ifft on all axes then fft
+        save_transforms = None
+        save_names = None
+        if "ifft" in transforms and "fft" in transforms:
+            save_transforms = [axis.transform for axis in axes_list]
+            save_names = [axis.name for axis in axes_list]
+            for axis in axes_list:
+                if axis.name == "freqs":
+                    axis.transform = "ifft"
+                    axis.name = "time"
+                elif axis.name == "wavenumber":
+                    axis.transform = "ifft"
+                    axis.name = "angle"
+        # FFT backend keeping the precision of the transforms
+        fft_precision = get_fft_precision(precision)
+        backend = get_precision_backend(fft_precision)
+        # Inverse fft
+        if "ifft" in transforms:
+            values = cast_precision(
+                comp_ifftn(
+                    cast_precision(values, fft_precision),
+                    axes_list,
+                    is_real=data.is_real,
+                    backend=backend,
+                ),
+                precision,
+            )
+        # Prepare fft in ifft/fft case
+        if save_transforms is not None:
+            for i, transform in enumerate(save_transforms):
+                axes_list[i].name = save_names[i]
+                if transform == "fft_axis":
+                    axes_list[i].transform = "fft"
+                    save_transforms[i] = "fft"
+                else:
+                    axes_list[i].transform = transform
+        # Slices along time/space axes (other than pushdown ones)
+        other_indices = [i for i in range(len(data.axes)) if i not in pushdown]
+        values, axes_dict_other_transform = data._extract_slices(
+            values, axes_list, other_indices
+        )
+        axes_dict_other.update(axes_dict_other_transform)
+        # fft
+        if "fft" in transforms:
+            values = cast_precision(
+                comp_fftn(
+                    cast_precision(values, fft_precision),
+                    axes_list,
+                    is_real=data.is_real,
+                    backend=backend,
+                    antiper_axes=antiper_axes,
+                    partial_axes=plan.partial_fft,
+                ),
+                precision,
+            )
+        set_transformed(data, transform_key, values, axes_list, axes_dict_other)
     # Slices along fft axes
-    values = self._extract_slices_fft(values, axes_list)
+    values = data._extract_slices_fft(values, axes_list, plan.partial_fft)
     # Rebuild symmetries
-    values = self._rebuild_symmetries(values, axes_list)
+    values = data._rebuild_symmetries(values, axes_list)
     # Interpolate over axis values
-    values = self._interpolate(values, axes_list)
+    values = cast_precision(
+        data._interpolate(values, axes_list, is_scattered, interp), precision
+    )
     # Apply operations such as sum, integration, derivations etc.
-    values = self._apply_operations(
-        values, axes_list, is_magnitude, unit=self.unit, corr_unit=corr_unit
+    values = data._apply_operations(
+        values, axes_list, is_magnitude, unit=data.unit, corr_unit=corr_unit
     )
+    values = cast_precision(values, precision)
+    # Allocate reconstructed field
+    values = materialize(values)
     # Conversions
-    values = self._convert(values, unit, is_norm, is_squeeze, axes_list)
+    values = data._convert(values, unit, is_norm, is_squeeze, axes_list)
+    values = cast_precision(values, precision)
     # Return axes and values
     return_dict = {}
     for axis_requested in axes_list:
@@ -99,7 +244,7 @@ def get_along(
             return_dict[axis_requested.name] = axis_requested.extension
         else:
             return_dict[axis_requested.name] = axis_requested.values
-    return_dict[self.symbol] = values
+    return_dict[data.symbol] = values
     return_dict["axes_list"] = axes_list
     return_dict["axes_dict_other"] = axes_dict_other
     return return_dict
@@ -0,0 +1,70 @@
+from SciDataTool.Functions.precision import get_data_precision
+from SciDataTool.Functions.query_plan import get_query_plan
+from SciDataTool.Functions.transform_memo import (
+    open_transform_memo,
+    clear_transform_memo,
+    close_transform_memo,
+)
+
+# Methods which can be called by get_along_many
+BATCH_METHODS = ["get_along", "get_magnitude_along", "get_phase_along"]
+
+
+def get_along_many(self, requests):
+    """Returns the results of several requests, the transforms (fft/ifft) being
+    computed once for all the requests which share them.
+    Parameters
+    ----------
+    self: DataND
+        a DataND object
+    requests: list
+        list of requests: tuple of strings (axes requested, as in get_along) or dict
+        with the key "args" (tuple of strings), the optional key "method"
+        ("get_along" by default, "get_magnitude_along" or "get_phase_along") and
+        the keyword arguments of the method
+    Returns
+    -------
+    list of dict, the results of the requests (same order as requests)
+    """
+    # Read the requests
+    calls = []
+    for request in requests:
+        if isinstance(request, dict):
+            kwargs = dict(request)
+            args = kwargs.pop("args", ())
+            method = kwargs.pop("method", "get_along")
+        else:
+            kwargs = dict()
+            args = request
+            method = "get_along"
+        if isinstance(args, str):
+            args = (args,)
+        if method not in BATCH_METHODS:
+            raise ValueError(
+                "Unknown method "
+                + str(method)
+                + " in get_along_many, available methods are "
+                + ", ".join(BATCH_METHODS)
+            )
+        calls.append((method, tuple(args), kwargs))
+
+    # Group the requests by transform signature (and precision)
+    groups = dict()
+    for i, (method, args, kwargs) in enumerate(calls):
+        plan = get_query_plan(self, args, kwargs.get("axis_data", []))
+        precision = get_data_precision(self, kwargs.get("precision"))
+        groups.setdefault((plan.get_transform_key(), precision), []).append(i)
+
+    # Compute each group with a shared memo of the transformed field
+    results = [None] * len(calls)
+    is_opened = open_transform_memo(self)
+    try:
+        for indices in groups.values():
+            for i in indices:
+                method, args, kwargs = calls[i]
+                results[i] = getattr(self, method)(*args, **kwargs)
+            clear_transform_memo(self)
+    finally:
+        if is_opened:
+            close_transform_memo(self)
+    return results
@@ -1,6 +1,12 @@
 from SciDataTool.Functions import AxisError, NormError, UnitError
 from SciDataTool.Functions.conversions import convert, to_dB, to_dBA, to_noct
 from SciDataTool.Functions.fix_axes_order import fix_axes_order
+from SciDataTool.Functions.precision import get_data_precision, cast_precision
+from SciDataTool.Functions.result_cache import (
+    get_result_key,
+    get_cached_result,
+    set_cached_result,
+)
 from numpy import apply_along_axis, add
 
 
@@ -12,7 +18,8 @@ def get_magnitude_along(
     axis_data=[],
     is_squeeze=True,
     is_sum=True,
-    corr_unit=None
+    corr_unit=None,
+    precision=None
 ):
     """Returns the ndarray of the magnitude of the FT, using conversions and symmetries if needed.
     Parameters
@@ -27,12 +34,34 @@ def get_magnitude_along(
         Boolean indicating if the field must be normalized (False by default)
     axis_data: list
         list of ndarray corresponding to user-input data
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
     Returns
     -------
     list of 1Darray of axes values, ndarray of magnitude values
     """
     if len(args) == 1 and type(args[0]) == tuple:
         args = args[0]  # if called from another script with *args
+    precision = get_data_precision(self, precision)
+
+    # Look for the result in the cache (see enable_cache)
+    cache_key = get_result_key(
+        self,
+        "get_magnitude_along",
+        args,
+        axis_data,
+        unit=unit,
+        is_norm=is_norm,
+        is_squeeze=is_squeeze,
+        is_sum=is_sum,
+        corr_unit=corr_unit,
+        precision=precision,
+    )
+    if cache_key is not None:
+        return_dict = get_cached_result(self, cache_key)
+        if return_dict is not None:
+            return return_dict
 
     # Fix axes order
     args = fix_axes_order([axis.name for axis in self.get_axes()], args)
@@ -56,19 +85,26 @@ def get_magnitude_along(
                         index_freq = i
             if index_freq is None:  # No sum on freqs axis -> can extract directly
                 return self.get_magnitude_along(
-                    *args, unit=unit, is_squeeze=is_squeeze, is_sum=False
+                    *args,
+                    unit=unit,
+                    is_squeeze=is_squeeze,
+                    is_sum=False,
+                    precision=precision,
                 )
             else:
                 data = self.get_data_along(
                     *new_args, axis_data=axis_data, unit=unit
                 )  # Extract first along freqs axis
-                return data.get_magnitude_along(
+                return_dict = data.get_magnitude_along(
                     *[args[index_freq]],
                     unit=unit,
                     is_squeeze=is_squeeze,
                     is_sum=False,
                     corr_unit=self.unit,
+                    precision=precision,
                 )  # Then sum on freqs axis
+                set_cached_result(self, cache_key, return_dict)
+                return return_dict
         else:  # Try speed/order
             is_match = 0
             for i, axis in enumerate(self.axes):  # Find frequency axis
@@ -98,7 +134,11 @@ def get_magnitude_along(
                             index_speed = i
             elif unit == "dB" or "A-weight" in self.normalizations:
                 self.get_magnitude_along(
-                    *args, unit=unit, is_squeeze=is_squeeze, is_sum=False
+                    *args,
+                    unit=unit,
+                    is_squeeze=is_squeeze,
+                    is_sum=False,
+                    precision=precision,
                 )
             else:
                 raise AxisError(
@@ -108,41 +148,54 @@ def get_magnitude_along(
                 index_speed is None and index_order is None
             ):  # No sum on freqs axis -> can extract directly
                 return self.get_magnitude_along(
-                    *args, unit=unit, is_squeeze=is_squeeze, is_sum=False
+                    *args,
+                    unit=unit,
+                    is_squeeze=is_squeeze,
+                    is_sum=False,
+                    precision=precision,
                 )
             elif index_speed is None:  # Sum on order axis
                 data = self.get_data_along(
                     *new_args, axis_data=axis_data, unit=unit
                 )  # Extract first along order axis
-                return data.get_magnitude_along(
+                return_dict = data.get_magnitude_along(
                     *[arg_speed, args[index_order]],
                     unit=unit,
                     is_squeeze=is_squeeze,
                     is_sum=False,
                     corr_unit=self.unit,
+                    precision=precision,
                 )  # Then sum on order axis
+                set_cached_result(self, cache_key, return_dict)
+                return return_dict
             elif index_order is None:  # Sum on speed axis
                 data = self.get_data_along(
                     *new_args, axis_data=axis_data, unit=unit
                 )  # Extract first along speed axis
-                return data.get_magnitude_along(
+                return_dict = data.get_magnitude_along(
                     *args,
                     unit=unit,
                     is_squeeze=is_squeeze,
                     is_sum=False,
                     corr_unit=self.unit,
+                    precision=precision,
                 )  # Then sum on speed axis
+                set_cached_result(self, cache_key, return_dict)
+                return return_dict
             else:  # Sum on speed and order axes
                 data = self.get_data_along(
                     *new_args, axis_data=axis_data, unit=unit
                 )  # Extract first along speed and order axes
-                return data.get_magnitude_along(
+                return_dict = data.get_magnitude_along(
                     *[args[index_speed], args[index_order]],
                     unit=unit,
                     is_squeeze=is_squeeze,
                     is_sum=False,
                     corr_unit=self.unit,
+                    precision=precision,
                 )  # Then sum on speed and order axes
+                set_cached_result(self, cache_key, return_dict)
+                return return_dict
 
     else:
 
@@ -152,6 +205,7 @@ def get_magnitude_along(
             is_squeeze=is_squeeze,
             is_magnitude=True,
             corr_unit=corr_unit,
+            precision=precision,
         )
         values = return_dict[self.symbol]
 
@@ -247,5 +301,6 @@ def get_magnitude_along(
             values = self.normalizations.get(unit).normalize(values)
         else:
             values = convert(values, self.unit, unit)
-        return_dict[self.symbol] = values
+        return_dict[self.symbol] = cast_precision(values, precision)
+        set_cached_result(self, cache_key, return_dict)
         return return_dict
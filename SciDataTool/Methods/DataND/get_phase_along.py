@@ -1,9 +1,17 @@
 from SciDataTool.Functions import NormError
 from SciDataTool.Functions.conversions import convert
+from SciDataTool.Functions.precision import get_data_precision, cast_precision
+from SciDataTool.Functions.result_cache import (
+    get_result_key,
+    get_cached_result,
+    set_cached_result,
+)
 from numpy import angle as np_angle
 
 
-def get_phase_along(self, *args, unit="SI", is_norm=False, axis_data=[]):
+def get_phase_along(
+    self, *args, unit="SI", is_norm=False, axis_data=[], is_squeeze=True, precision=None
+):
     """Returns the ndarray of the magnitude of the FT, using conversions and symmetries if needed.
     Parameters
     ----------
@@ -17,13 +25,36 @@ def get_phase_along(self, *args, unit="SI", is_norm=False, axis_data=[]):
         Boolean indicating if the field must be normalized (False by default)
     axis_data: list
         list of ndarray corresponding to user-input data
+    is_squeeze: bool
+        Boolean indicating if the field must be squeezed (True by default)
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
     Returns
     -------
     list of 1Darray of axes values, ndarray of magnitude values
     """
     if len(args) == 1 and type(args[0]) == tuple:
         args = args[0]  # if called from another script with *args
-    return_dict = self.get_along(args, axis_data=axis_data)
+    precision = get_data_precision(self, precision)
+    # Look for the result in the cache (see enable_cache)
+    cache_key = get_result_key(
+        self,
+        "get_phase_along",
+        args,
+        axis_data,
+        unit=unit,
+        is_norm=is_norm,
+        is_squeeze=is_squeeze,
+        precision=precision,
+    )
+    if cache_key is not None:
+        return_dict = get_cached_result(self, cache_key)
+        if return_dict is not None:
+            return return_dict
+    return_dict = self.get_along(
+        args, axis_data=axis_data, is_squeeze=is_squeeze, precision=precision
+    )
     values = return_dict[self.symbol]
     # Compute magnitude
     values = np_angle(values)
@@ -40,5 +71,6 @@ def get_phase_along(self, *args, unit="SI", is_norm=False, axis_data=[]):
         values = self.normalizations.get(unit).normalize(values)
     else:
         values = convert(values, self.unit, unit)
-    return_dict[self.symbol] = values
+    return_dict[self.symbol] = cast_precision(values, precision)
+    set_cached_result(self, cache_key, return_dict)
     return return_dict
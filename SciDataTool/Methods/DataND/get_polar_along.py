@@ -0,0 +1,84 @@
+from numpy import angle as np_angle
+
+from SciDataTool.Functions import UnitError
+from SciDataTool.Functions.conversions import convert
+from SciDataTool.Functions.transform_memo import (
+    open_transform_memo,
+    close_transform_memo,
+)
+
+
+def get_polar_along(
+    self,
+    *args,
+    unit="SI",
+    is_norm=False,
+    axis_data=[],
+    is_squeeze=True,
+    phase_unit="SI",
+    precision=None,
+):
+    """Returns the ndarrays of the complex values, magnitude and phase of the field,
+    the transforms (fft/ifft) being computed once.
+    Parameters
+    ----------
+    self: Data
+        a Data object
+    *args: list of strings
+        List of axes requested by the user, their units and values (optional)
+    unit: str
+        Unit requested by the user for the magnitude ("SI" by default, "dB", "dBA"...)
+    is_norm: bool
+        Boolean indicating if the field must be normalized (False by default)
+    axis_data: list
+        list of ndarray corresponding to user-input data
+    is_squeeze: bool
+        Boolean indicating if the dimensions of size 1 must be removed
+    phase_unit: str
+        Unit requested by the user for the phase ("SI" by default or "°")
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
+    Returns
+    -------
+    list of 1Darray of axes values, ndarray of complex values, "magnitude" and "phase"
+    ndarrays
+    """
+    if len(args) == 1 and type(args[0]) == tuple:
+        args = args[0]  # if called from another script with *args
+
+    is_opened = open_transform_memo(self)
+    try:
+        # Complex values (dB units only apply to the magnitude)
+        return_dict = self.get_along(
+            *args,
+            unit="SI" if "dB" in unit else unit,
+            is_norm=is_norm,
+            axis_data=axis_data,
+            is_squeeze=is_squeeze,
+            precision=precision,
+        )
+        # Magnitude taken before the operations (sum, rms...)
+        result_mag = self.get_magnitude_along(
+            *args,
+            unit=unit,
+            is_norm=is_norm,
+            axis_data=axis_data,
+            is_squeeze=is_squeeze,
+            precision=precision,
+        )
+    finally:
+        if is_opened:
+            close_transform_memo(self)
+
+    # Phase of the complex values (same as get_phase_along)
+    phase = np_angle(return_dict[self.symbol])
+    if phase_unit == "°":
+        phase = convert(phase, "rad", "°")
+    elif phase_unit not in ["SI", "rad"]:
+        raise UnitError("Phase can only be converted to rad or °")
+
+    return_dict = dict(return_dict)
+    return_dict["magnitude"] = result_mag[self.symbol]
+    return_dict["phase"] = phase
+    return return_dict
@@ -0,0 +1,95 @@
+from SciDataTool.Functions import AxisError
+from SciDataTool.Functions.precision import get_data_precision
+from SciDataTool.Functions.query_plan import get_query_plan
+from SciDataTool.Methods.DataND._apply_operations import OPERATIONS
+from SciDataTool.Methods.DataND.get_along import comp_along
+
+
+def iter_along(
+    self,
+    *args,
+    chunk_axis=None,
+    chunk_size=1,
+    unit="SI",
+    is_norm=False,
+    axis_data=[],
+    is_squeeze=True,
+    is_magnitude=False,
+    corr_unit=None,
+    precision=None,
+):
+    """Yields the results of get_along block by block along an axis which is neither
+    transformed nor reduced, the request being compiled once.
+    Parameters
+    ----------
+    self: Data
+        a Data object
+    *args: list of strings
+        List of axes requested by the user, their units and values (optional)
+    chunk_axis: str
+        Name of the requested axis along which the blocks are extracted
+    chunk_size: int
+        Number of values of chunk_axis in each block
+    unit: str
+        Unit requested by the user ("SI" by default)
+    is_norm: bool
+        Boolean indicating if the field must be normalized (False by default)
+    axis_data: list
+        list of ndarray corresponding to user-input data
+    is_squeeze: bool
+        Boolean indicating if the dimensions of size 1 must be removed (including
+        chunk_axis for blocks of size 1)
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the object if None (see set_precision)
+    Returns
+    -------
+    generator of dict, results of get_along for each block
+    """
+    if len(args) == 1 and type(args[0]) == tuple:
+        args = args[0]  # if called from another script with *args
+    precision = get_data_precision(self, precision)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    # Compile the request once
+    plan = get_query_plan(self, args, axis_data, unit=unit, is_norm=is_norm)
+    chunk_index = None
+    for i, axis in enumerate(plan.axes_list):
+        if axis.name == chunk_axis:
+            chunk_index = i
+    if chunk_index is None:
+        raise AxisError("Chunk axis " + str(chunk_axis) + " is not requested")
+    axis_chunk = plan.axes_list[chunk_index]
+    if (
+        axis_chunk.index not in plan.pushdown
+        or axis_chunk.extension in OPERATIONS
+        or axis_chunk.input_data is not None
+    ):
+        raise AxisError(
+            "Chunk axis "
+            + str(chunk_axis)
+            + " must not be transformed, reduced or interpolated"
+        )
+
+    # Indices of the requested values of the chunk axis in the stored field
+    if axis_chunk.indices is None:
+        indices = list(range(len(axis_chunk.values)))
+    else:
+        indices = list(axis_chunk.indices)
+
+    for start in range(0, len(indices), chunk_size):
+        axes_list = plan.get_axes_list()
+        axes_list[chunk_index].indices = indices[start : start + chunk_size]
+        axes_list[chunk_index].values = axis_chunk.values[start : start + chunk_size]
+        yield comp_along(
+            self,
+            plan,
+            axes_list,
+            unit=unit,
+            is_norm=is_norm,
+            is_squeeze=is_squeeze,
+            is_magnitude=is_magnitude,
+            corr_unit=corr_unit,
+            precision=precision,
+        )
@@ -0,0 +1,15 @@
+from SciDataTool.Functions.precision import set_data_precision
+
+
+def set_precision(self, precision=None):
+    """Sets the precision of the computations of get_along, get_magnitude_along and
+    get_phase_along (fft, interpolation, operations and conversions)
+    Parameters
+    ----------
+    self: DataND
+        a DataND object
+    precision: str
+        "single" (float32/complex64), "double" (float64/complex128) or None to keep
+        the dtype of the computations (default)
+    """
+    set_data_precision(self, precision)
@@ -0,0 +1,130 @@
+from numpy import arange, asarray, moveaxis
+from numpy.fft import fftshift
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+from SciDataTool import Data1D
+from SciDataTool.Functions import AxisError
+from SciDataTool.Functions.fft_backends import get_fft_backend
+from SciDataTool.Functions.fft_functions import comp_fft_freqs
+from SciDataTool.Functions.nudft_functions import is_uniform
+
+
+def stft(self, window="hann", nperseg=256, noverlap=None):
+    """Computes the Short-Time Fourier Transform (spectrogram) of the field: the
+    spectra of the windowed segments are computed with one batched FFT on a strided
+    view of the field, and stored in a DataFreq object with ("time", "freqs", ...)
+    axes (time of the segment centers).
+    Parameters
+    ----------
+    self : DataTime
+        a DataTime object
+    window : str or ndarray
+        window applied to each segment (name used by scipy.signal.get_window, or
+        array of length nperseg)
+    nperseg : int
+        number of time steps of each segment
+    noverlap : int
+        number of time steps shared by two consecutive segments (nperseg // 2 if
+        None)
+    Returns
+    -------
+    a DataFreq object
+    """
+
+    # Dynamic import to avoid loop
+    module = __import__("SciDataTool.Classes.DataFreq", fromlist=["DataFreq"])
+    DataFreq = getattr(module, "DataFreq")
+    module = __import__("SciDataTool.Classes.DataPattern", fromlist=["DataPattern"])
+    DataPattern = getattr(module, "DataPattern")
+
+    if noverlap is None:
+        noverlap = nperseg // 2
+    if noverlap < 0 or noverlap >= nperseg:
+        raise ValueError("noverlap must be between 0 and nperseg - 1")
+
+    axes_str = []
+    index_time = None
+    for i, axis in enumerate(self.axes):
+        if axis.is_components:
+            axis_str = axis.name + str(list(range(len(axis.values))))
+        elif axis.name == "time":
+            axis_str = "time"
+            index_time = i
+        elif isinstance(axis, DataPattern):
+            axis_str = axis.name + "[pattern]"
+        else:
+            axis_str = axis.name + "[smallestperiod]"
+        axes_str.append(axis_str)
+    if index_time is None:
+        raise AxisError("stft requires a time axis")
+
+    # Whole time signal
+    results = self.get_along(*axes_str, is_squeeze=False)
+    values = asarray(results[self.symbol])
+    time = asarray(results["time"], dtype=float)
+    Nt = len(time)
+    if nperseg > Nt:
+        raise ValueError("nperseg must be lower than the number of time steps")
+    if Nt > 1 and not is_uniform(time):
+        raise AxisError("stft requires a uniform time axis")
+
+    if isinstance(window, str) or isinstance(window, tuple):
+        window = get_window(window, nperseg)
+    else:
+        window = asarray(window, dtype=float)
+        if window.shape != (nperseg,):
+            raise ValueError("window must be of length nperseg")
+
+    # Segments (strided view, no copy) along a new last axis, windowed in one pass
+    step = nperseg - noverlap
+    segments = sliding_window_view(values, nperseg, axis=index_time)
+    segments = segments[(slice(None),) * index_time + (slice(None, None, step),)]
+    segments = segments * window
+
+    # One batched FFT on the last axis, amplitude scaling of comp_fftn
+    fft = get_fft_backend()
+    if self.is_real:
+        values_FT = fft.rfftn(segments, [segments.ndim - 1])
+        values_FT *= 2 / window.sum()
+        values_FT[..., 0] *= 0.5
+    else:
+        values_FT = fft.fftn(segments, [segments.ndim - 1])
+        values_FT = fftshift(values_FT, axes=[segments.ndim - 1])
+        values_FT *= 1 / window.sum()
+    values_FT = moveaxis(values_FT, -1, index_time + 1)
+
+    # Axes of the spectrogram
+    starts = arange(values_FT.shape[index_time]) * step
+    timestep = time[1] - time[0] if Nt > 1 else 0
+    Axes = []
+    for axis in self.axes:
+        if axis.name == "time":
+            Axes.append(
+                Data1D(
+                    name="time",
+                    is_components=False,
+                    values=time[0] + (starts + nperseg / 2) * timestep,
+                    unit="s",
+                ).to_linspace()
+            )
+            Axes.append(
+                Data1D(
+                    name="freqs",
+                    is_components=False,
+                    values=comp_fft_freqs(time[:nperseg], True, self.is_real),
+                    unit="Hz",
+                ).to_linspace()
+            )
+        else:
+            Axes.append(axis.copy())
+
+    return DataFreq(
+        name=self.name,
+        unit=self.unit,
+        symbol=self.symbol,
+        axes=Axes,
+        values=values_FT,
+        is_real=self.is_real,
+        normalizations=self.normalizations.copy(),
+    )
@@ -0,0 +1,191 @@
+from numpy import abs as np_abs, arange, asarray, moveaxis, prod, sqrt
+from numpy.fft import fftshift
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+from SciDataTool import Data1D
+from SciDataTool.Functions import AxisError
+from SciDataTool.Functions.fft_backends import get_fft_backend
+from SciDataTool.Functions.fft_functions import comp_fft_freqs
+from SciDataTool.Functions.lazy_values import read_values
+from SciDataTool.Functions.nudft_functions import is_uniform
+from SciDataTool.Functions.symmetries import take_symmetries
+
+# Maximum size in bytes of the segment spectra computed at once
+WELCH_CHUNK_MAX_BYTES = 64e6
+
+
+def welch(
+    self,
+    window="hann",
+    nperseg=256,
+    noverlap=None,
+    scaling="density",
+    detrend="constant",
+    is_asd=False,
+):
+    """Computes the averaged spectrum of the field with the Welch method: the
+    spectra of the windowed segments are accumulated chunk by chunk along the time
+    axis, so that only a few segments are read at once (LazyValues are read by
+    hyperslabs) and memory does not depend on the record length.
+    Parameters
+    ----------
+    self : DataTime
+        a DataTime object
+    window : str or ndarray
+        window applied to each segment (name used by scipy.signal.get_window, or
+        array of length nperseg)
+    nperseg : int
+        number of time steps of each segment
+    noverlap : int
+        number of time steps shared by two consecutive segments (nperseg // 2 if
+        None)
+    scaling : str
+        "density" for the power spectral density (unit^2/Hz), "spectrum" for the
+        power spectrum (unit^2)
+    detrend : str
+        "constant" to remove the mean of each segment, None to keep it
+    is_asd : bool
+        True to return the square root of the averaged spectrum (amplitude
+        spectral density or linear spectrum)
+    Returns
+    -------
+    a DataFreq object
+    """
+
+    # Dynamic import to avoid loop
+    module = __import__("SciDataTool.Classes.DataFreq", fromlist=["DataFreq"])
+    DataFreq = getattr(module, "DataFreq")
+    module = __import__("SciDataTool.Classes.Norm_ref", fromlist=["Norm_ref"])
+    Norm_ref = getattr(module, "Norm_ref")
+
+    if noverlap is None:
+        noverlap = nperseg // 2
+    if noverlap < 0 or noverlap >= nperseg:
+        raise ValueError("noverlap must be between 0 and nperseg - 1")
+    if scaling not in ["density", "spectrum"]:
+        raise ValueError("scaling must be 'density' or 'spectrum'")
+    if detrend not in ["constant", None, False]:
+        raise ValueError("detrend must be 'constant' or None")
+
+    index_time = None
+    for i, axis in enumerate(self.axes):
+        if axis.name == "time":
+            index_time = i
+    if index_time is None:
+        raise AxisError("welch requires a time axis")
+    axis_time = self.axes[index_time]
+
+    # Time vector on the whole axis (values are read by chunks)
+    time = asarray(axis_time.get_values(), dtype=float)
+    Nt = len(time)
+    if nperseg > Nt or Nt < 2:
+        raise ValueError("nperseg must be lower than the number of time steps")
+    if not is_uniform(time):
+        raise AxisError("welch requires a uniform time axis")
+    fs = 1 / (time[1] - time[0])
+
+    if isinstance(window, str) or isinstance(window, tuple):
+        window = get_window(window, nperseg)
+    else:
+        window = asarray(window, dtype=float)
+        if window.shape != (nperseg,):
+            raise ValueError("window must be of length nperseg")
+
+    # Number of segments and of segments per chunk
+    step = nperseg - noverlap
+    N_seg = (Nt - nperseg) // step + 1
+    other_size = prod(self.values.shape) // self.values.shape[index_time]
+    N_chunk = max(1, int(WELCH_CHUNK_MAX_BYTES // (16 * nperseg * other_size)))
+
+    # Accumulation of the squared spectra of the segments
+    fft = get_fft_backend()
+    values_PSD = None
+    for start in range(0, N_seg, N_chunk):
+        stop = min(N_seg, start + N_chunk)
+        indices = arange(start * step, (stop - 1) * step + nperseg)
+        chunk = asarray(
+            read_values(
+                take_symmetries(
+                    self.values, indices, index_time, axis_time.symmetries
+                )
+            )
+        )
+        segments = sliding_window_view(chunk, nperseg, axis=index_time)
+        segments = segments[(slice(None),) * index_time + (slice(None, None, step),)]
+        if detrend == "constant":
+            segments = segments - segments.mean(axis=-1, keepdims=True)
+        segments = segments * window
+        if self.is_real:
+            values_FT = fft.rfftn(segments, [segments.ndim - 1])
+        else:
+            values_FT = fft.fftn(segments, [segments.ndim - 1])
+        power = (np_abs(values_FT) ** 2).sum(axis=index_time)
+        if values_PSD is None:
+            values_PSD = power
+        else:
+            values_PSD += power
+
+    # Average and scaling (one-sided spectrum of real fields)
+    if scaling == "density":
+        values_PSD *= 1 / (N_seg * fs * (window ** 2).sum())
+    else:
+        values_PSD *= 1 / (N_seg * window.sum() ** 2)
+    if self.is_real:
+        if nperseg % 2 == 0:
+            values_PSD[..., 1:-1] *= 2
+        else:
+            values_PSD[..., 1:] *= 2
+    else:
+        values_PSD = fftshift(values_PSD, axes=[values_PSD.ndim - 1])
+    values_PSD = moveaxis(values_PSD, -1, index_time)
+
+    # Unit and normalizations of the squared field
+    normalizations = self.normalizations.copy()
+    if is_asd:
+        values_PSD = sqrt(values_PSD)
+        unit = self.unit
+        if scaling == "density":
+            unit += "/Hz^0.5"
+    else:
+        if "ref" in normalizations:
+            normalizations["ref"] = Norm_ref(
+                ref=normalizations["ref"].ref ** 2, unit=normalizations["ref"].unit
+            )
+        if "/" in self.unit or "*" in self.unit or "^" in self.unit:
+            unit = "(" + self.unit + ")^2"
+        elif self.unit not in ["", "dimless"]:
+            unit = self.unit + "^2"
+        else:
+            unit = self.unit
+        if scaling == "density":
+            unit += "/Hz"
+
+    # Axes of the spectrum: |X|^2 is periodic along antiperiodic axes
+    Axes = []
+    for axis in self.axes:
+        if axis.name == "time":
+            Axes.append(
+                Data1D(
+                    name="freqs",
+                    is_components=False,
+                    values=comp_fft_freqs(time[:nperseg], True, self.is_real),
+                    unit="Hz",
+                ).to_linspace()
+            )
+        else:
+            axis_new = axis.copy()
+            if "antiperiod" in axis_new.symmetries:
+                axis_new.symmetries = axis_new.symmetries.copy()
+                axis_new.symmetries["period"] = axis_new.symmetries.pop("antiperiod")
+            Axes.append(axis_new)
+
+    return DataFreq(
+        name=self.name,
+        unit=unit,
+        symbol=self.symbol,
+        axes=Axes,
+        values=values_PSD,
+        is_real=self.is_real,
+        normalizations=normalizations,
+    )
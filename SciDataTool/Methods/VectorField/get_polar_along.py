@@ -0,0 +1,59 @@
+def get_polar_along(
+    self,
+    *args,
+    unit="SI",
+    is_norm=False,
+    axis_data=[],
+    is_squeeze=True,
+    phase_unit="SI",
+    precision=None,
+):
+    """Returns the complex values, magnitude and phase of each component of the
+    field, the transforms (fft/ifft) being computed once per component.
+    Parameters
+    ----------
+    self : VectorField
+        a VectorField object
+    *args: list of strings
+        List of axes requested by the user, their units and values (optional)
+    unit: str
+        Unit requested by the user for the magnitude ("SI" by default, "dB", "dBA"...)
+    is_norm: bool
+        Boolean indicating if the field must be normalized (False by default)
+    axis_data: list
+        list of ndarray corresponding to user-input data
+    is_squeeze: bool
+        Boolean indicating if the dimensions of size 1 must be removed
+    phase_unit: str
+        Unit requested by the user for the phase ("SI" by default or "°")
+    precision: str
+        "single" (float32/complex64) or "double" (float64/complex128) computations,
+        precision policy of the components if None (see DataND.set_precision)
+    Returns
+    -------
+    list of 1Darray of axes values, ndarray of complex values for each component,
+    "magnitude" and "phase" dicts of ndarrays (keys are the components)
+    """
+    if len(args) == 1 and type(args[0]) == tuple:
+        args = args[0]  # if called from another script with *args
+
+    return_dict = dict()
+    return_dict["magnitude"] = dict()
+    return_dict["phase"] = dict()
+    # Call get_polar_along on each component
+    for comp, data in self.components.items():
+        result = data.get_polar_along(
+            *args,
+            unit=unit,
+            is_norm=is_norm,
+            axis_data=axis_data,
+            is_squeeze=is_squeeze,
+            phase_unit=phase_unit,
+            precision=precision,
+        )
+        return_dict["magnitude"][comp] = result.pop("magnitude")
+        return_dict["phase"][comp] = result.pop("phase")
+        values = result.pop(data.symbol)
+        return_dict.update(result)
+        return_dict[comp] = values
+    return return_dict
@@ -13,6 +13,9 @@ from numpy.testing import assert_array_almost_equal
 from numpy import zeros, exp, real, pi, take, insert, delete
 from numpy.fft import rfftn, irfftn, fftshift, fftn, ifftshift, ifftn
 
+from SciDataTool.Functions.fft_backends import FFT_MODULES, use_fft_backend
+from SciDataTool.Functions.fft_functions import comp_fft_freqs, comp_fft_time
+
 
 @pytest.mark.validation
 def test_fft2_remove_periodicity():
@@ -934,6 +937,108 @@ def test_fft1d_non_uniform(per_a=2, is_apera=True, is_add_zero_freq=True):
     assert_array_almost_equal(val_time.values[:, 0], val_check)
 
 
+@pytest.mark.validation
+@pytest.mark.parametrize("backend", ["numpy", "scipy", "pyfftw"])
+def test_fft_backends(backend):
+    """Check that all FFT backends give the same fft/ifft results"""
+    if backend not in FFT_MODULES:
+        pytest.skip(backend + " is not installed")
+    f = 50
+    time = np.linspace(0, 1 / f, 16, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    angle = np.linspace(0, np.pi, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 2})
+    field = np.random.random((16, 10))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+
+    requests = [("freqs", "wavenumber"), ("freqs", "angle"), ("time", "wavenumber")]
+    with use_fft_backend("numpy"):
+        references = [Field.get_along(*args)["X"] for args in requests]
+        Field_freq = Field.time_to_freq()
+        reference_time = Field_freq.get_along("time", "angle")["X"]
+
+    with use_fft_backend(backend, workers=2):
+        for args, reference in zip(requests, references):
+            assert_array_almost_equal(Field.get_along(*args)["X"], reference)
+        assert_array_almost_equal(
+            Field_freq.get_along("time", "angle")["X"], reference_time
+        )
+        assert_array_almost_equal(
+            reference_time, Field.get_along("time", "angle")["X"]
+        )
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("Nt", [8, 9])
+def test_fft_antiperiod(Nt):
+    """Check that the fft of anti-periodic fields computed on the half period is
+    the same as the fft of the rebuilt period"""
+    f = 50
+    time = np.linspace(0, 1 / (2 * f), Nt, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time, symmetries={"antiperiod": 4})
+    angle = np.linspace(0, np.pi, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"antiperiod": 2})
+    field = np.random.random((Nt, 10))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+
+    # Same field on the period without symmetries
+    field_per = np.concatenate((field, -field), axis=0)
+    field_per = np.concatenate((field_per, -field_per), axis=1)
+    Time_per = Data1D(name="time", unit="s", values=Time.get_values(is_oneperiod=True))
+    Angle_per = Data1D(
+        name="angle", unit="rad", values=Angle.get_values(is_oneperiod=True)
+    )
+    Field_per = DataTime(
+        name="field", symbol="X", axes=[Time_per, Angle_per], values=field_per
+    )
+
+    requests = [
+        ("freqs", "angle[0]"),
+        ("freqs", "wavenumber"),
+        ("time[2]", "wavenumber"),
+    ]
+    for args in requests:
+        result = Field.get_along(*args)
+        result_per = Field_per.get_along(*args)
+        assert_array_almost_equal(result["X"], result_per["X"])
+        for name in ["freqs", "wavenumber"]:
+            if name in result:
+                assert_array_almost_equal(result[name], result_per[name])
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("is_real", [True, False])
+@pytest.mark.parametrize("N", [1, 15, 16])
+def test_comp_fft_axes(is_real, N):
+    """Check the vectorized frequency/time vectors against the previous loops and
+    that cached vectors are not shared between calls"""
+    time = np.linspace(0, 0.02, N, endpoint=False)
+    for is_time in [True, False]:
+        freqs = comp_fft_freqs(time, is_time, is_real)
+        if N == 1:
+            freqs_ref = [0]
+        else:
+            freqscale = N * float(time[1] - time[0])
+            freqs_ref = [i - int(N / 2) for i in range(N)]
+            if is_real and is_time:
+                freqs_ref = [i for i in range(int(N / 2) + 1)]
+            if is_time:
+                freqs_ref = [i / freqscale for i in freqs_ref]
+        assert isinstance(freqs, np.ndarray)
+        assert_array_almost_equal(freqs, freqs_ref)
+        freqs[0] = -1
+        assert_array_almost_equal(comp_fft_freqs(time, is_time, is_real), freqs_ref)
+
+    if N % 2 == 0:
+        freqs = comp_fft_freqs(time, True, is_real)
+        time_new = comp_fft_time(freqs, False, is_real)
+        assert isinstance(time_new, np.ndarray)
+        assert_array_almost_equal(time_new, time)
+        wavenumber = comp_fft_freqs(time * 2 * np.pi * 50, False, is_real)
+        angle = comp_fft_time(wavenumber, True, is_real)
+        assert_array_almost_equal(angle, time * 2 * np.pi * 50)
+
+
 if __name__ == "__main__":
     # test_ifft2d_period()
     test_fft1d_non_uniform(is_add_zero_freq=True)
@@ -0,0 +1,85 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+from numpy import take, insert, delete
+from numpy.fft import fftshift
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+from SciDataTool.Functions.fft_functions import comp_fftn, shift_scale
+from SciDataTool.Functions.fft_backends import get_fft_backend, use_fft_backend
+from SciDataTool.Functions.query_plan import get_query_plan
+
+
+def comp_fftn_legacy(values, axes):
+    """Previous normalization of comp_fftn (take + delete + insert, shift and scale
+    out of place)"""
+    size = int(np.prod([values.shape[axis] for axis in axes]))
+    values_FT = get_fft_backend().rfftn(values, axes)
+    slice_0 = take(values_FT, 0, axis=axes[-1])
+    slice_0 *= 0.5
+    other_values = delete(values_FT, 0, axis=axes[-1])
+    values_FT = insert(other_values, 0, slice_0, axis=axes[-1])
+    return 2.0 * fftshift(values_FT, axes=axes[:-1]) / size
+
+
+def get_peak(func, *args):
+    """Returns the result of func and the peak of memory allocated during the call"""
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize(
+    "args,axes,max_copies",
+    [
+        # rfft along time only: no shift, normalization in place
+        (("freqs", "angle"), [0], 1.2),
+        # rfft along time + fft along angle (copy of the 2D FFT), shift in place
+        (("freqs", "wavenumber"), [1, 0], 2.1),
+    ],
+)
+def test_fft_memory(args, axes, max_copies):
+    """Check the memory peak of comp_fftn compared to the size of its output"""
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1,
+        number=2048,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi, 256, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    values = np.random.random((2048, 256))
+    Field = DataTime(
+        name="field", symbol="X", axes=[Time, Angle], values=values, unit="m"
+    )
+    axes_list = get_query_plan(Field, args, []).get_axes_list()
+
+    # scipy.fft computes the real FFT along one axis without intermediate copy
+    with use_fft_backend("scipy"):
+        reference, peak_legacy = get_peak(comp_fftn_legacy, values, axes)
+        result, peak = get_peak(comp_fftn, values, axes_list, True)
+
+    assert_array_almost_equal(result, reference)
+    nbytes = result.nbytes
+    assert peak <= max_copies * nbytes
+    assert peak < peak_legacy
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("shape", [(512, 256), (511, 257)])
+def test_shift_scale_memory(shape):
+    """Check that the shift of the FT swaps the halves in place"""
+    values = np.random.random(shape) + 1j * np.random.random(shape)
+    reference = 0.5 * fftshift(values, axes=[0, 1])
+    result, peak = get_peak(shift_scale, values, [0, 1], 0.5)
+    assert result is values
+    assert_array_almost_equal(result, reference)
+    # Copy of one half of an axis at most
+    assert peak <= 0.55 * values.nbytes
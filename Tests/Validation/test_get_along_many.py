@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D, Norm_ref
+from SciDataTool.Functions.transform_memo import memo_dict
+import SciDataTool.Methods.DataND.get_along as get_along_module
+
+
+@pytest.mark.validation
+def test_get_along_many(monkeypatch):
+    """Check that get_along_many returns the same results as the single requests
+    with one fft per transform signature"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((16, 10)),
+        unit="m",
+        normalizations={"ref": Norm_ref(ref=2e-5)},
+    )
+    requests = [
+        ("freqs", "wavenumber"),
+        ("freqs=[0,100]", "wavenumber"),
+        ("freqs", "wavenumber=[0,8]"),
+        ("freqs=sum", "wavenumber"),
+        ("freqs", "wavenumber=rms"),
+        {"args": ("freqs", "wavenumber"), "method": "get_magnitude_along"},
+        {"args": ("freqs", "wavenumber"), "method": "get_phase_along"},
+        {
+            "args": ("freqs", "wavenumber"),
+            "method": "get_magnitude_along",
+            "unit": "dB",
+        },
+        ("time", "angle[0]"),
+        ("time", "angle"),
+    ]
+    references = []
+    for request in requests:
+        if isinstance(request, dict):
+            kwargs = dict(request)
+            args = kwargs.pop("args")
+            method = kwargs.pop("method")
+            references.append(getattr(Field, method)(*args, **kwargs))
+        else:
+            references.append(Field.get_along(*request))
+
+    nb_fft = [0]
+    comp_fftn = get_along_module.comp_fftn
+
+    def count_fftn(*args, **kwargs):
+        nb_fft[0] += 1
+        return comp_fftn(*args, **kwargs)
+
+    monkeypatch.setattr(get_along_module, "comp_fftn", count_fftn)
+    results = Field.get_along_many(requests)
+
+    # One fft for the full freqs/wavenumber requests (sum, rms, magnitude, phase,
+    # dB), slices along fft axes change the transformed axis values
+    assert nb_fft[0] == 3
+    assert len(results) == len(requests)
+    for result, reference in zip(results, references):
+        assert_array_almost_equal(result["X"], reference["X"])
+        for name in ["freqs", "wavenumber", "time", "angle"]:
+            if name in reference and not isinstance(reference[name], str):
+                assert_array_almost_equal(result[name], reference[name])
+    assert id(Field) not in memo_dict
+
+    with pytest.raises(ValueError):
+        Field.get_along_many([{"args": ("freqs",), "method": "plot_2D_Data"}])
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D, VectorField
+import SciDataTool.Methods.DataND.get_along as get_along_module
+
+
+@pytest.mark.validation
+def test_get_polar_along(monkeypatch):
+    """Check that get_polar_along returns the complex, magnitude and phase values
+    of get_along/get_magnitude_along/get_phase_along with one fft"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi, 20, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((16, 20)),
+        unit="m",
+    )
+
+    for args in [("freqs", "wavenumber"), ("freqs=sum", "wavenumber=[0,4]")]:
+        result_cplx = Field.get_along(*args)
+        result_mag = Field.get_magnitude_along(*args)
+        result_phase = Field.get_phase_along(*args, unit="°")
+
+        nb_fft = [0]
+        comp_fftn = get_along_module.comp_fftn
+
+        def count_fftn(*args, **kwargs):
+            nb_fft[0] += 1
+            return comp_fftn(*args, **kwargs)
+
+        monkeypatch.setattr(get_along_module, "comp_fftn", count_fftn)
+        result = Field.get_polar_along(*args, phase_unit="°")
+        monkeypatch.undo()
+
+        assert nb_fft[0] == 1
+        assert_array_almost_equal(result["X"], result_cplx["X"])
+        assert_array_almost_equal(result["magnitude"], result_mag["X"])
+        assert_array_almost_equal(result["phase"], result_phase["X"])
+        assert_array_almost_equal(result["wavenumber"], result_cplx["wavenumber"])
+
+
+@pytest.mark.validation
+def test_get_polar_along_vectorfield():
+    """Check get_polar_along on each component of a VectorField"""
+    time = np.linspace(0, 0.02, 16, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    comp_r = DataTime(
+        name="field_r",
+        symbol="X_r",
+        axes=[Time, Angle],
+        values=1 + np.random.random((16, 8)),
+        unit="T",
+    )
+    comp_t = DataTime(
+        name="field_t",
+        symbol="X_t",
+        axes=[Time, Angle],
+        values=np.cos(2 * np.pi * 50 * time)[:, None] * np.cos(2 * angle)[None, :],
+        unit="T",
+    )
+    Field = VectorField(
+        name="field", symbol="X", components={"radial": comp_r, "tangential": comp_t}
+    )
+    result = Field.get_polar_along("freqs", "wavenumber", unit="dB")
+    for comp, data in Field.components.items():
+        assert_array_almost_equal(
+            result[comp], data.get_along("freqs", "wavenumber")[data.symbol]
+        )
+        assert_array_almost_equal(
+            result["magnitude"][comp],
+            data.get_magnitude_along("freqs", "wavenumber", unit="dB")[data.symbol],
+        )
+    assert "freqs" in result
@@ -0,0 +1,325 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from scipy.interpolate import interp1d
+
+from SciDataTool import DataTime, DataDual, Data1D
+from SciDataTool.Functions.interpolations import (
+    clear_interpolation_cache,
+    get_common_base,
+    get_fourier_interpolation,
+    get_interpolation,
+    get_interpolation_operator,
+    get_interpolation_step,
+    interp_cache,
+)
+
+
+@pytest.mark.validation
+def test_interpolation_step():
+    """Check the step interpolation on a pattern axis with discontinuities"""
+    axis_values = np.array([-1, 0, 0, 1, 1, 2])
+    values = np.array([[10, 20, 30, 40, 50, 60], [1, 2, 3, 4, 5, 6]], dtype=float)
+    new_axis_values = np.array([-2, -1, -0.5, 0, 0.5, 1, 1.0005, 1.5, 2, 3])
+    result = get_interpolation_step(values, axis_values, new_axis_values, 1)
+    # Left value of the step, mean of both sides on a discontinuity (with rtol=1e-3),
+    # bound values outside the axis
+    expected = np.array([10, 10, 10, 25, 30, 45, 45, 50, 60, 60], dtype=float)
+    assert_array_almost_equal(result[0], expected)
+    assert_array_almost_equal(result[1], expected / 10)
+
+    # Constant axis
+    result = get_interpolation_step(values, np.ones(6), new_axis_values, 1)
+    assert_array_almost_equal(result, np.repeat(values[:, :1], 10, axis=1))
+
+
+@pytest.mark.validation
+def test_interpolation_step_unsorted():
+    """Check the step interpolation on an unsorted axis (first matching interval)"""
+    axis_values = np.array([0, 2, 1, 3])
+    values = np.array([10, 20, 30, 40], dtype=float)
+    new_axis_values = np.array([-1, 0.5, 1.5, 2.5, 3, 4])
+    result = get_interpolation_step(values, axis_values, new_axis_values, 0)
+    # 1.5 in [0, 2[ (first interval) and in [1, 3[, 2.5 only in [1, 3[
+    expected = np.array([10, 10, 10, 30, 40, 40], dtype=float)
+    assert_array_almost_equal(result, expected)
+
+
+@pytest.mark.long
+def test_interpolation_step_large():
+    """Check the step interpolation on realistic pattern sizes"""
+    for N, N_new, shape in [
+        (200, 50, (200,)),
+        (2000, 500, (2000,)),
+        (2000, 500, (64, 2000)),
+        (20000, 5000, (16, 20000)),
+    ]:
+        z = np.sort(np.random.uniform(0, 1, N // 2))
+        axis_values = np.repeat(z, 2)
+        values = np.random.random(shape)
+        new_axis_values = np.linspace(-0.1, 1.1, N_new)
+        index = len(shape) - 1
+        result = get_interpolation_step(values, axis_values, new_axis_values, index)
+        assert result.shape == shape[:-1] + (N_new,)
+
+
+@pytest.mark.validation
+def test_interpolation_operator():
+    """Check the cached linear interpolation operators against interp1d"""
+    clear_interpolation_cache()
+    axis_values = np.sort(np.random.uniform(0, 1, 50))[::-1]
+    new_axis_values = np.linspace(-0.2, 1.2, 300)
+    values = np.random.random((3, 50, 2)) + 1j * np.random.random((3, 50, 2))
+    result = get_interpolation(values, axis_values, new_axis_values, 1)
+    f = interp1d(axis_values, values, axis=1, fill_value="extrapolate")
+    assert_array_almost_equal(result, f(new_axis_values))
+
+    # The operator is computed once for the same axes
+    operator = get_interpolation_operator(axis_values, new_axis_values)
+    assert operator.kind == "linear"
+    assert get_interpolation_operator(axis_values.copy(), new_axis_values) is operator
+    assert len(interp_cache) == 1
+
+    # Same axis, subset and single point
+    assert get_interpolation_operator(axis_values, axis_values).kind == "identity"
+    result = get_interpolation(values, axis_values, axis_values[[4, 2]], 1)
+    assert_array_almost_equal(result, values[:, [2, 4], :])
+    result = get_interpolation(values, axis_values, [2.0], 1)
+    assert np.isnan(result).all()
+
+
+@pytest.mark.validation
+def test_compare_along():
+    """Check that both fields are interpolated on the common time axis"""
+    time1 = np.linspace(0, 1, 101)
+    time2 = np.linspace(0, 1, 51)
+    angle = np.linspace(0, 2 * np.pi, 4, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    fields = []
+    for i, time in enumerate([time1, time2]):
+        Time = Data1D(name="time", unit="s", values=time)
+        values = np.cos(2 * np.pi * time)[:, None] * np.cos(angle)[None, :]
+        fields.append(
+            DataTime(name="field", symbol="X", axes=[Time, Angle], values=values)
+        )
+    result = fields[0].compare_along("time", "angle", data_list=[fields[1]])
+    assert_array_almost_equal(result["time"], time1)
+    assert result["X"].shape == (101, 4)
+    assert_array_almost_equal(result["X_0"], result["X"], decimal=2)
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("symmetries", [{}, {"period": 2}, {"antiperiod": 2}])
+def test_interpolation_multi_axes(symmetries):
+    """Check the interpolation on several axes in one pass against the
+    interpolation along each axis"""
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 41))
+    # Half of the circumference is stored if there are symmetries
+    number = 32 if symmetries == {} else 16
+    angle = np.linspace(0, 2 * np.pi * number / 32, number, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries=symmetries)
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 0.1, 11))
+    order = 3 if "antiperiod" in symmetries else 4
+    field = (
+        np.cos(2 * np.pi * Time.values)[:, None, None]
+        * np.cos(order * angle)[None, :, None]
+        * (1 + Z.values)[None, None, :]
+    )
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle, Z], values=field)
+    time = np.random.uniform(0, 1, 5)
+    angle = np.random.uniform(0, 2 * np.pi * 31 / 32, 5)  # No extrapolation
+    z = np.random.uniform(0, 0.1, 5)
+    axis_data = {"time": time, "angle": angle, "z": z}
+    args = ("time=axis_data", "angle=axis_data", "z=axis_data")
+    result = Field.get_along(*args, axis_data=axis_data)
+    assert result["X"].shape == (5, 5, 5)
+
+    # Reference: interpolation along each axis of the whole field
+    values = Field.get_along("time", "angle", "z")["X"]
+    axes_values = [
+        np.linspace(0, 1, 41),
+        np.linspace(0, 2 * np.pi, 32, endpoint=False),
+        np.linspace(0, 0.1, 11),
+    ]
+    for index, new_values in enumerate([time, angle, z]):
+        values = interp1d(axes_values[index], values, axis=index)(new_values)
+    assert_array_almost_equal(result["X"], values)
+
+    # Scattered points: values at (time[i], angle[i], z[i])
+    result = Field.get_along(*args, axis_data=axis_data, is_scattered=True)
+    assert result["X"].shape == (5,)
+    diagonal = np.arange(5)
+    assert_array_almost_equal(result["X"], values[diagonal, diagonal, diagonal])
+    assert_array_almost_equal(result["angle"], angle)
+
+    # Interpolation on the axes without symmetries (stored period)
+    args = ("time=axis_data", "angle", "z=axis_data")
+    result = Field.get_along(*args, axis_data=axis_data)
+    values = Field.get_along("time", "angle", "z")["X"]
+    values = interp1d(axes_values[0], values, axis=0)(time)
+    values = interp1d(axes_values[2], values, axis=2)(z)
+    assert_array_almost_equal(result["X"], values)
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("symmetries", [{}, {"period": 2}, {"antiperiod": 2}])
+def test_interpolation_fourier(symmetries):
+    """Check the band-limited interpolation along the periodic angle axis"""
+    time = np.linspace(0, 1, 41)
+    Time = Data1D(name="time", unit="s", values=time)
+    # Half of the circumference is stored if there are symmetries
+    number = 32 if symmetries == {} else 16
+    angle = np.linspace(0, 2 * np.pi * number / 32, number, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries=symmetries)
+    order = 3 if "antiperiod" in symmetries else 4
+    field = np.cos(2 * np.pi * time)[:, None] * np.cos(order * angle)[None, :]
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+
+    # Uniform upsampling of the circumference (FFT zero-padding)
+    angle = np.linspace(0, 2 * np.pi, 256, endpoint=False)
+    args = ("time", "angle=axis_data")
+    result = Field.get_along(*args, axis_data={"angle": angle}, interp="fourier")
+    assert_array_almost_equal(result["angle"], angle)
+    expected = np.cos(2 * np.pi * time)[:, None] * np.cos(order * angle)[None, :]
+    assert_array_almost_equal(result["X"], expected)
+
+    # Arbitrary angles (Fourier series)
+    angle = np.random.uniform(-np.pi, 3 * np.pi, 20)
+    result = Field.get_along(*args, axis_data={"angle": angle}, interp="fourier")
+    expected = np.cos(2 * np.pi * time)[:, None] * np.cos(order * angle)[None, :]
+    assert_array_almost_equal(result["X"], expected)
+
+    # Linear interpolation along the time axis (not periodic)
+    time_new = np.random.uniform(0, 1, 7)
+    axis_data = {"time": time_new, "angle": angle}
+    args = ("time=axis_data", "angle=axis_data")
+    result = Field.get_along(*args, axis_data=axis_data, interp="fourier")
+    expected = interp1d(time, expected, axis=0)(time_new)
+    assert_array_almost_equal(result["X"], expected)
+
+    with pytest.raises(ValueError):
+        Field.get_along(*args, axis_data=axis_data, interp="cubic")
+
+
+@pytest.mark.validation
+def test_interpolation_fourier_sector():
+    """Check that an angular sector (not periodic) is interpolated linearly"""
+    angle = np.linspace(0, np.pi / 4, 10)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Time = Data1D(name="time", unit="s", values=np.array([0, 0.5, 1]))
+    values = np.ones(3)[:, None] * (1 + angle / angle[-1] * 0.4)[None, :]
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=values)
+    new_angle = np.linspace(0, np.pi / 4, 37)
+    args = ("time[0]", "angle=axis_data")
+    result = Field.get_along(*args, axis_data={"angle": new_angle}, interp="fourier")
+    assert_array_almost_equal(result["X"], 1 + new_angle / angle[-1] * 0.4)
+
+
+@pytest.mark.validation
+def test_fourier_interpolation_complex():
+    """Check the band-limited interpolation of a complex field"""
+    angle = np.linspace(0, 2 * np.pi, 16, endpoint=False)
+    values = np.exp(3j * angle) + 0.5 * np.exp(-2j * angle) + 0.3 * np.cos(8 * angle)
+    for new_angle in [
+        np.linspace(0, 2 * np.pi, 64, endpoint=False),
+        np.random.uniform(0, 2 * np.pi, 30),
+    ]:
+        result = get_fourier_interpolation(values, angle, new_angle, 0)
+        expected = (
+            np.exp(3j * new_angle)
+            + 0.5 * np.exp(-2j * new_angle)
+            + 0.3 * np.cos(8 * new_angle)
+        )
+        assert_array_almost_equal(result, expected)
+
+
+@pytest.mark.validation
+def test_common_base():
+    """Check the common base of several axes"""
+    time1 = np.linspace(0, 1, 11)
+    time2 = np.linspace(0.05, 1.2, 24)
+    time3 = np.linspace(-0.1, 0.9, 6)
+    # Densest axis in the common range [0.05, 0.9], bounds inside this axis
+    result = get_common_base(time1, time2, time3)
+    assert_array_almost_equal(result, np.linspace(0.05, 0.9, 18))
+    result = get_common_base(time1, time2, time3, is_downsample=True)
+    assert_array_almost_equal(result, np.linspace(0.05, 0.9, 5))
+    result = get_common_base(time1, time2, time3, is_extrap=True, is_downsample=True)
+    assert_array_almost_equal(result, np.linspace(-0.1, 1.2, 6))
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("workers", [None, 2])
+def test_compare_along_stack(workers):
+    """Check the comparison of several fields stacked in one array"""
+    angle = np.linspace(0, 2 * np.pi, 4, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    fields = []
+    for i in range(6):
+        # Two time grids: the fields on the same grid are interpolated together
+        time = np.linspace(0, 1, 21 if i % 2 == 0 else 41)
+        Time = Data1D(name="time", unit="s", values=time)
+        values = np.cos(2 * np.pi * time + i)[:, None] * np.cos(angle)[None, :]
+        fields.append(
+            DataTime(name="field", symbol="X", axes=[Time, Angle], values=values)
+        )
+    args = ("time", "angle[0]")
+    result = fields[0].compare_along(
+        *args, data_list=fields[1:], is_stack=True, workers=workers
+    )
+    assert result["X"].shape == (6, 41)
+    time = np.linspace(0, 1, 41)
+    assert_array_almost_equal(result["time"], time)
+    for i in range(6):
+        values = fields[i].get_along(*args)
+        expected = interp1d(values["time"], values["X"])(time)
+        assert_array_almost_equal(result["X"][i], expected)
+    result_pair = fields[0].compare_along(*args, data_list=[fields[3]])
+    assert_array_almost_equal(result_pair["X_0"], result["X"][3])
+
+    result = fields[0].compare_magnitude_along(
+        "time", "angle", data_list=fields[1:3], workers=workers
+    )
+    assert result["X_1"].shape == (41, 4)
+
+
+@pytest.mark.long
+def test_compare_along_many():
+    """Check the comparison of 200 variants with a reference"""
+    angle = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    time = np.linspace(0, 1, 2001)
+    Time = Data1D(name="time", unit="s", values=time)
+    fields = [
+        DataTime(
+            name="field",
+            symbol="X",
+            axes=[Time, Angle],
+            values=np.random.random((2001, 64)),
+        )
+        for i in range(201)
+    ]
+    for workers in [None, 4]:
+        result = fields[0].compare_along(
+            "time", "angle", data_list=fields[1:], is_stack=True, workers=workers
+        )
+        assert result["X"].shape == (201, 2001, 64)
+
+
+@pytest.mark.validation
+def test_interpolation_datadual():
+    """Check that the interpolation options are available on DataDual fields"""
+    time = np.linspace(0, 1, 11)
+    Time = Data1D(name="time", unit="s", values=time)
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    values = time[:, None] * np.cos(angle)[None, :]
+    Field = DataDual(name="field", symbol="X", axes_dt=[Time, Angle], values_dt=values)
+    time_new = np.array([0.05, 0.5, 0.95])
+    angle_new = np.array([0.1, 1, 3])
+    axis_data = {"time": time_new, "angle": angle_new}
+    args = ("time=axis_data", "angle=axis_data")
+    result = Field.get_along(*args, axis_data=axis_data, is_scattered=True)
+    assert result["X"].shape == (3,)
+    result = Field.get_along(*args, axis_data=axis_data, interp="fourier")
+    assert_array_almost_equal(result["X"], time_new[:, None] * np.cos(angle_new))
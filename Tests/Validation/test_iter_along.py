@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+from SciDataTool.Functions import AxisError
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize(
+    "args,chunk_axis",
+    [
+        (("freqs", "wavenumber", "z"), "z"),
+        (("freqs=sum", "wavenumber", "z[1:6]"), "z"),
+        (("time=rms", "angle", "z"), "angle"),
+        (("freqs", "angle[oneperiod]", "z=mean"), "angle"),
+    ],
+)
+def test_iter_along(args, chunk_axis):
+    """Check that the blocks of iter_along rebuild the result of get_along"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 7))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=np.random.random((16, 10, 7)),
+        unit="m",
+    )
+    result = Field.get_along(*args, is_squeeze=False)
+
+    chunks = list(
+        Field.iter_along(*args, chunk_axis=chunk_axis, chunk_size=3, is_squeeze=False)
+    )
+    n = len(result[chunk_axis])
+    assert len(chunks) == (n + 2) // 3
+    # Dimension of the chunk axis in the result
+    shape = chunks[0]["X"].shape
+    axis_index = [i for i in range(len(shape)) if shape[i] != result["X"].shape[i]][0]
+    assert_array_almost_equal(
+        np.concatenate([chunk["X"] for chunk in chunks], axis=axis_index), result["X"]
+    )
+    assert_array_almost_equal(
+        np.concatenate([chunk[chunk_axis] for chunk in chunks]), result[chunk_axis]
+    )
+
+
+@pytest.mark.validation
+def test_iter_along_error():
+    """Check that transformed or reduced axes cannot be chunked"""
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 8, endpoint=False))
+    Angle = Data1D(name="angle", unit="rad", values=np.linspace(0, 6, 4))
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 3))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=np.random.random((8, 4, 3)),
+        unit="m",
+    )
+    with pytest.raises(AxisError):
+        next(Field.iter_along("freqs", "angle", "z", chunk_axis="freqs"))
+    with pytest.raises(AxisError):
+        next(Field.iter_along("time", "angle", "z=sum", chunk_axis="z"))
+    with pytest.raises(AxisError):
+        next(Field.iter_along("time", "angle", chunk_axis="z"))
@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import h5py
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+from SciDataTool.Functions.lazy_values import LazyValues
+
+
+class CountingArray(object):
+    """Array-like object recording the size of each read"""
+
+    def __init__(self, values):
+        self.values = values
+        self.shape = values.shape
+        self.dtype = values.dtype
+        self.reads = []
+
+    def __getitem__(self, key):
+        values = self.values[key]
+        self.reads.append(values.size)
+        return values
+
+
+ARGS_LIST = [
+    ("time", "angle", "z"),
+    ("time[2]", "angle[3]", "z[1]"),
+    ("freqs", "angle[2:5]", "z[4]"),
+    ("time", "angle[12]", "z=mean"),
+    ("freqs", "wavenumber", "z[0]"),
+]
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("args", ARGS_LIST)
+def test_lazy_values(args):
+    """Check that lazily-backed values give the same results and only read the
+    requested hyperslab"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 6))
+    field = np.random.random((16, 10, 6))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle, Z], values=field)
+    reference = Field.get_along(*args)
+
+    source = CountingArray(field)
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle, Z], values=source)
+    assert isinstance(Field.values, LazyValues)
+    assert source.reads == []
+    result = Field.get_along(*args)
+    assert_array_almost_equal(result["X"], reference["X"])
+    # One read of the selected hyperslab
+    assert len(source.reads) == 1
+    if "z[" in args[2]:
+        assert source.reads[0] <= field.size / 6
+
+
+@pytest.mark.validation
+def test_lazy_values_files(tmp_path):
+    """Check memmap and h5py Dataset values"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 6))
+    field = np.random.random((16, 10, 6))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle, Z], values=field)
+    reference = Field.get_along("freqs", "angle[2:5]", "z[4]")
+
+    file_name = str(tmp_path / "field.dat")
+    values = np.memmap(file_name, dtype=field.dtype, mode="w+", shape=field.shape)
+    values[:] = field
+    values.flush()
+    values = np.memmap(file_name, dtype=field.dtype, mode="r", shape=field.shape)
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle, Z], values=values)
+    result = Field.get_along("freqs", "angle[2:5]", "z[4]")
+    assert_array_almost_equal(result["X"], reference["X"])
+
+    with h5py.File(str(tmp_path / "field.h5"), "w") as file:
+        file.create_dataset("X", data=field)
+        Field = DataTime(
+            name="field", symbol="X", axes=[Time, Angle, Z], values=file["X"]
+        )
+        result = Field.get_along("freqs", "angle[2:5]", "z[4]")
+        assert_array_almost_equal(result["X"], reference["X"])
+        assert_array_almost_equal(np.array(Field.values), field)
+
+
+@pytest.mark.validation
+def test_lazy_values_squeeze():
+    """Check that axes of size 1 are handled without reading the values"""
+    field = np.random.random((16, 1, 10))
+    source = CountingArray(field)
+    lazy = LazyValues(source).squeeze()
+    assert lazy.shape == (16, 10)
+    lazy = lazy.expand_dims(0)
+    assert lazy.shape == (1, 16, 10)
+    lazy = lazy.take([1, 4], axis=2)
+    assert source.reads == []
+    assert_array_almost_equal(np.asarray(lazy), field[:, 0, [1, 4]][None, :, :])
+    assert source.reads == [16 * 4]
@@ -4,6 +4,17 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from SciDataTool import Data1D, DataTime, DataFreq
+from SciDataTool.Functions.nudft_functions import (
+    DFT_BLOCK_MAX_BYTES,
+    DFT_CACHE_MAX_BYTES,
+    dft_cache,
+    inudftn,
+    matrice_D,
+    matrice_E,
+    nudftn,
+    set_nudft_memory,
+)
+from SciDataTool.Functions.nufft_functions import NUFFT_MIN_SIZE, nufft3, set_nufft
 
 
 @pytest.mark.validation
@@ -385,3 +396,91 @@ def test_non_uniform_time_1d():
         result_inudft["X"].real, f_1d(time_vect_non_unif), decimal=0
     )
     assert np.allclose(result_inudft["X"].real, f_1d(time_vect_non_unif), rtol=1e-1)
+
+
+@pytest.mark.validation
+def test_nudft_blocks():
+    """Check that the DFT computed by blocks of cached matrices is the same as the
+    DFT with the full matrix"""
+    time = np.sort(np.random.random(50))
+    freqs = np.linspace(0, 20, 37)
+    values = np.random.random((3, 50, 4))
+    values_ref = values.copy()
+
+    # Reference with the full matrices
+    dft_ref = np.moveaxis(
+        np.tensordot(matrice_D(time, freqs), values, ((1,), (1,))), 0, 1
+    )
+    dft_ref /= len(time)
+    dft_ref[:, 1:, :] *= 2
+    idft_ref = np.moveaxis(
+        np.tensordot(matrice_E(time, freqs), dft_ref, ((1,), (1,))), 0, 1
+    )
+
+    dft_cache.clear()
+    set_nudft_memory(block_max_bytes=16 * 50 * 5)
+    try:
+        for _ in range(2):
+            dft = nudftn(values, {1: [time, freqs]})
+            idft = inudftn(dft, {1: [time, freqs]})
+            np.testing.assert_allclose(dft, dft_ref)
+            np.testing.assert_allclose(idft, idft_ref)
+            np.testing.assert_array_equal(values, values_ref)
+        # Blocks of 5 frequencies (DFT) and of 6 time steps (inverse DFT)
+        assert len(dft_cache.matrices) == 8 + 9
+
+        # Matrices larger than the cache budget are not cached
+        dft_cache.clear()
+        set_nudft_memory(cache_max_bytes=16 * 50 * 36)
+        dft = nudftn(values, {1: [time, freqs]})
+        np.testing.assert_allclose(dft, dft_ref)
+        assert len(dft_cache.matrices) == 0
+    finally:
+        set_nudft_memory(
+            block_max_bytes=DFT_BLOCK_MAX_BYTES, cache_max_bytes=DFT_CACHE_MAX_BYTES
+        )
+        dft_cache.clear()
+
+
+@pytest.mark.validation
+def test_nufft():
+    """Check that the type-3 NUFFT gives the same results as the direct DFT on
+    variable time steps"""
+    time = np.sort(np.random.random(3000))
+    freqs = np.sort(np.random.random(400)) * 200 - 50
+    values = np.random.random((3000, 2)) + 1j * np.random.random((3000, 2))
+
+    dft_ref = np.tensordot(matrice_D(time, freqs), values, ((1,), (0,)))
+    dft = nufft3(values, 0, time, freqs)
+    atol = 1e-6 * np.abs(values).sum(axis=0).max()
+    np.testing.assert_allclose(dft, dft_ref, rtol=0, atol=atol)
+
+    idft_ref = np.tensordot(matrice_E(time, freqs), dft_ref, ((1,), (0,)))
+    idft = nufft3(dft_ref, 0, freqs, time, sign=1)
+    atol = 1e-6 * np.abs(dft_ref).sum(axis=0).max()
+    np.testing.assert_allclose(idft, idft_ref, rtol=0, atol=atol)
+
+
+@pytest.mark.validation
+def test_nufft_get_along():
+    """Check the amplitudes of test_nudft_1d with the NUFFT"""
+    time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 10000))
+    data = (
+        4
+        + 20 * np.sin(4 * 2 * np.pi * time.values)
+        + 16 * np.sin(6 * 2 * np.pi * time.values)
+        + 10 * np.sin(50 * 2 * np.pi * time.values)
+    )
+    field = DataTime(name="field", symbol="X", axes=[time], values=data, unit="m")
+
+    set_nufft(min_size=0)
+    try:
+        result_nufft = field.get_along(
+            "freqs=axis_data", axis_data={"freqs": np.arange(60)}
+        )
+    finally:
+        set_nufft(min_size=NUFFT_MIN_SIZE)
+
+    np.testing.assert_array_almost_equal(
+        np.abs(result_nufft["X"][[0, 4, 6, 50]]), [4, 20, 16, 10], decimal=2
+    )
@@ -0,0 +1,121 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, Data1D
+import SciDataTool.Functions.fft_functions as fft_functions
+from SciDataTool.Functions.nudft_functions import (
+    dft_tensordot,
+    is_czt_faster,
+    matrice_D,
+    matrice_E,
+)
+from SciDataTool.Functions.query_plan import get_query_plan
+
+
+@pytest.mark.validation
+def test_partial_fft_freqs():
+    """Check that a few harmonics requested on the FFT grid are computed without the
+    whole FFT and match it"""
+    time = np.linspace(0, 1, 1000, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    field = np.random.random((1000, 8))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+    args = ("freqs=[0,50,100,150]", "angle")
+    plan = get_query_plan(Field, args, [])
+    assert plan.partial_fft == {0: "dft"}
+    assert "dft[freqs]" in plan.get_stages()
+
+    result = Field.get_along(*args)
+    result_full = Field.get_along("freqs", "angle")
+    indices = [0, 50, 100, 150]
+    assert_array_almost_equal(result["freqs"], [0, 50, 100, 150])
+    assert_array_almost_equal(result["X"], result_full["X"][indices, :])
+
+    # Reference with numpy
+    values_FT = np.fft.rfft(Field.values, axis=0) * 2 / 1000
+    values_FT[0, :] /= 2
+    assert_array_almost_equal(result["X"], values_FT[indices, :])
+
+    # Indices and off-grid values are computed by DFT, whole spectrum is not
+    plan = get_query_plan(Field, ("freqs[1,2]", "angle"), [])
+    assert plan.partial_fft == {0: "dft"}
+    assert get_query_plan(Field, ("freqs", "angle"), []).partial_fft == {}
+    args = ("freqs=50.5", "angle")
+    assert get_query_plan(Field, args, {}).partial_fft == {0: "dft"}
+    result = Field.get_along(*args)
+    assert_array_almost_equal(result["freqs"], [50.5])
+    values_ref = 2 * np.tensordot(matrice_D(time, np.array([50.5])), field, 1) / 1000
+    assert_array_almost_equal(result["X"], values_ref[0])
+
+
+@pytest.mark.validation
+def test_partial_fft_wavenumber():
+    """Check the harmonics of a complex (centered) spectrum"""
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 4, endpoint=False))
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    field = np.random.random((4, 8))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+    args = ("time[0]", "wavenumber[0,1]")
+    assert get_query_plan(Field, args, []).partial_fft == {1: "dft"}
+    result = Field.get_along(*args)
+    result_full = Field.get_along("time[0]", "wavenumber")
+    assert_array_almost_equal(result["wavenumber"], result_full["wavenumber"][:2])
+    assert_array_almost_equal(result["X"], result_full["X"][:2])
+
+
+@pytest.mark.validation
+def test_czt():
+    """Check the chirp-z transform on a narrow uniform band against the direct DFT"""
+    time = np.linspace(0, 1, 500, endpoint=False)
+    freqs = np.linspace(40.3, 60.7, 200)
+    values = np.random.random((3, 500))
+    assert is_czt_faster(freqs, time)
+
+    dft = dft_tensordot(values, 1, freqs, time, -1)
+    dft_ref = np.tensordot(values, matrice_D(time, freqs), ((1,), (1,)))
+    assert_array_almost_equal(dft, dft_ref)
+
+    idft = dft_tensordot(dft, 1, time, freqs, 1)
+    idft_ref = np.tensordot(dft_ref, matrice_E(time, freqs), ((1,), (1,)))
+    assert_array_almost_equal(idft, idft_ref)
+
+
+@pytest.mark.validation
+def test_czt_get_along(monkeypatch):
+    """Check that the planner computes a narrow band off the FFT grid with the
+    chirp-z transform and a dense band of the grid with the whole FFT"""
+    time = np.linspace(0, 1, 4096, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    Angle = Data1D(name="angle", unit="rad", values=np.array([0, np.pi]))
+    field = np.random.random((4096, 2))
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+    calls = []
+
+    def czt_spy(*args):
+        calls.append(len(args[2]))
+        return czt_tensordot(*args)
+
+    czt_tensordot = fft_functions.czt_tensordot
+    monkeypatch.setattr(fft_functions, "czt_tensordot", czt_spy)
+    freqs = np.linspace(40.3, 60.7, 200)
+    args = ("freqs=axis_data", "angle")
+    plan = get_query_plan(Field, args, {"freqs": freqs})
+    assert plan.partial_fft == {0: "czt"}
+    assert "czt[freqs]" in plan.get_stages()
+    result = Field.get_along(*args, axis_data={"freqs": freqs})
+    assert calls == [200]
+    assert_array_almost_equal(result["freqs"], freqs)
+    values_ref = 2 * np.tensordot(matrice_D(time, freqs), field, 1) / 4096
+    assert_array_almost_equal(result["X"], values_ref)
+
+    # Band of the FFT grid: sliced from the whole FFT
+    freqs = np.arange(40, 240, dtype=float)
+    assert get_query_plan(Field, args, {"freqs": freqs}).partial_fft == {}
+    result = Field.get_along(*args, axis_data={"freqs": freqs})
+    assert calls == [200]
+    values_FT = np.fft.rfft(field, axis=0) * 2 / 4096
+    assert_array_almost_equal(result["X"], values_FT[40:240])
@@ -0,0 +1,140 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+from SciDataTool import DataTime, DataLinspace, Data1D, Norm_ref
+from SciDataTool.Functions.fft_backends import get_fft_backend, use_fft_backend
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize(
+    "args,method,kwargs,dtype,rtol",
+    [
+        (("freqs", "wavenumber", "z"), "get_along", {}, np.complex64, 1e-5),
+        (("freqs", "wavenumber=[0,8]", "z=sum"), "get_along", {}, np.complex64, 1e-5),
+        (("time", "angle", "z=[0.1,0.9]"), "get_along", {}, np.float32, 1e-6),
+        (("time=rms", "angle", "z"), "get_along", {}, np.float32, 1e-6),
+        (("time", "angle=integrate", "z"), "get_along", {}, np.float32, 1e-5),
+        (("freqs", "wavenumber", "z"), "get_magnitude_along", {}, np.float32, 1e-5),
+        (
+            ("freqs", "wavenumber"),
+            "get_magnitude_along",
+            {"unit": "dB"},
+            np.float32,
+            1e-5,
+        ),
+        (("freqs", "wavenumber"), "get_phase_along", {}, np.float32, 1e-2),
+    ],
+)
+def test_precision(args, method, kwargs, dtype, rtol):
+    """Check the dtype and the accuracy loss of single precision computations"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=64,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi, 32, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 5))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=np.random.random((64, 32, 5)),
+        unit="Pa",
+        normalizations={"ref": Norm_ref(ref=2e-5)},
+    )
+    result_double = getattr(Field, method)(*args, **kwargs)["X"]
+    result_single = getattr(Field, method)(*args, precision="single", **kwargs)["X"]
+
+    assert result_single.dtype == dtype
+    if method == "get_phase_along":
+        # Compare the phases on the unit circle (pi/-pi wrapping)
+        result_double = np.exp(1j * result_double)
+        result_single = np.exp(1j * result_single.astype(np.float64))
+    # Accuracy loss relative to the largest value of the field
+    error = np.max(np.abs(result_single - result_double))
+    assert error <= rtol * np.max(np.abs(result_double))
+
+
+@pytest.mark.validation
+def test_precision_policy():
+    """Check the precision policy of a DataND object"""
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 16, endpoint=False))
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 3))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=np.random.random((16, 8, 3)),
+        unit="m",
+    )
+    assert Field.get_along("freqs", "wavenumber", "z")["X"].dtype == np.complex128
+    Field.set_precision("single")
+    assert Field.get_along("freqs", "wavenumber", "z")["X"].dtype == np.complex64
+    # Precision of the call overrides the policy
+    result = Field.get_along("freqs", "wavenumber", "z", precision="double")
+    assert result["X"].dtype == np.complex128
+    Field.set_precision(None)
+    assert Field.get_along("time", "angle", "z")["X"].dtype == np.float64
+
+    with pytest.raises(ValueError):
+        Field.set_precision("half")
+
+
+@pytest.mark.validation
+def test_precision_float32_field():
+    """Check that the FFTs of a float32 field are in double precision by default"""
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 16, endpoint=False))
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 3))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=np.random.random((16, 8, 3)).astype(np.float32),
+        unit="m",
+    )
+    assert Field.get_along("freqs", "wavenumber", "z")["X"].dtype == np.complex128
+    result = Field.get_along("freqs", "wavenumber", "z", precision="single")
+    assert result["X"].dtype == np.complex64
+    for backend in ["numpy", "scipy"]:
+        with use_fft_backend(backend):
+            result = Field.get_along("freqs", "wavenumber", "z")
+            assert result["X"].dtype == np.complex128
+
+
+@pytest.mark.validation
+def test_precision_memory():
+    """Check that single precision halves the peak memory of the FFT with the
+    default backend"""
+    assert get_fft_backend().name == "numpy"
+    Time = DataLinspace(
+        name="time", unit="s", initial=0, final=1, number=1024, include_endpoint=False
+    )
+    angle = np.linspace(0, 2 * np.pi, 256, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((1024, 256)),
+        unit="m",
+    )
+    peaks = []
+    for precision in ["double", "single"]:
+        tracemalloc.start()
+        result = Field.get_along("freqs", "angle", precision=precision)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    assert peaks[1] <= 0.55 * peaks[0]
@@ -0,0 +1,136 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataFreq, DataLinspace, Data1D
+from SciDataTool.Functions.query_plan import (
+    get_query_plan,
+    clear_plan_cache,
+    plan_cache,
+)
+
+
+@pytest.mark.validation
+def test_query_plan_cache():
+    """Check that repeated requests reuse the compiled plan with identical results"""
+    clear_plan_cache()
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    field = np.random.random((16, 10))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=field,
+        unit="m",
+    )
+
+    result1 = Field.get_along("freqs", "wavenumber=[0,8]")
+    assert len(plan_cache) == 1
+    result2 = Field.get_along("freqs", "wavenumber=[0,8]")
+    assert len(plan_cache) == 1
+    assert_array_almost_equal(result1["X"], result2["X"])
+    assert_array_almost_equal(result1["wavenumber"], result2["wavenumber"])
+
+    # Returned axes must not share memory with the cached plan
+    result2["freqs"][:] = -1
+    result3 = Field.get_along("freqs", "wavenumber=[0,8]")
+    assert_array_almost_equal(result1["freqs"], result3["freqs"])
+
+    # Same request written in another order uses its own entry but same result
+    result4 = Field.get_along("wavenumber=[0,8]", "freqs")
+    assert_array_almost_equal(result1["X"], result4["X"])
+
+    # Modifying an axis invalidates the plan
+    plan = get_query_plan(Field, ("time", "angle"), [])
+    Field.axes[1].symmetries = {}
+    assert get_query_plan(Field, ("time", "angle"), []) is not plan
+    result5 = Field.get_along("time", "angle")
+    assert result5["X"].shape == (16, 10)
+
+
+@pytest.mark.validation
+def test_query_plan_axis_data():
+    """Check that axis_data is part of the plan identification"""
+    clear_plan_cache()
+    time = np.linspace(0, 1, 16, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    angle = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((16, 8)),
+        unit="m",
+    )
+
+    result1 = Field.get_along("time=axis_data", "angle", axis_data={"time": time[:4]})
+    result2 = Field.get_along("time=axis_data", "angle", axis_data={"time": time[:8]})
+    assert result1["X"].shape == (4, 8)
+    assert result2["X"].shape == (8, 8)
+    assert len(plan_cache) == 2
+
+
+@pytest.mark.validation
+def test_query_plan_pushdown():
+    """Check that slices along axes which are not transformed are done first"""
+    clear_plan_cache()
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries={"period": 4})
+    Z = Data1D(name="z", unit="m", values=np.linspace(0, 1, 5))
+    values = np.random.random((16, 10, 5))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle, Z],
+        values=values,
+        unit="m",
+    )
+    result = Field.get_along("freqs", "wavenumber", "z")
+    Freqs = Data1D(name="freqs", unit="Hz", values=result["freqs"])
+    Wavenumber = Data1D(name="wavenumber", unit="", values=result["wavenumber"])
+    Field_ft = DataFreq(
+        name="field",
+        symbol="X",
+        axes=[Freqs, Wavenumber, Z],
+        values=result["X"],
+        unit="m",
+    )
+
+    plan = get_query_plan(Field_ft, ("time", "angle", "z[2]"), [])
+    assert plan.pushdown == {2: "z"}
+    assert plan.get_stages()[:3] == ["slices[z]", "field", "ifft"]
+
+    result = Field_ft.get_along("time", "angle", "z[2]")
+    result_all = Field_ft.get_along("time", "angle", "z")
+    assert_array_almost_equal(result["X"], result_all["X"][:, :, 2])
+
+    # Axis not requested is sliced at its first value
+    result = Field_ft.get_along("time", "angle")
+    assert result["axes_dict_other"]["z"][0] == 0
+    assert_array_almost_equal(result["X"], result_all["X"][:, :, 0])
+
+
+if __name__ == "__main__":
+    test_query_plan_cache()
+    test_query_plan_axis_data()
+    test_query_plan_pushdown()
@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+from SciDataTool.Functions.result_cache import cache_dict
+
+
+@pytest.mark.validation
+def test_result_cache():
+    """Check the opt-in cache of get_along/get_magnitude_along/get_phase_along"""
+    f = 50
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1 / f,
+        number=16,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi, 20, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    field = np.random.random((16, 20))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=field,
+        unit="m",
+    )
+    reference = Field.get_magnitude_along("freqs", "wavenumber")["X"]
+
+    Field.enable_cache()
+    cache = cache_dict[id(Field)]
+    result1 = Field.get_magnitude_along("freqs", "wavenumber")
+    nb_results = len(cache.results)
+    result2 = Field.get_magnitude_along("freqs", "wavenumber")
+    assert len(cache.results) == nb_results
+    assert result2["X"] is result1["X"]
+    assert_array_almost_equal(result2["X"], reference)
+    # Cached arrays are read-only
+    with pytest.raises(ValueError):
+        result2["X"][0, 0] = 0
+
+    phase1 = Field.get_phase_along("freqs", "wavenumber")["X"]
+    phase2 = Field.get_phase_along("freqs", "wavenumber")["X"]
+    assert phase2 is phase1
+
+    # Setting values invalidates the cache
+    Field.values = 2 * Field.values
+    assert len(cache.results) == 0
+    result3 = Field.get_magnitude_along("freqs", "wavenumber")
+    assert_array_almost_equal(result3["X"], 2 * reference)
+
+    # Modifying an axis is detected as well
+    Field.axes[1].values = Field.axes[1].values + 1
+    result4 = Field.get_along("angle")
+    assert_array_almost_equal(result4["angle"], Field.axes[1].values)
+
+    Field.disable_cache()
+    assert id(Field) not in cache_dict
+    result5 = Field.get_magnitude_along("freqs", "wavenumber")
+    assert result5["X"].flags.writeable
+
+
+@pytest.mark.validation
+def test_result_cache_budget():
+    """Check the LRU eviction with the memory budget"""
+    # 160 bytes per time step, 2560 bytes for the whole field
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, 16))
+    Angle = Data1D(name="angle", unit="rad", values=np.linspace(0, 6, 20))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((16, 20)),
+        unit="m",
+    )
+    Field.enable_cache(max_bytes=2000)
+    cache = cache_dict[id(Field)]
+    Field.get_along("time[0]", "angle")
+    Field.get_along("time[1]", "angle")
+    Field.get_along("time", "angle")  # larger than the budget -> not stored
+    assert cache.nbytes <= 2000
+    assert len(cache.results) == 2
+    for i in range(2, 12):
+        Field.get_along("time[" + str(i) + "]", "angle")
+    assert cache.nbytes <= 2000
+    keys = [key[3] for key in cache.results.keys()]
+    assert ("time[11]", "angle") in keys
+    assert ("time[0]", "angle") not in keys
+
+
+if __name__ == "__main__":
+    test_result_cache()
+    test_result_cache_budget()
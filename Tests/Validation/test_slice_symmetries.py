@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("symmetries", [{"period": 4}, {"antiperiod": 4}])
+def test_slice_symmetries(symmetries):
+    """Check that slices among other periods match the rebuilt field"""
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1,
+        number=5,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 10, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries=symmetries)
+    field = np.random.random((5, 10))
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=field,
+        unit="m",
+    )
+    result_whole = Field.get_along("time", "angle")
+
+    for indices in ["angle[2:5]", "angle[8:13]", "angle[25]", "angle[3,19,33]"]:
+        result = Field.get_along("time", indices, is_squeeze=False)
+        angle_indices = np.array(
+            [np.argmin(abs(result_whole["angle"] - a)) for a in result["angle"]]
+        )
+        assert result["X"].shape == (5, angle_indices.size)
+        assert_array_almost_equal(result["X"], result_whole["X"][:, angle_indices])
+
+    # Symmetries of the axis are kept
+    assert Field.axes[1].symmetries == symmetries
+    assert_array_almost_equal(Field.get_along("time", "angle")["X"], result_whole["X"])
+
+
+if __name__ == "__main__":
+    test_slice_symmetries({"period": 4})
+    test_slice_symmetries({"antiperiod": 4})
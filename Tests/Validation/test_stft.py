@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from scipy.signal import get_window
+
+from SciDataTool import DataTime, DataFreq, DataLinspace, Data1D
+
+
+@pytest.mark.validation
+def test_stft():
+    """Check the spectrogram against the FFT of each windowed segment"""
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1,
+        number=4096,
+        include_endpoint=False,
+    )
+    angle = np.linspace(0, 2 * np.pi, 4, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    field = np.random.random((4096, 1)) * np.cos(angle)[None, :]
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+    Spectro = Field.stft(window="hann", nperseg=256, noverlap=128)
+    assert isinstance(Spectro, DataFreq)
+    assert [axis.name for axis in Spectro.axes] == ["time", "freqs", "angle"]
+    assert Spectro.values.shape == (31, 129, 4)
+
+    result = Spectro.get_along("time", "freqs", "angle")
+    assert_array_almost_equal(result["freqs"], np.arange(129) * 16)
+    assert_array_almost_equal(result["time"], (np.arange(31) * 128 + 128) / 4096)
+
+    # Reference: loop on the segments
+    window = get_window("hann", 256)
+    for i in [0, 15, 30]:
+        segment = Field.values[i * 128 : i * 128 + 256, :] * window[:, None]
+        values_FT = np.fft.rfft(segment, axis=0) * 2 / window.sum()
+        values_FT[0, :] /= 2
+        assert_array_almost_equal(result["X"][i], values_FT)
+
+
+@pytest.mark.validation
+def test_stft_amplitude():
+    """Check the amplitudes of the harmonics with a rectangular window"""
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1,
+        number=4096,
+        include_endpoint=False,
+    )
+    time = Time.get_values()
+    Angle = Data1D(name="angle", unit="rad", values=np.array([0, np.pi / 2]))
+    # 64 Hz on the first half, 128 Hz on the second half
+    signal = np.where(
+        time < 0.5,
+        3 * np.cos(2 * np.pi * 64 * time),
+        5 * np.cos(2 * np.pi * 128 * time),
+    )
+    field = signal[:, None] * np.array([1, 0.5])[None, :]
+    Field = DataTime(name="field", symbol="X", axes=[Time, Angle], values=field)
+    Spectro = Field.stft(window="boxcar", nperseg=256, noverlap=0)
+    assert Spectro.values.shape == (16, 129, 2)
+    magnitude = Spectro.get_magnitude_along("time", "freqs", "angle[0]")["X"]
+    assert_array_almost_equal(magnitude[0, 4], 3)
+    assert_array_almost_equal(magnitude[-1, 8], 5)
+    assert_array_almost_equal(magnitude[0, 8], 0)
+
+    with pytest.raises(ValueError):
+        Field.stft(nperseg=256, noverlap=256)
+    with pytest.raises(ValueError):
+        Field.stft(window=np.ones(10), nperseg=256)
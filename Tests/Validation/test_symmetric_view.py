@@ -0,0 +1,136 @@
+import pytest
+import numpy as np
+from numpy.lib import NumpyVersion
+from numpy.testing import assert_array_almost_equal
+
+from SciDataTool import DataTime, DataLinspace, Data1D
+from SciDataTool.Functions.symmetries import (
+    SymmetricView,
+    rebuild_symmetries,
+    take_symmetries,
+)
+
+
+def tile_symmetries(values, axis_index, symmetries):
+    """Reference reconstruction with tile/concatenate"""
+    if "period" in symmetries:
+        reps = [1] * values.ndim
+        reps[axis_index] = symmetries["period"]
+        return np.tile(values, reps)
+    else:
+        blocks = [values * (-1) ** k for k in range(symmetries["antiperiod"])]
+        return np.concatenate(blocks, axis=axis_index)
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize(
+    "symmetries", [{"period": 3}, {"antiperiod": 2}, {"antiperiod": 5}]
+)
+def test_symmetric_view(symmetries):
+    """Check the lazy view against the tiled field"""
+    values = np.random.random((4, 6, 3))
+    ref = tile_symmetries(values, 1, symmetries)
+
+    view = SymmetricView(values, 1, symmetries)
+    assert view.shape == ref.shape
+    assert_array_almost_equal(view.materialize(), ref)
+    assert_array_almost_equal(np.asarray(view), ref)
+    assert_array_almost_equal(rebuild_symmetries(values, 1, symmetries), ref)
+
+    # Slicing along the symmetric axis and along other axes
+    indices = [0, 7, 11, 5]
+    assert_array_almost_equal(view.take(indices, axis=1), ref[:, indices, :])
+    assert_array_almost_equal(
+        take_symmetries(values, indices, 1, symmetries), ref[:, indices, :]
+    )
+    view2 = np.take(view, [2, 0], axis=2)
+    assert isinstance(view2, SymmetricView)
+    assert_array_almost_equal(view2.materialize(), ref[:, :, [2, 0]])
+
+    # Reduction along another axis keeps the view
+    view3 = view.apply_along(np.sum, 0, 0)
+    assert isinstance(view3, SymmetricView) and view3.axis_index == 0
+    assert_array_almost_equal(view3.materialize(), ref.sum(axis=0))
+
+    # Nonlinear reduction on antiperiodic view is materialized
+    result = view.apply_along(np.max, 2, 2, is_linear=False)
+    assert_array_almost_equal(np.asarray(result), ref.max(axis=2))
+    assert_array_almost_equal(view.abs().materialize(), np.abs(ref))
+
+
+@pytest.mark.validation
+def test_symmetric_view_array():
+    """Check the copy and dtype keywords of the array protocol"""
+    values = np.random.random((4, 6))
+    view = SymmetricView(values, 1, {"antiperiod": 2})
+    ref = tile_symmetries(values, 1, {"antiperiod": 2})
+    result = view.__array__(dtype=np.float32, copy=True)
+    assert result.dtype == np.float32
+    assert_array_almost_equal(result, ref, decimal=6)
+    with pytest.raises(ValueError):
+        view.__array__(copy=False)
+    # A single period is returned without copy
+    view = SymmetricView(values, 1, {"period": 1})
+    assert view.__array__(copy=False) is values
+    assert not np.shares_memory(view.__array__(copy=True), values)
+    with pytest.raises(ValueError):
+        view.__array__(dtype=np.float32, copy=False)
+    if NumpyVersion(np.__version__) >= "2.0.0":
+        assert np.asarray(view, copy=False) is values
+        with pytest.raises(ValueError):
+            np.asarray(SymmetricView(values, 1, {"period": 3}), copy=False)
+    else:
+        assert np.array(view, copy=False) is values
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("symmetries", [{"period": 4}, {"antiperiod": 4}])
+def test_get_along_symmetric_view(symmetries):
+    """Check get_along results with lazy reconstruction of the symmetries"""
+    Time = DataLinspace(
+        name="time",
+        unit="s",
+        initial=0,
+        final=1,
+        number=8,
+        include_endpoint=False,
+        symmetries={"period": 2},
+    )
+    angle = np.linspace(0, 2 * np.pi / 4, 6, endpoint=False)
+    Angle = Data1D(name="angle", unit="rad", values=angle, symmetries=symmetries)
+    Field = DataTime(
+        name="field",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.random((8, 6)),
+        unit="m",
+    )
+    ref = tile_symmetries(
+        tile_symmetries(Field.values, 0, {"period": 2}), 1, symmetries
+    )
+    time = Field.axes[0].get_values(is_oneperiod=False)
+
+    result = Field.get_along("time", "angle")
+    assert isinstance(result["X"], np.ndarray)
+    assert_array_almost_equal(result["X"], ref)
+    assert_array_almost_equal(
+        Field.get_along("time=sum", "angle")["X"], ref.sum(axis=0)
+    )
+    assert_array_almost_equal(
+        Field.get_along("time=max", "angle")["X"], ref.max(axis=0)
+    )
+    assert_array_almost_equal(
+        Field.get_along("time", "angle=max")["X"], ref.max(axis=1)
+    )
+    assert_array_almost_equal(
+        Field.get_magnitude_along("time", "angle")["X"], np.abs(ref)
+    )
+    result = Field.get_along(
+        "time=axis_data", "angle", axis_data={"time": time[1:5] + 0.01}
+    )
+    assert result["X"].shape == (4, ref.shape[1])
+
+
+if __name__ == "__main__":
+    test_symmetric_view({"antiperiod": 5})
+    test_get_along_symmetric_view({"antiperiod": 4})
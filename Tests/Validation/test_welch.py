@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from scipy.signal import welch as scipy_welch
+
+from SciDataTool import DataTime, DataFreq, DataLinspace, Data1D, Norm_ref
+import SciDataTool.Methods.DataTime.welch as welch_module
+
+
+@pytest.mark.validation
+@pytest.mark.parametrize("scaling", ["density", "spectrum"])
+def test_welch(scaling):
+    """Check the averaged spectrum against scipy.signal.welch"""
+    Time = DataLinspace(
+        name="time", unit="s", initial=0, final=2, number=8192, include_endpoint=False
+    )
+    time = Time.get_values()
+    Angle = Data1D(
+        name="angle", unit="rad", values=np.linspace(0, 2 * np.pi, 3, endpoint=False)
+    )
+    noise = np.random.default_rng(0).normal(size=(8192, 3))
+    Field = DataTime(
+        name="field",
+        unit="Pa",
+        symbol="X",
+        axes=[Time, Angle],
+        values=2 * np.cos(2 * np.pi * 128 * time)[:, None] + noise,
+        normalizations={"ref": Norm_ref(ref=2e-5)},
+    )
+    PSD = Field.welch(window="hann", nperseg=512, scaling=scaling)
+    assert isinstance(PSD, DataFreq)
+    assert [axis.name for axis in PSD.axes] == ["freqs", "angle"]
+    freqs_ref, values_ref = scipy_welch(
+        Field.values, fs=4096, nperseg=512, scaling=scaling, axis=0
+    )
+    result = PSD.get_along("freqs", "angle")
+    assert_array_almost_equal(result["freqs"], freqs_ref)
+    assert_array_almost_equal(result["X"], values_ref)
+    if scaling == "density":
+        assert PSD.unit == "Pa^2/Hz"
+    else:
+        assert PSD.unit == "Pa^2"
+    assert PSD.normalizations["ref"].ref == pytest.approx(4e-10)
+
+    ASD = Field.welch(nperseg=512, scaling=scaling, is_asd=True)
+    assert_array_almost_equal(ASD.values, np.sqrt(values_ref))
+    assert ASD.normalizations["ref"].ref == 2e-5
+
+
+@pytest.mark.validation
+def test_welch_streaming(tmp_path, monkeypatch):
+    """Check that a memmap field read by small chunks gives the in-memory spectrum"""
+    Time = DataLinspace(
+        name="time", unit="s", initial=0, final=2, number=8192, include_endpoint=False
+    )
+    Angle = Data1D(
+        name="angle", unit="rad", values=np.linspace(0, 2 * np.pi, 3, endpoint=False)
+    )
+    Field = DataTime(
+        name="field",
+        unit="Pa",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.random.default_rng(0).normal(size=(8192, 3)),
+    )
+    reference = Field.welch(nperseg=256, noverlap=64).values
+
+    path = tmp_path / "field.dat"
+    values = np.memmap(path, dtype=float, mode="w+", shape=(8192, 3))
+    values[:] = Field.values
+    values.flush()
+    Field_lazy = DataTime(
+        name="field",
+        unit="Pa",
+        symbol="X",
+        axes=[Time, Angle],
+        values=np.memmap(path, dtype=float, mode="r", shape=(8192, 3)),
+    )
+    # Three segments (and a hyperslab of the memmap) per chunk
+    monkeypatch.setattr(welch_module, "WELCH_CHUNK_MAX_BYTES", 3 * 16 * 256 * 3)
+    PSD = Field_lazy.welch(nperseg=256, noverlap=64)
+    assert_array_almost_equal(PSD.values, reference)
+
+    with pytest.raises(ValueError):
+        Field.welch(nperseg=256, noverlap=256)
+    with pytest.raises(ValueError):
+        Field.welch(scaling="psd")
+
+
+@pytest.mark.validation
+def test_welch_complex():
+    """Check the two-sided averaged spectrum of a complex field"""
+    Time = DataLinspace(
+        name="time", unit="s", initial=0, final=1, number=4096, include_endpoint=False
+    )
+    time = Time.get_values()
+    Angle = Data1D(name="angle", unit="rad", values=np.array([0, np.pi]))
+    rng = np.random.default_rng(0)
+    noise = rng.normal(size=(4096, 2)) + 1j * rng.normal(size=(4096, 2))
+    values = 2 * np.exp(2j * np.pi * 128 * time)[:, None] + noise
+    Field = DataTime(
+        name="field",
+        unit="Pa",
+        symbol="X",
+        axes=[Time, Angle],
+        values=values,
+        is_real=False,
+    )
+    PSD = Field.welch(nperseg=256)
+    assert not PSD.is_real
+    freqs_ref, values_ref = scipy_welch(
+        values, fs=4096, nperseg=256, axis=0, return_onesided=False
+    )
+    result = PSD.get_along("freqs", "angle")
+    assert_array_almost_equal(result["freqs"], np.fft.fftshift(freqs_ref))
+    assert_array_almost_equal(result["X"], np.fft.fftshift(values_ref, axes=0))